@@ -1,4 +1,5 @@
 
 from game import main
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
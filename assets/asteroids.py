@@ -1,38 +1,71 @@
 # assets/asteroids.py
 import pygame, random, math
-from assets.config import wrap_position, SCREEN_W, SCREEN_H
+from itertools import count
+from assets.config import wrap_position, wrap_delta, render_position, per_step
+from assets.text_cache import GLYPHS
+from assets.sprites import SPRITES, blit_wrapped
+from assets.pool import Pool
 
 SIZE_HP = {3: 4, 2: 3, 1: 2}
 SIZE_RADIUS = {3: 40, 2: 25, 1: 15}
 SIZE_COLOR = {3: (120,120,120), 2: (170,170,170), 1: (220,220,220)}
+ASTEROID_SPEED = (per_step(60), per_step(180))  # spawn speeds, pixels a step: 60 to 180 a second
+
+_uids = count(1)
 
 class Asteroid:
-    def __init__(self, pos, size=3, letter=None):
-        self.pos = pygame.Vector2(pos)
-        ang = random.uniform(0, 360)
-        speed = random.uniform(1.0, 3.0)
-        self.vel = pygame.Vector2(speed, 0).rotate(ang)
+    __slots__ = ('rng', 'pos', 'prev', 'vel', 'size', 'hp', 'letter', 'uid')
+
+    def __init__(self, pos, size=3, letter=None, rng=random):
+        self.pos = pygame.Vector2()
+        self.prev = pygame.Vector2()  # pos before the last step, for drawing between steps
+        self.vel = pygame.Vector2()
+        self.reset(pos, size, letter, rng)
+
+    def reset(self, pos, size=3, letter=None, rng=random):
+        """Re-initialise in place, for reuse from POOL."""
+        self.rng = rng  # seeded random.Random for reproducible runs; module random otherwise
+        self.pos.update(pos)
+        self.prev.update(pos)  # not moved yet: drawn where it is until its first step
+        ang = rng.uniform(0, 360)
+        speed = rng.uniform(*ASTEROID_SPEED)
+        self.vel.update(speed, 0)
+        self.vel.rotate_ip(ang)
         self.size = size
         self.hp = SIZE_HP[self.size]
-        self.letter = letter or chr(random.randint(65, 90))
+        self.letter = letter or chr(rng.randint(65, 90))
+        self.uid = next(_uids)  # a new one each time the pool hands it out; names it on the network
 
     @property
     def radius(self):
         return SIZE_RADIUS[self.size]
 
     def update(self):
+        self.prev.update(self.pos)
         self.pos += self.vel
         self.pos.xy = wrap_position(self.pos)
 
-    def draw(self, surf, font=None):
-        pygame.draw.circle(surf, SIZE_COLOR[self.size], (int(self.pos.x), int(self.pos.y)), self.radius, 2)
+    def draw(self, surf, font=None, alpha=1.0):
+        """Draw, wrapping across screen edges; returns the rects touched.
+
+        alpha < 1 draws it that far between its previous and current step.
+        """
+        x, y = self.pos if alpha >= 1.0 else render_position(self.pos, self.prev, alpha)
+        s = SPRITES.scale
+        if s != 1:
+            x, y = x * s, y * s
+        sprite, offset = SPRITES.asteroid(self.size)
+        rects = blit_wrapped(surf, sprite, int(x) - offset, int(y) - offset)
         if font:
-            txt = font.render(self.letter, True, (255,255,0))
-            rect = txt.get_rect(center=(self.pos.x, self.pos.y))
-            surf.blit(txt, rect)
+            txt = GLYPHS.get(font, self.letter, (255,255,0))
+            rect = txt.get_rect(center=(x, y))
+            rects += blit_wrapped(surf, txt, rect.x, rect.y)
+        return rects
 
     def collide_with_point(self, p):
-        return self.pos.distance_to(p) <= self.radius
+        # measured across the screen edge too, so wrapped hits still count
+        dx, dy = wrap_delta(self.pos, p)
+        return dx*dx + dy*dy <= self.radius*self.radius
 
     def split(self):
         """Return list of child asteroids if any (for size > 1)."""
@@ -40,7 +73,12 @@ class Asteroid:
             return []
         children = []
         for _ in range(2):
-            child = Asteroid(self.pos, self.size-1, self.letter)
-            child.vel = self.vel.rotate(random.uniform(-35, 35)) * 1.2
+            child = POOL.acquire(self.pos, self.size-1, self.letter, self.rng)
+            child.vel.update(self.vel)
+            child.vel.rotate_ip(self.rng.uniform(-35, 35))
+            child.vel *= 1.2
             children.append(child)
         return children
+
+
+POOL = Pool(Asteroid)
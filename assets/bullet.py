@@ -1,18 +1,31 @@
 # assets/bullet.py
 import pygame
-from assets.config import wrap_position, SCREEN_W, SCREEN_H
+from assets.config import wrap_position, render_position, per_step, steps
+from assets.pool import Pool
+from assets.sprites import SPRITES
 
-BULLET_SPEED = 12
-BULLET_LIFETIME = 60  # frames
+BULLET_SPEED = per_step(720)  # pixels a step: 720 a second
+BULLET_LIFETIME = steps(1.0)  # steps: one second
 
 class Bullet:
+    __slots__ = ('pos', 'prev', 'vel', 'age')
+
     def __init__(self, pos, angle):
-        self.pos = pygame.Vector2(pos)
-        rad = angle * 3.14159265 / 180.0
-        self.vel = pygame.Vector2(0, -BULLET_SPEED).rotate(angle)
+        self.pos = pygame.Vector2()
+        self.prev = pygame.Vector2()  # pos before the last step, for drawing between steps
+        self.vel = pygame.Vector2()
+        self.reset(pos, angle)
+
+    def reset(self, pos, angle):
+        """Re-initialise in place, for reuse from POOL."""
+        self.pos.update(pos)
+        self.prev.update(pos)
+        self.vel.update(0, -BULLET_SPEED)
+        self.vel.rotate_ip(angle)
         self.age = 0
 
     def update(self):
+        self.prev.update(self.pos)
         self.pos += self.vel
         self.pos.xy = wrap_position(self.pos)
         self.age += 1
@@ -20,5 +33,10 @@ class Bullet:
     def alive(self):
         return self.age < BULLET_LIFETIME
 
-    def draw(self, surf):
-        pygame.draw.rect(surf, (255, 255, 255), (*self.pos, 2, 2))
+    def draw(self, surf, alpha=1.0):
+        x, y = self.pos if alpha >= 1.0 else render_position(self.pos, self.prev, alpha)
+        s = SPRITES.scale
+        return pygame.draw.rect(surf, (255, 255, 255), (x * s, y * s, 2, 2))
+
+
+POOL = Pool(Bullet)
@@ -0,0 +1,46 @@
+# assets/canvas.py
+import pygame
+from assets.config import SCREEN_W, SCREEN_H, WINDOW_SCALE, RENDER_SCALE
+from assets.sprites import SPRITES
+
+class Canvas:
+    """The surface a frame is drawn on, and its way to the window.
+
+    Drawing happens at scale pixels per screen unit: the simulation and
+    every position stay in world coordinates, and SPRITES.scale (set here)
+    converts them as things are drawn. When that resolution matches the
+    window, surface is the window itself; otherwise it is an offscreen
+    surface that present() stretches over the window with one
+    pygame.transform.scale (nearest neighbour) a frame.
+    """
+    def __init__(self, window, scale=1.0):
+        self.window = window
+        self.scale = scale
+        size = (round(SCREEN_W * scale), round(SCREEN_H * scale))
+        if size == window.get_size():
+            self.surface = window
+        else:
+            self.surface = pygame.Surface(size).convert()
+        SPRITES.set_scale(scale)
+
+    @property
+    def scaled(self):
+        """Whether frames go through the offscreen surface."""
+        return self.surface is not self.window
+
+    def px(self, n):
+        """n screen units (a font size, say) in drawing pixels."""
+        return max(1, round(n * self.scale))
+
+    def present(self):
+        if self.surface is not self.window:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+        pygame.display.flip()
+
+
+def open_window(caption, window_scale=WINDOW_SCALE, render_scale=RENDER_SCALE):
+    """Open the game window, WINDOW_SCALE screens in size, and return the
+    Canvas to draw on, at RENDER_SCALE of the window's resolution."""
+    window = pygame.display.set_mode((round(SCREEN_W * window_scale), round(SCREEN_H * window_scale)))
+    pygame.display.set_caption(caption)
+    return Canvas(window, window_scale * render_scale)
@@ -1,36 +1,148 @@
 # assets/collision.py
 import pygame
-from assets.asteroids import Asteroid
+from assets.asteroids import Asteroid, POOL as ASTEROID_POOL
+from assets.bullet import POOL as BULLET_POOL
+from assets.spatial import SpatialHash
 
-def bullets_vs_asteroids(ship, asteroids):
-    """Handle bullet collisions. Returns (collected_letters, new_asteroids)."""
+def _grid_for(asteroids, grid):
+    if grid is None:
+        grid = SpatialHash()
+        grid.rebuild(asteroids)
+    return grid
+
+def bullets_vs_asteroids(ship, asteroids, grid=None, particles=None):
+    """Handle bullet collisions. Returns (collected_letters, new_asteroids).
+
+    asteroids is compacted in place and returned as new_asteroids, with any
+    split children appended. grid is the frame's SpatialHash over asteroids;
+    it is kept in step with the asteroids destroyed or split here so later
+    passes can reuse it. Spent bullets and asteroids go back to their pools.
+    Destroyed asteroids explode in particles, a ParticleSystem, if given.
+    A ship with a gun (BulletBuffer) has its bullets matched by gun.hits().
+    """
+    store = getattr(ship, 'store', None)
+    if store is not None:
+        return _store_bullets_vs_asteroids(ship, asteroids, store, particles)
     collected = []
-    new_asts = []
-    remaining_asteroids = []
-    for ast in asteroids:
-        hit = False
-        for b in list(ship.bullets):
-            if ast.collide_with_point(b.pos):
-                ship.bullets.remove(b)
-                ast.hp -= 1
-                if ast.hp <= 0:
-                    if ast.size == 1:
-                        collected.append(ast.letter)
-                    else:
-                        new_asts.extend(ast.split())
-                hit = True
+    gun = getattr(ship, 'gun', None)
+    if gun is not None:
+        # every shot went into the buffer; its hit tests are vectorized
+        targets = gun.hits(asteroids)
+        for target in targets:
+            _hit(target, asteroids, grid, particles, collected)
+        if any(target.hp <= 0 for target in targets):
+            _compact(asteroids, ASTEROID_POOL)
+        return collected, asteroids
+    bullets = ship.bullets
+    if not bullets:
+        return collected, asteroids
+    grid = _grid_for(asteroids, grid)
+    hit = set()   # each asteroid takes at most one bullet per frame
+    died = False
+    kept = 0
+    for b in bullets:
+        target = None
+        for ast in grid.query(b.pos):
+            if ast not in hit and ast.collide_with_point(b.pos):
+                target = ast
                 break
-        if not hit or (hit and (ast.hp > 0 and ast.size >= 1)):
-            remaining_asteroids.append(ast)
-    remaining_asteroids.extend(new_asts)
-    return collected, remaining_asteroids
+        if target is None:
+            bullets[kept] = b
+            kept += 1
+            continue
+        BULLET_POOL.release(b)
+        hit.add(target)
+        # children join the list (and the fight) next frame
+        hit.update(_hit(target, asteroids, grid, particles, collected))
+        died = died or target.hp <= 0
+    del bullets[kept:]
+    if died:
+        _compact(asteroids, ASTEROID_POOL)
+    return collected, asteroids
+
+def _hit(target, asteroids, grid, particles, collected):
+    """One bullet's damage to target. A destroyed one leaves grid, explodes
+    and adds its letter to collected, or splits; returns the children, which
+    are already appended to asteroids and in grid."""
+    target.hp -= 1
+    if target.hp > 0:
+        return []
+    if grid is not None:
+        grid.remove(target)
+    if particles is not None:
+        particles.explode(target.pos, target.vel, target.size)
+    if target.size == 1:
+        collected.append(target.letter)
+        return []
+    children = target.split()
+    for child in children:
+        if grid is not None:
+            grid.insert(child)
+        asteroids.append(child)
+    return children
+
+def _compact(asteroids, pool=None):
+    """Drop destroyed asteroids (hp <= 0) in place, recycling them into pool."""
+    kept = 0
+    for a in asteroids:
+        if a.hp > 0:
+            asteroids[kept] = a
+            kept += 1
+        elif pool is not None:
+            pool.release(a)
+    del asteroids[kept:]
+
+def _store_bullets_vs_asteroids(ship, asteroids, store, particles=None):
+    """bullets_vs_asteroids for EntityStore views, with the hit tests vectorized."""
+    collected = []
+    bullet_slots, asteroid_slots = store.bullet_hits()
+    if not len(bullet_slots):
+        return collected, asteroids
+    for slot in bullet_slots:
+        store.free(slot)
+    bullets = ship.bullets
+    kept = 0
+    for b in bullets:
+        if b.alive():
+            bullets[kept] = b
+            kept += 1
+    del bullets[kept:]
+
+    died = False
+    for slot in asteroid_slots:
+        ast = store.views[slot]
+        ast.hp -= 1
+        if ast.hp <= 0:
+            died = True
+            if particles is not None:
+                particles.explode(ast.pos, ast.vel, ast.size)
+            if ast.size == 1:
+                collected.append(ast.letter)
+            else:
+                asteroids.extend(ast.split())
+    if died:
+        # views read hp from their row, so compact before freeing the slots
+        dead = [a.slot for a in asteroids if a.hp <= 0]
+        _compact(asteroids)
+        for slot in dead:
+            store.free(slot)
+    return collected, asteroids
 
-def ship_vs_asteroids(ship, asteroids):
+def ship_vs_asteroids(ship, asteroids, grid=None):
     """Return lives_delta and asteroids (no removal on contact)."""
     lives_delta = 0
     # Only check collisions if ship is not invincible
     if not ship.is_invincible():
-        for ast in asteroids:
+        # a single point only needs the grid if one is already built
+        store = getattr(ship, 'store', None)
+        if store is not None:
+            nearest = store.asteroid_at(ship.pos)
+            candidates = [nearest] if nearest is not None else []
+        elif grid is not None:
+            candidates = grid.query(ship.pos)
+        else:
+            candidates = asteroids
+        for ast in candidates:
             if ast.collide_with_point(ship.pos):
                 lives_delta -= 1
                 # Trigger invincibility when damage is taken
@@ -38,11 +150,12 @@ def ship_vs_asteroids(ship, asteroids):
                 break  # Only take one hit at a time
     return lives_delta
 
-def asteroids_vs_asteroids(asteroids):
+def asteroids_vs_asteroids(asteroids, grid=None):
     """Return lives_delta and asteroids (no removal on contact)."""
+    grid = _grid_for(asteroids, grid)
     for ast in asteroids:
-        for ast2 in asteroids:
-            if ast != ast2 and ast.collide_with_point(ast2.pos):
+        for ast2 in grid.query(ast.pos):
+            if ast2 is not ast and ast.collide_with_point(ast2.pos):
                 ast.vel = ast.vel.reflect(ast2.vel)
                 ast2.vel = ast2.vel.reflect(ast.vel)
-    return asteroids
\ No newline at end of file
+    return asteroids
@@ -1,8 +1,60 @@
 # assets/config.py
 SCREEN_W, SCREEN_H = 800, 600
+SWARM_MODE = False     # A world WORLD_SCALE screens across, a camera on the ship, SWARM_ASTEROIDS asteroids
+WORLD_SCALE = 8 if SWARM_MODE else 1
+WORLD_W, WORLD_H = SCREEN_W * WORLD_SCALE, SCREEN_H * WORLD_SCALE  # everything wraps at these
+SWARM_ASTEROIDS = 5000
 STARTING_LIVES = 5
+SIM_RATE = 60          # simulation steps per second; speeds and timers are set per second (see per_step())
+MAX_CATCHUP_STEPS = 5  # most simulation steps per drawn frame; beyond that the game slows down
+DISPLAY_FPS = 60       # frames drawn per second at most (30, 60, 144...); 0 for no cap
 SOUND_ENABLED = False  # Set to False to disable all sound
+ENTITY_STORE = False   # Keep asteroids and bullets in NumPy arrays (assets/world.py)
+DIRTY_RECTS = False    # Redraw and present only the changed parts of the screen
+WINDOW_SCALE = 1       # window size in screens, e.g. 3.6 for 2880x2160 on a 4K display
+RENDER_SCALE = 1.0     # draw at this share of the window's resolution (0.5, 0.75...) and scale up (assets/canvas.py)
+WEAPON = None          # 'rapid' or 'spread': fast fire from a bullet buffer (assets/gun.py, needs NumPy)
+PARTICLES = True       # Explosion and exhaust particles (assets/particles.py, needs NumPy)
+ADAPTIVE_QUALITY = True  # Drop drawing detail while frames run over budget (assets/governor.py)
+PROFILE_STARTUP = False  # Print import and init timings up to the first frame (assets/startup.py)
+FRAME_PROFILE_OUT = None  # e.g. 'frames.jsonl' or 'trace.json' (Chrome trace): stream per-frame timings
+RECORD_INPUT = None    # e.g. 'session.rec': save each session's seed and keys for replay.py
+PILOT = None           # 'assist': hold fire to turn toward needed letters; 'autopilot': the ship flies itself
+WORD_LIST = None       # e.g. 'assets/words.txt': a new target word every round from this list (words.py)
+FONT_FILE = None       # TTF for all game text; None uses the font bundled with pygame
 
 def wrap_position(pos):
-    """Keeps a point inside the screen (wrap-around)."""
-    return (pos[0] % SCREEN_W, pos[1] % SCREEN_H)
+    """Keeps a point inside the world (wrap-around)."""
+    return (pos[0] % WORLD_W, pos[1] % WORLD_H)
+
+def render_position(pos, prev, alpha):
+    """Where to draw something that moved from prev to pos on its last step,
+    alpha (0..1) of the way along, the short way round and wrapped into the world."""
+    dx, dy = wrap_delta(prev, pos)
+    back = 1.0 - alpha
+    return ((pos[0] - dx * back) % WORLD_W, (pos[1] - dy * back) % WORLD_H)
+
+def wrap_delta(a, b):
+    """Shortest (dx, dy) from a to b, going across the world edge if that is closer."""
+    dx = (b[0] - a[0] + WORLD_W / 2) % WORLD_W - WORLD_W / 2
+    dy = (b[1] - a[1] + WORLD_H / 2) % WORLD_H - WORLD_H / 2
+    return dx, dy
+
+# Tunings are written per second and converted here, once, to the per-step
+# amounts the simulation uses, so changing SIM_RATE keeps the game's speed.
+
+def per_step(per_second):
+    """A speed (pixels or degrees a second) as the amount per simulation step."""
+    return per_second / SIM_RATE
+
+def per_step_squared(per_second_squared):
+    """An acceleration (pixels a second, per second) as the change per step of a per-step speed."""
+    return per_second_squared / (SIM_RATE * SIM_RATE)
+
+def kept_per_step(kept, seconds=1.0):
+    """A decay that keeps this share of a speed every `seconds`, as the share kept per step."""
+    return kept ** (1.0 / (seconds * SIM_RATE))
+
+def steps(seconds):
+    """A duration as a whole number of simulation steps, at least one."""
+    return max(1, round(seconds * SIM_RATE))
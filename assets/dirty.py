@@ -0,0 +1,42 @@
+# assets/dirty.py
+import pygame
+
+# Past this share of the screen one full update beats a long rect list.
+FULL_UPDATE_AREA = 0.5
+MAX_RECTS = 400
+
+class DirtyRenderer:
+    """Erase and present only the parts of the screen that changed.
+
+    Each frame: erase() clears what was drawn last frame, the caller draws
+    and collects the rects it touched, and present(rects) pushes last
+    frame's and this frame's rects to the display with display.update().
+    """
+    def __init__(self, screen, background=(0, 0, 0)):
+        self.screen = screen
+        self.background = background
+        self.area = screen.get_width() * screen.get_height()
+        self.previous = []
+        self.full = True  # nothing is on screen yet
+
+    def invalidate(self):
+        """Redraw and present the whole screen next frame."""
+        self.full = True
+
+    def erase(self):
+        if self.full:
+            self.screen.fill(self.background)
+        else:
+            fill = self.screen.fill
+            for rect in self.previous:
+                fill(self.background, rect)
+
+    def present(self, rects):
+        rects = [r for r in rects if r]  # blits clipped off screen come back empty
+        dirty = self.previous + rects
+        self.previous = rects
+        if self.full or len(dirty) > MAX_RECTS or sum(r.w * r.h for r in dirty) > self.area * FULL_UPDATE_AREA:
+            self.full = False
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
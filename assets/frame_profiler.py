@@ -0,0 +1,133 @@
+# assets/frame_profiler.py
+import json
+from collections import deque
+from pathlib import Path
+from time import perf_counter
+
+import pygame
+
+WINDOW = 600           # frames kept for the rolling percentiles (10 s at 60 FPS)
+OVERLAY_REFRESH = 30   # frames between overlay redraws; the numbers are unreadable any faster
+OVERLAY_COLOR = (120, 255, 120)
+
+class FrameProfiler:
+    """Per-phase frame timings with rolling p50/p95/p99.
+
+    The game loop calls start_frame(), then mark(name) at the end of each
+    phase (the phase is the time since the previous mark), then end_frame()
+    with the entity counts. Code that is not profiled holds None instead of
+    a profiler, so switched off it costs one `is not None` test per phase.
+
+    out, if given, streams every frame to a file: one JSON object per line
+    for .jsonl, otherwise a Chrome trace (chrome://tracing, Perfetto).
+    """
+    def __init__(self, out=None, window=WINDOW):
+        self.window = window
+        self.samples = {}  # phase -> deque of ms, in first-seen order
+        self.frame_ms = deque(maxlen=window)
+        self.counts = {}
+        self.frame = 0
+        self.phases = []   # this frame's (name, start, end)
+        self.frame_start = self.last = perf_counter()
+        self.origin = self.frame_start
+        self.out = None
+        self.trace = False
+        self._overlay = None
+        if out is not None:
+            self.open(out)
+
+    def open(self, path):
+        path = Path(path)
+        self.trace = path.suffix != '.jsonl'
+        self.out = open(path, 'w')
+        if self.trace:
+            # the trace format allows the closing ']' to be missing if we crash
+            self.out.write('[\n')
+
+    def close(self):
+        if self.out is not None:
+            if self.trace:
+                self.out.write(json.dumps({'name': 'process_name', 'ph': 'M', 'pid': 1,
+                                           'args': {'name': 'asteroids'}}) + '\n]\n')
+            self.out.close()
+            self.out = None
+
+    def start_frame(self):
+        self.frame_start = self.last = perf_counter()
+        self.phases.clear()
+
+    def mark(self, name):
+        """End the phase called name here; it began at the previous mark."""
+        now = perf_counter()
+        self.phases.append((name, self.last, now))
+        self.last = now
+
+    def end_frame(self, **counts):
+        samples = self.samples
+        for name, start, end in self.phases:
+            ms = (end - start) * 1000
+            bucket = samples.get(name)
+            if bucket is None:
+                bucket = samples[name] = deque(maxlen=self.window)
+            bucket.append(ms)
+        self.frame_ms.append((self.last - self.frame_start) * 1000)
+        self.counts = counts
+        if self.out is not None:
+            self._write(counts)
+        self.frame += 1
+
+    def _write(self, counts):
+        if not self.trace:
+            self.out.write(json.dumps({
+                'frame': self.frame,
+                'ms': round((self.last - self.frame_start) * 1000, 4),
+                'phases': {name: round((end - start) * 1000, 4) for name, start, end in self.phases},
+                'counts': counts,
+            }) + '\n')
+            return
+        origin = self.origin
+        events = [{'name': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1, 'ts': (self.frame_start - origin) * 1e6,
+                   'dur': (self.last - self.frame_start) * 1e6, 'args': {'frame': self.frame, **counts}}]
+        events += [{'name': name, 'ph': 'X', 'pid': 1, 'tid': 1, 'ts': (start - origin) * 1e6,
+                    'dur': (end - start) * 1e6} for name, start, end in self.phases]
+        events.append({'name': 'entities', 'ph': 'C', 'pid': 1, 'ts': (self.frame_start - origin) * 1e6,
+                       'args': counts})
+        self.out.write(''.join(json.dumps(e) + ',\n' for e in events))
+
+    def percentiles(self, name=None):
+        """(p50, p95, p99) in ms for a phase, or for whole frames when name is None."""
+        values = sorted(self.frame_ms if name is None else self.samples.get(name, ()))
+        if not values:
+            return (0.0, 0.0, 0.0)
+        n = len(values)
+        return tuple(values[min(n - 1, int(q * n))] for q in (0.50, 0.95, 0.99))
+
+    def report(self):
+        """[(phase, p50, p95, p99)] for every phase seen, then 'frame'."""
+        rows = [(name, *self.percentiles(name)) for name in self.samples]
+        rows.append(('frame', *self.percentiles()))
+        return rows
+
+    def overlay(self, font):
+        """The timings table as a surface, rebuilt every OVERLAY_REFRESH frames."""
+        if self._overlay is None or self.frame % OVERLAY_REFRESH == 0:
+            rows = [('phase (ms)', 'p50', 'p95', 'p99')]
+            rows += [(name, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}") for name, p50, p95, p99 in self.report()]
+            cells = [[font.render(text, True, OVERLAY_COLOR) for text in row] for row in rows]
+            footer = font.render('  '.join(f"{k} {v}" for k, v in self.counts.items()), True, OVERLAY_COLOR)
+            # the font is proportional, so lay out columns by measured width
+            widths = [max(row[c].get_width() for row in cells) + 12 for c in range(4)]
+            height = font.get_linesize()
+            surf = pygame.Surface((max(sum(widths), footer.get_width()) + 8, height * (len(cells) + 1) + 8),
+                                  pygame.SRCALPHA)
+            surf.fill((0, 0, 0, 170))
+            for i, row in enumerate(cells):
+                y = 4 + i * height
+                surf.blit(row[0], (4, y))
+                x = 4 + widths[0]
+                for c in range(1, 4):
+                    x += widths[c]
+                    surf.blit(row[c], (x - 12 - row[c].get_width(), y))
+            surf.blit(footer, (4, 4 + len(cells) * height))
+            self._overlay = surf
+        return self._overlay
@@ -0,0 +1,66 @@
+# assets/governor.py
+from collections import deque
+
+from assets.sprites import SPRITES
+
+# What each quality level gives up, on top of everything the levels above it gave up.
+LEVELS = (
+    "full quality",
+    "no letters on small asteroids",
+    "thin asteroid outlines",
+    "half as many new particles",
+    "a quarter as many new particles",
+)
+WINDOW = 30       # frames averaged for each decision
+DOWN_AT = 0.9     # step down when the average frame takes more than this share of the budget...
+UP_AT = 0.6       # ...and back up only when it takes less than this
+DOWN_HOLD = 30    # frames to wait after a change before stepping down again
+UP_HOLD = 180     # and before stepping up, so a brief lull doesn't bring the stutter back
+
+class QualityGovernor:
+    """Trades drawing detail for frame time when frames run over budget.
+
+    frame() takes each frame's working time (everything but the wait in
+    clock.tick). When the average over WINDOW frames passes DOWN_AT of
+    the budget, quality drops one level; it climbs back one level at a
+    time once the average stays under UP_AT. The gap between the two
+    thresholds and the hold times after every change keep it from
+    flipping back and forth. Each change is reported through log.
+    """
+    def __init__(self, budget, particles=None, log=print):
+        self.budget = budget
+        self.particles = particles
+        self.log = log
+        self.level = 0
+        self.times = deque(maxlen=WINDOW)
+        self.since_change = 0
+        self.changes = 0
+
+    @property
+    def small_glyphs(self):
+        """Whether to draw the letters on small asteroids."""
+        return self.level < 1
+
+    def frame(self, seconds):
+        self.times.append(seconds)
+        self.since_change += 1
+        if len(self.times) < WINDOW:
+            return
+        mean = sum(self.times) / WINDOW
+        if mean > self.budget * DOWN_AT and self.level < len(LEVELS) - 1 and self.since_change >= DOWN_HOLD:
+            self.set_level(self.level + 1, mean)
+        elif mean < self.budget * UP_AT and self.level > 0 and self.since_change >= UP_HOLD:
+            self.set_level(self.level - 1, mean)
+
+    def set_level(self, level, mean=None):
+        old = self.level
+        self.level = level
+        SPRITES.set_outline(2 if level < 2 else 1)
+        if self.particles is not None:
+            self.particles.stride = 1 if level < 3 else 2 if level < 4 else 4
+        self.times.clear()
+        self.since_change = 0
+        self.changes += 1
+        if self.log is not None and level != old:
+            why = f" at {mean * 1000:.1f} ms a frame (budget {self.budget * 1000:.1f} ms)" if mean is not None else ""
+            self.log(f"Quality {'down' if level > old else 'up'} to level {level}, {LEVELS[level]}{why}")
@@ -0,0 +1,139 @@
+# assets/gun.py
+import math
+try:
+    import numpy as np
+except ImportError:  # the weapons are optional; single shots need no numpy
+    np = None
+from assets.particles import screen_pixels, plot_dots
+from assets.bullet import BULLET_SPEED, BULLET_LIFETIME
+from assets.config import WORLD_W, WORLD_H, steps
+from assets.sprites import SPRITES
+from assets.world import first_free
+
+MAX_BULLETS = 4096    # hard budget; past it the oldest bullets are overwritten
+BULLET_COLOR = (255, 255, 255)
+AVAILABLE = np is not None  # whether BulletBuffer can be used
+
+# name -> (steps between shots, each bullet's angle off the ship's heading)
+WEAPONS = {
+    'rapid': (steps(0.05), (0,)),
+    'spread': (steps(0.1), (-12, -6, 0, 6, 12)),
+}
+
+class BulletBuffer:
+    """A ship's bullets as rows of preallocated NumPy arrays, for the
+    fast-firing weapons.
+
+    Firing writes rows at the ring's head, update() moves, wraps and ages
+    every row at once, hits() tests all live bullets against all asteroids
+    in a few array operations and draw() writes every bullet into the
+    surface's pixels in one go. A row is dead once its age reaches
+    BULLET_LIFETIME; there is no object per bullet and nothing to recycle.
+    """
+    def __init__(self, weapon='rapid', capacity=MAX_BULLETS):
+        if np is None:
+            raise RuntimeError("BulletBuffer needs NumPy")
+        self.weapon = weapon
+        self.cooldown, self.angles = WEAPONS[weapon]
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.age = np.full(capacity, BULLET_LIFETIME, np.int32)
+        self.head = 0
+        self.active = 0  # steps until every bullet is dead; 0 means skip all work
+        self.world = np.array((WORLD_W, WORLD_H), np.float64)
+
+    def fire(self, pos, angle):
+        """One shot from pos with the ship facing angle: a bullet per weapon angle."""
+        for offset in self.angles:
+            a = math.radians(angle + offset)
+            row = self.head
+            self.head = (row + 1) % self.capacity
+            # 0 degrees points up the screen, as for Bullet
+            self.pos[row] = pos[0], pos[1]
+            self.vel[row] = math.sin(a) * BULLET_SPEED, -math.cos(a) * BULLET_SPEED
+            self.age[row] = 0
+        self.active = BULLET_LIFETIME
+
+    def update(self):
+        if not self.active:
+            return
+        self.active -= 1
+        pos = self.pos
+        pos += self.vel
+        np.remainder(pos, self.world, out=pos)
+        self.age += 1
+
+    def live(self):
+        """Row numbers of the live bullets."""
+        return np.flatnonzero(self.age < BULLET_LIFETIME) if self.active else np.empty(0, np.intp)
+
+    def kill(self, rows):
+        self.age[rows] = BULLET_LIFETIME
+
+    def clear(self):
+        self.age[:] = BULLET_LIFETIME
+        self.active = 0
+
+    def __len__(self):
+        return len(self.live())
+
+    def hits(self, asteroids):
+        """Match live bullets to the asteroids they are inside and kill them;
+        returns the asteroids hit, in list order.
+
+        Each asteroid takes at most one bullet (its oldest one inside) and
+        each bullet hits at most one asteroid, as in bullets_vs_asteroids.
+        Distances are measured across the world edge too.
+        """
+        live = self.live()
+        if not len(live) or not asteroids:
+            return []
+        n = len(asteroids)
+        ax = np.fromiter((a.pos[0] for a in asteroids), np.float64, n)
+        ay = np.fromiter((a.pos[1] for a in asteroids), np.float64, n)
+        r = np.fromiter((a.radius for a in asteroids), np.float64, n)
+        bx, by = self.pos[live, 0], self.pos[live, 1]
+
+        # bullets sorted by x, those near the left and right edges repeated
+        # past the other edge, so the bullets in each asteroid's vertical
+        # strip are one slice
+        order = np.argsort(bx)
+        sx = bx[order]
+        reach = r.max()
+        left, right = np.searchsorted(sx, reach), np.searchsorted(sx, WORLD_W - reach)
+        sx = np.concatenate((sx[right:] - WORLD_W, sx, sx[:left] + WORLD_W))
+        order = np.concatenate((order[right:], order, order[:left]))
+        lo = np.searchsorted(sx, ax - r)
+        counts = np.searchsorted(sx, ax + r, 'right') - lo
+        total = int(counts.sum())
+        if not total:
+            return []
+        which = np.repeat(np.arange(n), counts)
+        row = np.arange(total) + np.repeat(lo - np.cumsum(counts) + counts, counts)
+        b = order[row]
+        dx = sx[row] - ax[which]
+        dy = np.abs(by[b] - ay[which])
+        np.minimum(dy, WORLD_H - dy, out=dy)
+        inside = dx * dx + dy * dy <= r[which] ** 2
+        which, b = which[inside], b[inside]
+        if not len(b):
+            return []
+
+        # asteroids in list order, each taking its oldest bullet not yet taken
+        pick = np.lexsort((-self.age[live][b], which))
+        hit, used = first_free(which[pick], b[pick])
+        self.kill(live[used])
+        return [asteroids[i] for i in hit.tolist()]
+
+    def draw(self, surf, alpha=1.0, origin=None):
+        """Plot every live bullet as a 2x2 dot; returns the rect covering them
+        (or none). origin is as for ParticleSystem.draw()."""
+        live = self.live()
+        if not len(live):
+            return []
+        pos = self.pos[live]
+        if alpha < 1.0:
+            pos = pos - self.vel[live] * (1.0 - alpha)
+        xs, ys, _ = screen_pixels(pos, surf.get_size(), origin, SPRITES.scale)
+        return plot_dots(surf, xs, ys, BULLET_COLOR, origin is None)
@@ -0,0 +1,96 @@
+# assets/hud.py
+import pygame
+from assets.config import SCREEN_H
+from assets.hearts import HEART_SIZE
+from assets.sprites import SPRITES
+
+# sizes and positions are on the SCREEN_W x SCREEN_H screen, SPRITES.scale pixels a unit
+HUD_TEXT_POS = (10, 10)
+HUD_HEARTS_POS = (10, SCREEN_H - 26)
+HUD_COLOR = (200, 200, 200)
+HEART_GAP = 8
+
+PANEL_SIZE = (440, 140)  # the end-of-round popup, centred
+PANEL_COLOR = (20, 20, 28)
+PANEL_BORDER = (110, 110, 130)
+PANEL_ALPHA = 220        # whole-surface alpha: one value for the panel, not one per pixel
+
+def _prepare(surf):
+    """Display format, black see-through (the HUD sits on the black background)."""
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    return surf
+
+def _scaled(xy):
+    s = SPRITES.scale
+    return round(xy[0] * s), round(xy[1] * s)
+
+def end_panel(win, font, bigfont):
+    """The end-of-round popup: outcome and restart hint on a translucent panel."""
+    s = SPRITES.scale
+    panel = pygame.Surface(_scaled(PANEL_SIZE))
+    panel.fill(PANEL_COLOR)
+    pygame.draw.rect(panel, PANEL_BORDER, panel.get_rect(), max(1, round(2 * s)))
+    w, h = panel.get_size()
+    title = bigfont.render("YOU WIN!" if win else "GAME OVER", True, (255,255,0) if win else (255,255,255))
+    panel.blit(title, title.get_rect(center=(w/2, h/2 - 20 * s)))
+    sub = font.render("Press any key to restart", True, (200,200,200))
+    panel.blit(sub, sub.get_rect(center=(w/2, h/2 + 25 * s)))
+    if pygame.display.get_surface() is not None:
+        panel = panel.convert()
+    panel.set_alpha(PANEL_ALPHA)
+    return panel
+
+
+class HudLayer:
+    """Hearts, HUD text and the end popup as retained surfaces.
+
+    The hearts and the text line are each composed once into a display
+    format strip and blitted whole; both are rebuilt only when the lives
+    or the key (whatever the text is made from) change. The end popup is
+    built once per outcome and covers only its own rect, not the screen.
+    The fonts should match SPRITES.scale; see assets/canvas.py.
+    """
+    def __init__(self, font, bigfont):
+        self.font = font
+        self.bigfont = bigfont
+        self.key = None
+        self.parts = []   # (surface, position)
+        self.panels = {}  # win -> surface
+
+    def invalidate(self):
+        """Rebuild everything on the next draw, e.g. after the display mode changes."""
+        self.key = None
+        self.panels.clear()
+
+    def _compose(self, lives, label):
+        parts = []
+        text = self.font.render(label, True, HUD_COLOR, (0, 0, 0))
+        parts.append((_prepare(text), _scaled(HUD_TEXT_POS)))
+        if lives > 0:
+            heart = SPRITES.heart()
+            pitch = (HEART_SIZE + HEART_GAP) * SPRITES.scale
+            strip = pygame.Surface((round(lives * pitch), heart.get_height()))
+            for i in range(lives):
+                strip.blit(heart, (round(i * pitch), 0))
+            parts.append((_prepare(strip), _scaled(HUD_HEARTS_POS)))
+        return parts
+
+    def draw(self, surf, lives, key, label, outcome=None):
+        """Blit the HUD; returns the rects touched.
+
+        label() gives the text line and is only called when lives or key
+        changed. outcome is None while playing, else whether the round was won.
+        """
+        full_key = (lives, key)
+        if full_key != self.key:
+            self.parts = self._compose(lives, label())
+            self.key = full_key
+        rects = [surf.blit(part, pos) for part, pos in self.parts]
+        if outcome is not None:
+            panel = self.panels.get(outcome)
+            if panel is None:
+                panel = self.panels[outcome] = end_panel(outcome, self.font, self.bigfont)
+            rects.append(surf.blit(panel, panel.get_rect(center=surf.get_rect().center)))
+        return rects
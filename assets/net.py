@@ -0,0 +1,499 @@
+# assets/net.py
+import random
+import socket
+import struct
+from heapq import heappush, heappop
+from time import perf_counter
+
+from assets.asteroids import POOL as ASTEROID_POOL
+from assets.bullet import POOL as BULLET_POOL
+from assets.config import WORLD_W, WORLD_H, wrap_delta, steps
+from assets.recording import RESTART_BIT, mask_inputs
+from assets.ship import Ship
+
+PORT = 5555
+PLAYERS = 2             # ship 0 is the host's, ship 1 the client's
+SNAPSHOT_EVERY = steps(1 / 30)  # host steps per snapshot: 30 snapshots a second
+SNAPSHOT_HISTORY = 64   # snapshots each side keeps as possible delta baselines
+INPUT_REDUNDANCY = 16   # masks per input packet, the newest and the ones before it, so losses cost nothing
+MAX_INPUT_BACKLOG = 4   # queued client inputs past this are skipped, oldest first, to cap the delay
+DRIFT = 0.5             # pixels an extrapolated asteroid may be off before the host sends it again
+TIMEOUT = 5.0           # seconds of silence before the other side is given up on
+HELLO_EVERY = 0.25      # seconds between hellos while a client waits for its first snapshot
+
+# Fixed point on the wire: positions in 1/8 pixels (so the world must stay
+# under 8192 pixels across), velocities in 1/256 pixels per step.
+POS_SCALE = 8
+VEL_SCALE = 256
+
+HELLO, INPUTS, SNAPSHOT = b'H', b'I', b'S'
+INPUT_HEADER = struct.Struct('<cIIB')     # type, newest input seq, newest snapshot tick held, mask count
+SNAP_HEADER = struct.Struct('<cIIIB')     # type, tick, baseline tick (0: none), last input seq applied, flags
+TEXT_HEADER = struct.Struct('<B')         # word length; the word, then one needed-letters mask per ship
+NEEDED = struct.Struct('<I')
+SHIP = struct.Struct('<HHhhHBBHB')        # x, y, vx, vy, angle, cooldown, lives, invincibility, bullets
+BULLET = struct.Struct('<HHhhH')          # x, y, vx, vy, age
+COUNTS = struct.Struct('<HH')             # asteroids removed, asteroids sent
+UID = struct.Struct('<I')
+ASTEROID = struct.Struct('<IHHhhBBc')     # uid, x, y, vx, vy, size, hp, letter
+
+WIN, GAME_OVER, TEXT, WINNER_2 = 1, 2, 4, 8  # snapshot flags
+
+# Snapshot layout: SNAP_HEADER; TEXT_HEADER, word and NEEDED per ship when
+# the TEXT flag is set; SHIP and its BULLETs per ship; COUNTS; the removed
+# UIDs; the sent ASTEROIDs.
+#
+# Asteroids fly in straight lines, so both sides keep, per asteroid, the
+# entry last sent for it: (tick, x, y, vx, vy, size, hp, letter). Either
+# side extrapolates an entry to any later tick, and a snapshot only holds
+# the asteroids that are new, were hit, or have drifted DRIFT from where
+# their entry puts them, relative to a baseline snapshot the client has
+# acknowledged. Ships and bullets change every step and are always sent.
+
+
+def _qpos(v, span):
+    return round(v * POS_SCALE) % (span * POS_SCALE)
+
+def _qvel(v):
+    return max(-32768, min(32767, round(v * VEL_SCALE)))
+
+def extrapolate(entry, tick):
+    """Where an asteroid entry puts its asteroid at tick."""
+    stamp, x, y, vx, vy = entry[:5]
+    k = tick - stamp
+    return ((x / POS_SCALE + vx / VEL_SCALE * k) % WORLD_W, (y / POS_SCALE + vy / VEL_SCALE * k) % WORLD_H)
+
+def _pack_ship(out, ship):
+    out += SHIP.pack(_qpos(ship.pos.x, WORLD_W), _qpos(ship.pos.y, WORLD_H), _qvel(ship.vel.x), _qvel(ship.vel.y),
+                     round(ship.angle) % 360, ship.cooldown, max(ship.lives, 0),
+                     ship.invincibility_timer if ship.invincible else 0, len(ship.bullets))
+    for b in ship.bullets:
+        out += BULLET.pack(_qpos(b.pos.x, WORLD_W), _qpos(b.pos.y, WORLD_H), _qvel(b.vel.x), _qvel(b.vel.y), b.age)
+
+def encode_snapshot(state, tick, ack, baseline_tick=0, baseline=None):
+    """(packet, table) for state at tick, as a delta against baseline.
+
+    baseline is the table of the snapshot at baseline_tick, which the
+    client holds; None (or baseline_tick 0) sends everything. table is
+    what the client will hold once it has this snapshot.
+    """
+    if baseline is None:
+        baseline_tick, base, base_text = 0, {}, None
+    else:
+        base, base_text = baseline
+    flags = (WIN if state.win else 0) | (GAME_OVER if state.game_over else 0)
+    if state.winner == 1:
+        flags |= WINNER_2
+    text = (state.target_word, tuple(p.needed for p in state.progress))
+    if text != base_text:
+        flags |= TEXT
+    out = bytearray(SNAP_HEADER.pack(SNAPSHOT, tick, baseline_tick, ack, flags))
+    if flags & TEXT:
+        word = text[0].encode('ascii')
+        out += TEXT_HEADER.pack(len(word)) + word
+        for needed in text[1]:
+            out += NEEDED.pack(needed)
+    for ship in state.ships:
+        _pack_ship(out, ship)
+
+    table = {}
+    sent = bytearray()
+    n_sent = 0
+    drift = DRIFT * DRIFT
+    for a in state.asteroids:
+        old = base.get(a.uid)
+        if old is not None and old[5] == a.size and old[6] == a.hp:
+            dx, dy = wrap_delta(extrapolate(old, tick), a.pos)
+            if dx*dx + dy*dy <= drift:
+                table[a.uid] = old
+                continue
+        entry = (tick, _qpos(a.pos.x, WORLD_W), _qpos(a.pos.y, WORLD_H), _qvel(a.vel.x), _qvel(a.vel.y),
+                 a.size, a.hp, a.letter.encode('ascii'))
+        table[a.uid] = entry
+        sent += ASTEROID.pack(a.uid, *entry[1:])
+        n_sent += 1
+    removed = [uid for uid in base if uid not in table]
+    out += COUNTS.pack(len(removed), n_sent)
+    for uid in removed:
+        out += UID.pack(uid)
+    out += sent
+    return bytes(out), (table, text)
+
+def decode_snapshot(data, baselines):
+    """Unpack a snapshot against baselines, {tick: table} as encode_snapshot returns them.
+
+    Returns a dict of tick, ack, flags, text, ships ((ship fields,
+    [bullet fields]) per ship) and table, or None if the baseline it was
+    made against is no longer held.
+    """
+    _, tick, baseline_tick, ack, flags = SNAP_HEADER.unpack_from(data)
+    if baseline_tick:
+        if baseline_tick not in baselines:
+            return None
+        base, text = baselines[baseline_tick]
+    else:
+        base, text = {}, None
+    i = SNAP_HEADER.size
+    if flags & TEXT:
+        n, = TEXT_HEADER.unpack_from(data, i)
+        i += TEXT_HEADER.size
+        word = data[i:i + n].decode('ascii')
+        i += n
+        needed = []
+        for _ in range(PLAYERS):
+            needed.append(NEEDED.unpack_from(data, i)[0])
+            i += NEEDED.size
+        text = (word, tuple(needed))
+    ships = []
+    for _ in range(PLAYERS):
+        fields = SHIP.unpack_from(data, i)
+        i += SHIP.size
+        bullets = []
+        for _ in range(fields[-1]):
+            bullets.append(BULLET.unpack_from(data, i))
+            i += BULLET.size
+        ships.append((fields, bullets))
+    n_removed, n_sent = COUNTS.unpack_from(data, i)
+    i += COUNTS.size
+    table = dict(base)
+    for _ in range(n_removed):
+        del table[UID.unpack_from(data, i)[0]]
+        i += UID.size
+    for _ in range(n_sent):
+        uid, *fields = ASTEROID.unpack_from(data, i)
+        table[uid] = (tick, *fields)
+        i += ASTEROID.size
+    return {'tick': tick, 'ack': ack, 'flags': flags, 'text': text, 'ships': ships, 'table': table}
+
+
+class Link:
+    """A non-blocking UDP socket that can lose and delay what it sends.
+
+    loss is the share of packets dropped, latency the seconds each is held
+    back, plus up to jitter more (so packets also arrive out of order).
+    Both apply only to this side's sends; give each side its own Link to
+    impair both directions. clock is swappable for tests.
+    """
+    def __init__(self, port=0, host='', loss=0.0, latency=0.0, jitter=0.0, seed=None, clock=perf_counter):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+        self.loss = loss
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.queue = []  # (due, order, data, addr)
+        self.order = 0
+        self.sent_bytes = 0
+        self.sent_packets = 0
+        self.dropped = 0
+
+    @property
+    def port(self):
+        return self.sock.getsockname()[1]
+
+    def send(self, data, addr):
+        self.sent_bytes += len(data)
+        self.sent_packets += 1
+        if self.loss and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay <= 0:
+            self._sendto(data, addr)
+        else:
+            self.order += 1
+            heappush(self.queue, (self.clock() + delay, self.order, data, addr))
+
+    def _sendto(self, data, addr):
+        try:
+            self.sock.sendto(data, addr)
+        except OSError:
+            pass  # the other side is gone; the timeout will notice
+
+    def flush(self):
+        """Send the delayed packets that are due."""
+        now = self.clock()
+        queue = self.queue
+        while queue and queue[0][0] <= now:
+            _, _, data, addr = heappop(queue)
+            self._sendto(data, addr)
+
+    def receive(self):
+        """Yield (data, addr) for every packet waiting, after sending what is due."""
+        self.flush()
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(65536)
+            except BlockingIOError:
+                return
+            except ConnectionResetError:
+                continue  # Windows reports an unreachable peer this way
+            yield data, addr
+
+    def close(self):
+        self.sock.close()
+
+
+class Host:
+    """The authoritative side of a two-player game.
+
+    It runs the VersusState: ship 0 is played here, ship 1 by the client,
+    whose input masks arrive numbered and are applied one per step in
+    order. When the next one is late the last is repeated. Every
+    SNAPSHOT_EVERY steps the client gets a snapshot, delta-encoded
+    against the newest one it has acknowledged.
+    """
+    def __init__(self, state, link, snapshot_every=SNAPSHOT_EVERY):
+        self.state = state
+        self.link = link
+        self.snapshot_every = snapshot_every
+        self.peer = None
+        self.heard = 0.0
+        self.pending = {}   # input seq -> mask, not yet applied
+        self.next_seq = 1
+        self.mask = 0       # the client's last applied mask
+        self.acked = 0      # newest snapshot tick the client holds
+        self.history = {}   # tick -> table, for the last SNAPSHOT_HISTORY snapshots
+        self.tick = 0
+        self.snapshot_bytes = 0
+        self.snapshots = 0
+
+    @property
+    def connected(self):
+        return self.peer is not None
+
+    def poll(self):
+        """Read what the client sent; False once it has been silent for TIMEOUT."""
+        for data, addr in self.link.receive():
+            kind = data[:1]
+            if kind == HELLO and self.peer is None:
+                self.peer = addr
+                self.state.reset()  # both players start the round together
+            elif kind == INPUTS and addr == self.peer and len(data) >= INPUT_HEADER.size:
+                _, newest, acked, n = INPUT_HEADER.unpack_from(data)
+                masks = data[INPUT_HEADER.size:INPUT_HEADER.size + n]
+                for k, mask in enumerate(masks):
+                    seq = newest - k
+                    if seq >= self.next_seq:
+                        self.pending[seq] = mask
+                if acked > self.acked:
+                    self.acked = acked
+            else:
+                continue
+            self.heard = self.link.clock()
+        return self.peer is None or self.link.clock() - self.heard < TIMEOUT
+
+    def _client_mask(self):
+        pending = self.pending
+        while len(pending) > MAX_INPUT_BACKLOG:
+            # the client is running ahead; skip inputs rather than lag further behind
+            pending.pop(self.next_seq, None)
+            self.next_seq += 1
+        mask = pending.pop(self.next_seq, None)
+        if mask is not None:
+            self.next_seq += 1
+            self.mask = mask
+        return self.mask & ~RESTART_BIT if mask is None else mask
+
+    def step(self, keys):
+        """One step, ship 0 driven by keys; returns the state's events."""
+        mask = self._client_mask()
+        state = self.state
+        if mask & RESTART_BIT and state.over:
+            state.reset()
+        events = state.step((keys, mask_inputs(mask)))
+        self.tick += 1
+        if self.peer is not None and self.tick % self.snapshot_every == 0:
+            self.send_snapshot()
+        return events
+
+    def send_snapshot(self):
+        baseline = self.history.get(self.acked)
+        data, table = encode_snapshot(self.state, self.tick, self.next_seq - 1,
+                                      self.acked if baseline is not None else 0, baseline)
+        self.history[self.tick] = table
+        while len(self.history) > SNAPSHOT_HISTORY:
+            del self.history[next(iter(self.history))]
+        self.link.send(data, self.peer)
+        self.snapshot_bytes += len(data)
+        self.snapshots += 1
+
+
+class Client:
+    """The remote side: predicts its own ship, mirrors the rest.
+
+    Each step sends the newest input masks and runs the ship (ships[1])
+    on them at once. When a snapshot arrives, the ship is put where the
+    host had it and the inputs the host had not applied yet are run
+    again on top (reconciliation). The asteroids and the other ship are
+    extrapolated the same number of steps ahead, so everything on screen
+    is at the time the host will apply the newest input.
+    """
+    def __init__(self, link, host_addr):
+        self.link = link
+        self.host_addr = host_addr
+        self.seq = 0
+        self.inputs = {}      # input seq -> mask, not yet acknowledged
+        self.ack = 0
+        self.tick = 0         # of the newest snapshot
+        self.baselines = {}   # tick -> table
+        self.heard = link.clock()
+        self.hello_sent = None
+        self.ships = [Ship((WORLD_W * (i + 1) / (PLAYERS + 1), WORLD_H/2)) for i in range(PLAYERS)]
+        self.shots = []       # both ships' bullets as of the newest snapshot, moved on since
+        self.mirrors = {}     # uid -> Asteroid
+        self.asteroids = []
+        self.target_word = ''
+        self.needed = (0, 0)
+        self.flags = 0
+        self.rng = random.Random(0)  # for the pool; every field is overwritten from the snapshot
+
+    @property
+    def connected(self):
+        return self.tick > 0
+
+    @property
+    def ship(self):
+        return self.ships[1]
+
+    @property
+    def win(self):
+        return bool(self.flags & WIN)
+
+    @property
+    def game_over(self):
+        return bool(self.flags & GAME_OVER)
+
+    @property
+    def over(self):
+        return bool(self.flags & (WIN | GAME_OVER))
+
+    @property
+    def winner(self):
+        return (1 if self.flags & WINNER_2 else 0) if self.win else None
+
+    @property
+    def lead(self):
+        """Steps the client runs ahead of the newest snapshot: about one round trip."""
+        return self.seq - self.ack
+
+    def poll(self):
+        """Read snapshots and apply the newest; False once the host has been silent for TIMEOUT."""
+        now = self.link.clock()
+        if not self.connected and (self.hello_sent is None or now - self.hello_sent >= HELLO_EVERY):
+            self.link.send(HELLO, self.host_addr)
+            self.hello_sent = now
+        newest = None
+        for data, addr in self.link.receive():
+            if addr != self.host_addr or data[:1] != SNAPSHOT or len(data) < SNAP_HEADER.size:
+                continue
+            self.heard = now
+            if SNAP_HEADER.unpack_from(data)[1] <= self.tick:
+                continue  # late or duplicated
+            snap = decode_snapshot(data, self.baselines)
+            if snap is None:
+                continue
+            self.baselines[snap['tick']] = (snap['table'], snap['text'])
+            while len(self.baselines) > SNAPSHOT_HISTORY:
+                del self.baselines[next(iter(self.baselines))]
+            self.tick = snap['tick']
+            newest = snap
+        if newest is not None:
+            self._apply(newest)
+        return now - self.heard < TIMEOUT
+
+    def _apply(self, snap):
+        self.ack = max(self.ack, snap['ack'])
+        for seq in [s for s in self.inputs if s <= self.ack]:
+            del self.inputs[seq]
+        self.target_word, self.needed = snap['text']
+        self.flags = snap['flags']
+        lead = self.lead
+
+        for b in self.shots:
+            BULLET_POOL.release(b)
+        self.shots = []
+        for ship, (fields, bullets) in zip(self.ships, snap['ships']):
+            x, y, vx, vy, angle, cooldown, lives, invincible, _ = fields
+            ship.pos.update(x / POS_SCALE, y / POS_SCALE)
+            ship.vel.update(vx / VEL_SCALE, vy / VEL_SCALE)
+            ship.angle = angle
+            ship.cooldown = cooldown
+            ship.lives = lives
+            ship.invincible = invincible > 0
+            ship.invincibility_timer = invincible
+            for b in ship.bullets:
+                BULLET_POOL.release(b)
+            ship.bullets.clear()
+            for x, y, vx, vy, age in bullets:
+                b = BULLET_POOL.acquire((x / POS_SCALE, y / POS_SCALE), 0)
+                b.vel.update(vx / VEL_SCALE, vy / VEL_SCALE)
+                b.age = age
+                self.shots.append(b)
+        # own ship: replay the inputs the host has not seen yet; its new bullets stay predicted
+        me = self.ship
+        if me.lives > 0:
+            for seq in sorted(self.inputs):
+                me.handle_input(mask_inputs(self.inputs[seq]))
+                me.update()
+        # the rest: straight ahead by as many steps
+        if self.ships[0].lives > 0:
+            for _ in range(lead):
+                self.ships[0].update()
+        kept = 0
+        for b in self.shots:
+            for _ in range(lead):
+                b.update()
+            if b.alive():
+                self.shots[kept] = b
+                kept += 1
+            else:
+                BULLET_POOL.release(b)
+        del self.shots[kept:]
+
+        mirrors = self.mirrors
+        table = snap['table']
+        for uid in [uid for uid in mirrors if uid not in table]:
+            ASTEROID_POOL.release(mirrors.pop(uid))
+        at = self.tick + lead
+        for uid, entry in table.items():
+            a = mirrors.get(uid)
+            if a is None:
+                a = mirrors[uid] = ASTEROID_POOL.acquire((0, 0), entry[5], entry[7].decode('ascii'), self.rng)
+                a.prev.update(extrapolate(entry, at))  # new here: nothing to draw it coming from
+            a.pos.update(extrapolate(entry, at))
+            a.vel.update(entry[3] / VEL_SCALE, entry[4] / VEL_SCALE)
+            a.size = entry[5]
+            a.hp = entry[6]
+        self.asteroids = list(mirrors.values())
+
+    def step(self, mask):
+        """Send this step's input mask and run everything one step on."""
+        if not self.connected:
+            return
+        self.seq += 1
+        self.inputs[self.seq] = mask
+        seqs = range(self.seq, max(self.seq - INPUT_REDUNDANCY, 0), -1)
+        masks = bytes(self.inputs.get(s, 0) for s in seqs)
+        self.link.send(INPUT_HEADER.pack(INPUTS, self.seq, self.tick, len(masks)) + masks, self.host_addr)
+        if self.over:
+            return
+        me = self.ship
+        if me.lives > 0:
+            me.handle_input(mask_inputs(mask))
+            me.update()
+        if self.ships[0].lives > 0:
+            self.ships[0].update()
+        kept = 0
+        for b in self.shots:
+            b.update()
+            if b.alive():
+                self.shots[kept] = b
+                kept += 1
+            else:
+                BULLET_POOL.release(b)
+        del self.shots[kept:]
+        for a in self.asteroids:
+            a.update()
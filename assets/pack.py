@@ -0,0 +1,150 @@
+# assets/pack.py
+import io
+import json
+import mmap
+import wave
+import struct
+from array import array
+from pathlib import Path
+
+PACK_PATH = Path(__file__).parent / 'assets.pack'
+MAGIC = b'ASPK'
+VERSION = 1
+ALIGN = 16
+# what the game opens the mixer with (see SoundManager): 44.1 kHz, signed 16-bit, stereo
+MIXER_FORMAT = (44100, -16, 2)
+
+# Layout: MAGIC, <version:u16><header length:u32>, a JSON header listing each
+# entry's name, kind, offset and length, then the data, every entry starting
+# on an ALIGN boundary. 'sfx' entries hold raw PCM already in MIXER_FORMAT,
+# ready for pygame.mixer.Sound(buffer=...). 'music' and 'blob' entries hold
+# the original file bytes, for music.load(), image.load() or font.Font() to
+# read through AssetPack.open().
+
+def _pcm_for_mixer(path, rate, channels):
+    """Decode a 16-bit WAV to interleaved signed 16-bit PCM at rate/channels."""
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit WAV files can be packed")
+        src_channels = wav.getnchannels()
+        src_rate = wav.getframerate()
+        samples = array('h', wav.readframes(wav.getnframes()))
+    frames = [samples[c::src_channels] for c in range(src_channels)]
+    if src_rate != rate:
+        # nearest-neighbour resample; the test sounds are all 44.1 kHz already
+        n = len(frames[0]) * rate // src_rate
+        frames = [array('h', (f[i * src_rate // rate] for i in range(n))) for f in frames]
+    out = array('h', bytes(2 * len(frames[0]) * channels))
+    for c in range(channels):
+        out[c::channels] = frames[min(c, src_channels - 1)]
+    return out.tobytes()
+
+def write_pack(out_path, sfx=(), music=(), blobs=(), mixer_format=MIXER_FORMAT):
+    """Write a pack; sfx/music/blobs are iterables of (name, file path)."""
+    rate, _, channels = mixer_format
+    items = []
+    for name, path in sfx:
+        items.append(({'name': name, 'kind': 'sfx', 'rate': rate, 'channels': channels, 'bits': 16},
+                      _pcm_for_mixer(path, rate, channels)))
+    for kind, entries in (('music', music), ('blob', blobs)):
+        for name, path in entries:
+            items.append(({'name': name, 'kind': kind}, Path(path).read_bytes()))
+
+    # offsets depend on the header size and the header lists the offsets;
+    # grow the reserved header space until the two agree
+    prefix = len(MAGIC) + 6
+    header_len = 0
+    while True:
+        offset = _align(prefix + header_len)
+        for entry, data in items:
+            entry['offset'] = offset
+            entry['length'] = len(data)
+            offset = _align(offset + len(data))
+        header = json.dumps({'entries': [entry for entry, _ in items]}).encode('utf-8')
+        if len(header) <= header_len:
+            header += b' ' * (header_len - len(header))
+            break
+        header_len = _align(prefix + len(header)) - prefix
+
+    with open(out_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<HI', VERSION, len(header)) + header)
+        for entry, data in items:
+            f.write(bytes(entry['offset'] - f.tell()))
+            f.write(data)
+    return [entry for entry, _ in items]
+
+def _align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable read-only file over a buffer, such as one entry of a pack."""
+    def __init__(self, view):
+        self.view = memoryview(view)
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), len(self.view) - self.pos)
+        b[:n] = self.view[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: len(self.view)}[whence]
+        self.pos = max(0, base + offset)
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+
+class AssetPack:
+    """A memory-mapped pack; entries are handed out as views, never copied."""
+    def __init__(self, path=PACK_PATH):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        if self._view[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an asset pack")
+        version, header_len = struct.unpack_from('<HI', self._map, len(MAGIC))
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: pack version {version}, expected {VERSION}")
+        start = len(MAGIC) + 6
+        header = json.loads(bytes(self._view[start:start + header_len]))
+        self.entries = {(e['kind'], e['name']): e for e in header['entries']}
+
+    def names(self, kind):
+        return [name for k, name in self.entries if k == kind]
+
+    def view(self, kind, name):
+        entry = self.entries[(kind, name)]
+        return self._view[entry['offset']:entry['offset'] + entry['length']]
+
+    def sound_buffer(self, name, mixer_format):
+        """PCM for pygame.mixer.Sound(buffer=...), or None if the pack was built
+        for a different mixer format than mixer_format (pygame.mixer.get_init())."""
+        entry = self.entries.get(('sfx', name))
+        if entry is None or (entry['rate'], -entry['bits'], entry['channels']) != tuple(mixer_format):
+            return None
+        return self.view('sfx', name)
+
+    def open(self, kind, name):
+        """A file object over a music or blob entry."""
+        return BufferReader(self.view(kind, name))
+
+    def close(self):
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass  # an entry view is still in use; the mapping goes when it does
+        self._file.close()
@@ -0,0 +1,188 @@
+# assets/particles.py
+import math
+import pygame
+try:
+    import numpy as np
+except ImportError:  # effects are optional; the game runs without numpy
+    np = None
+AVAILABLE = np is not None  # whether ParticleSystem can be used
+
+from assets.config import WORLD_W, WORLD_H, per_step, kept_per_step, steps
+from assets.sprites import SPRITES
+
+
+MAX_PARTICLES = 32768  # hard budget; past it the oldest particles are overwritten
+PARTICLE_DRAG = kept_per_step(0.96, 1 / 60)  # 0.96 of the speed kept every 1/60 s
+
+EXPLOSION_PARTICLES = 90  # per unit of asteroid size
+EXPLOSION_SPEED = (per_step(30), per_step(270))  # pixels a step: 30 to 270 a second
+EXPLOSION_LIFE = (steps(0.3), steps(0.8))  # steps
+EXPLOSION_COLORS = ((255, 240, 200), (255, 200, 80), (255, 140, 40), (200, 200, 200))
+
+EXHAUST_PARTICLES = max(1, round(per_step(480)))  # per step of thrust: 480 a second
+EXHAUST_SPEED = (per_step(120), per_step(240))
+EXHAUST_SPREAD = 18    # degrees either side of straight back
+EXHAUST_LIFE = (steps(0.1), steps(0.27))
+EXHAUST_COLORS = ((255, 220, 120), (255, 150, 50), (220, 70, 30))
+EXHAUST_OFFSET = 10    # from the ship's centre to its tail
+
+def screen_pixels(pos, size, origin=None, scale=1.0):
+    """Whole-pixel xs, ys on a surface of this size for world positions pos
+    ((n, 2) array), and a mask of the rows that land on it (None: all do).
+
+    Without origin the surface is the whole world and everything wraps onto
+    it. origin is the world position of the surface's top-left corner when
+    it is a camera view onto a larger world; xs and ys then hold only the
+    rows the mask keeps. scale is the surface's pixels per world unit.
+    """
+    w, h = size
+    if scale != 1:
+        pos = pos * scale
+        if origin is not None:
+            origin = (origin[0] * scale, origin[1] * scale)
+    if origin is None:
+        return pos[:, 0].astype(np.int32) % w, pos[:, 1].astype(np.int32) % h, None
+    xs = (pos[:, 0] - origin[0]).astype(np.int32) % round(WORLD_W * scale)
+    ys = (pos[:, 1] - origin[1]).astype(np.int32) % round(WORLD_H * scale)
+    seen = (xs < w) & (ys < h)
+    return xs[seen], ys[seen], seen
+
+def plot_dots(surf, xs, ys, colors, wrap=False):
+    """Write a 2x2 dot at each (xs, ys) straight into surf's pixels; colors
+    is an (n, 3) array or one (r, g, b). Returns the rect covering them.
+
+    wrap is for a surface that is the whole world (screen_pixels() without
+    an origin): dots on the last column or row spill over to the first.
+    Otherwise they are cut off at the edge.
+    """
+    if not len(xs):
+        return []
+    w, h = surf.get_size()
+    if wrap:
+        xs1 = (xs + 1) % w
+        ys1 = (ys + 1) % h
+    else:
+        xs1 = np.minimum(xs + 1, w - 1)
+        ys1 = np.minimum(ys + 1, h - 1)
+    colors = np.asarray(colors, np.uint32)
+    if surf.get_bytesize() == 4:
+        # one 32-bit store per pixel, in the surface's own channel order
+        rs, gs, bs, _ = surf.get_shifts()
+        colors = (colors[..., 0] << rs) | (colors[..., 1] << gs) | (colors[..., 2] << bs) | surf.get_masks()[3]
+        pixels = pygame.surfarray.pixels2d(surf)
+    else:
+        pixels = pygame.surfarray.pixels3d(surf)
+    try:
+        pixels[xs, ys] = colors
+        pixels[xs1, ys] = colors
+        pixels[xs, ys1] = colors
+        pixels[xs1, ys1] = colors
+    finally:
+        del pixels  # unlocks the surface
+    x0, y0 = int(min(xs.min(), xs1.min())), int(min(ys.min(), ys1.min()))
+    x1, y1 = int(max(xs.max(), xs1.max())), int(max(ys.max(), ys1.max()))
+    return [pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)]
+
+class ParticleSystem:
+    """Explosion sparks and exhaust, kept as columns in NumPy ring buffers.
+
+    There is no object per particle: emitting writes a block of rows at the
+    ring's head, update() moves every row with a few array operations, and
+    draw() writes all live particles into the surface's pixels in one go.
+    Dead rows (life <= 0) are skipped when drawing and reused by the ring.
+    """
+    def __init__(self, capacity=MAX_PARTICLES, seed=None):
+        if np is None:
+            raise RuntimeError("ParticleSystem needs NumPy")
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)   # steps left
+        self.life0 = np.ones(capacity, np.float32)   # steps at birth, for fading
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.head = 0
+        self.active = 0  # steps until every particle is dead; 0 means skip all work
+        self.stride = 1  # emit only one in stride particles, to thin the effects under load
+        self.rng = np.random.default_rng(seed)  # its own stream, so effects never change the game
+        self.explosion_colors = np.array(EXPLOSION_COLORS, np.uint8)
+        self.exhaust_colors = np.array(EXHAUST_COLORS, np.uint8)
+
+    def emit(self, x, y, vx, vy, life, colors):
+        """Add len(vx) particles; vx, vy and life are arrays, x and y scalars or arrays."""
+        n = min(len(vx), self.capacity)
+        rows = (self.head + np.arange(n)) % self.capacity
+        self.head = int(rows[-1] + 1) % self.capacity
+        self.pos[rows, 0] = x
+        self.pos[rows, 1] = y
+        self.vel[rows, 0] = vx[:n]
+        self.vel[rows, 1] = vy[:n]
+        self.life[rows] = life[:n]
+        self.life0[rows] = life[:n]
+        self.color[rows] = colors[self.rng.integers(0, len(colors), n)]
+        self.active = max(self.active, int(life[:n].max()))
+
+    def _burst(self, n, angle, spread, speed, base_vel):
+        rng = self.rng
+        a = np.radians(angle + rng.uniform(-spread, spread, n))
+        s = rng.uniform(*speed, n)
+        # 0 degrees points up the screen, as for the ship
+        return base_vel[0] + np.sin(a) * s, base_vel[1] - np.cos(a) * s
+
+    def explode(self, pos, vel, size):
+        """A burst of sparks where an asteroid of this size was destroyed."""
+        n = EXPLOSION_PARTICLES * size // self.stride
+        vx, vy = self._burst(n, 0.0, 180.0, (EXPLOSION_SPEED[0], EXPLOSION_SPEED[1] * (1 + size) / 2), vel)
+        life = self.rng.uniform(*EXPLOSION_LIFE, n)
+        self.emit(pos[0], pos[1], vx, vy, life, self.explosion_colors)
+
+    def exhaust(self, pos, vel, angle):
+        """One step of engine exhaust out of the back of a ship facing angle."""
+        back = angle + 180
+        r = math.radians(back)
+        x = pos[0] + math.sin(r) * EXHAUST_OFFSET
+        y = pos[1] - math.cos(r) * EXHAUST_OFFSET
+        n = max(EXHAUST_PARTICLES // self.stride, 1)
+        vx, vy = self._burst(n, back, EXHAUST_SPREAD, EXHAUST_SPEED, vel)
+        life = self.rng.uniform(*EXHAUST_LIFE, n)
+        self.emit(x, y, vx, vy, life, self.exhaust_colors)
+
+    def update(self):
+        if not self.active:
+            return
+        self.active -= 1
+        pos, vel = self.pos, self.vel
+        pos += vel
+        vel *= PARTICLE_DRAG
+        self.life -= 1
+        # no wrapping here: float modulo would be most of the cost, and a
+        # particle lives too briefly to drift far; draw() wraps whole pixels
+
+    def clear(self):
+        self.life[:] = 0
+        self.active = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.life > 0)) if self.active else 0
+
+    def draw(self, surf, alpha=1.0, origin=None):
+        """Plot every live particle as a 2x2 dot, fading with age; returns
+        the rect covering them (or none).
+
+        origin is the world position of surf's top-left corner when surf is
+        a camera view onto a larger world; particles outside it are skipped.
+        """
+        if not self.active:
+            return []
+        live = np.flatnonzero(self.life > 0)
+        if not len(live):
+            return []
+        pos = self.pos[live]
+        if alpha < 1.0:
+            pos = pos - self.vel[live] * (1.0 - alpha)
+        xs, ys, seen = screen_pixels(pos, surf.get_size(), origin, SPRITES.scale)
+        if seen is not None:
+            if not seen.any():
+                return []
+            live = live[seen]
+        fade = np.minimum(self.life[live] / self.life0[live], 1.0)[:, None]
+        return plot_dots(surf, xs, ys, (self.color[live] * fade).astype(np.uint32), origin is None)
@@ -0,0 +1,28 @@
+# assets/pool.py
+
+class Pool:
+    """Free list of spent objects that get re-initialised instead of rebuilt.
+
+    Pooled classes provide reset(), taking the same arguments as __init__.
+    Only release an object once nothing else holds on to it.
+    """
+    __slots__ = ('factory', 'free', 'max_free')
+
+    def __init__(self, factory, max_free=4096):
+        self.factory = factory
+        self.free = []
+        self.max_free = max_free
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+        return self.factory(*args, **kwargs)
+
+    def release(self, obj):
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def clear(self):
+        self.free.clear()
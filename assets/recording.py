@@ -0,0 +1,104 @@
+# assets/recording.py
+import struct
+from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_SPACE
+
+MAGIC = b'ASRC'
+VERSION = 1
+HEADER = struct.Struct('<4sBq')  # magic, version, seed
+
+# the keys Ship.handle_input reads, one bit each
+KEY_BITS = ((K_LEFT, 1), (K_RIGHT, 2), (K_UP, 4), (K_SPACE, 8))
+RESTART_BIT = 0x80  # a key was pressed on the end screen, restarting before this frame
+
+# File layout: HEADER, then runs of (mask byte, LEB128 frame count) to the
+# end of the file. Held keys change rarely, so a minute of play is usually
+# a few hundred bytes.
+
+def key_mask(keys):
+    """The bitmask for a pygame.key.get_pressed() result (or make_inputs())."""
+    mask = 0
+    for key, bit in KEY_BITS:
+        if keys[key]:
+            mask |= bit
+    return mask
+
+# inputs for GameState.step(), one per mask, built once
+_INPUTS = [{key: bool(mask & bit) for key, bit in KEY_BITS} for mask in range(16)]
+
+def mask_inputs(mask):
+    return _INPUTS[mask & 0x0f]
+
+
+class InputRecorder:
+    """Collects one key mask per frame, run-length encoded as it goes."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.runs = []  # [mask, count]
+        self.frames = 0
+
+    def record(self, mask):
+        runs = self.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+        self.frames += 1
+
+    def save(self, path):
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed))
+        for mask, count in self.runs:
+            out.append(mask)
+            while True:
+                byte = count & 0x7f
+                count >>= 7
+                if count:
+                    out.append(byte | 0x80)
+                else:
+                    out.append(byte)
+                    break
+        with open(path, 'wb') as f:
+            f.write(out)
+
+
+class Recording:
+    """A saved session: its seed and the key mask of every frame."""
+    def __init__(self, seed, runs):
+        self.seed = seed
+        self.runs = runs
+        self.frames = sum(count for _, count in runs)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not an input recording")
+        magic, version, seed = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an input recording")
+        if version != VERSION:
+            raise ValueError(f"{path}: recording version {version}, expected {VERSION}")
+        runs = []
+        i = HEADER.size
+        try:
+            while i < len(data):
+                mask = data[i]
+                count = shift = 0
+                while True:
+                    i += 1
+                    byte = data[i]
+                    count |= (byte & 0x7f) << shift
+                    shift += 7
+                    if not byte & 0x80:
+                        break
+                i += 1
+                runs.append((mask, count))
+        except IndexError:
+            raise ValueError(f"{path}: recording is truncated") from None
+        return cls(seed, runs)
+
+    def masks(self):
+        """Every frame's mask, in order."""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
@@ -1,20 +1,31 @@
 # assets/ship.py
 import pygame
-from pygame.locals import *
+from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_SPACE
 import math
-from assets.config import wrap_position, SCREEN_W, SCREEN_H, STARTING_LIVES
-from assets.bullet import Bullet
+from assets.config import (wrap_position, render_position, per_step, per_step_squared, kept_per_step,
+                           steps, STARTING_LIVES)
+from assets.bullet import Bullet, POOL as BULLET_POOL
+from assets.sprites import SPRITES, blit_wrapped
 
-SHIP_TURN_SPEED = 4       # degrees per frame
-SHIP_ACCEL      = 0.25
-SHIP_FRICTION   = 0.985
-SHIP_MAX_SPEED  = 6.0
-SHIP_COOLDOWN   = 12      # frames between shots
-INVINCIBILITY_DURATION = 180  # 3 seconds at 60 FPS
+# set per second, used per step (see assets/config.py)
+SHIP_TURN_SPEED = per_step(240)          # degrees a step: 240 a second
+SHIP_ACCEL      = per_step_squared(900)  # pixels a second, per second
+SHIP_FRICTION   = kept_per_step(0.985, 1 / 60)  # 0.985 of the speed kept every 1/60 s
+SHIP_MAX_SPEED  = per_step(360)          # pixels a step: 360 a second
+SHIP_COOLDOWN   = steps(0.2)             # steps between shots
+INVINCIBILITY_DURATION = steps(3.0)      # steps
+SHIP_BLINK = steps(0.1)  # steps each phase of the invincibility blink lasts
+SHIP_COLOR = (255, 255, 255)
+SHIP_BLINK_COLOR = (90, 90, 90)  # the "off" frames of the invincibility blink
+SHIP_POINTS = ((0, -16), (-10, 10), (10, 10))  # tip, left, right at angle 0
 
 class Ship:
-    def __init__(self, pos, lives=STARTING_LIVES, sound_manager=None):
+    __slots__ = ('pos', 'prev', 'vel', 'angle', 'lives', 'bullets', 'cooldown', 'invincible',
+                 'invincibility_timer', 'sound_manager', 'store', 'particles', 'gun')
+
+    def __init__(self, pos, lives=STARTING_LIVES, sound_manager=None, store=None):
         self.pos = pygame.Vector2(pos)
+        self.prev = pygame.Vector2(pos)  # pos before the last step, for drawing between steps
         self.vel = pygame.Vector2(0, 0)
         self.angle = 0  # 0 degrees points up
         self.lives = lives
@@ -23,6 +34,9 @@ class Ship:
         self.invincible = False
         self.invincibility_timer = 0
         self.sound_manager = sound_manager
+        self.store = store  # optional EntityStore that owns this ship's bullets
+        self.particles = None  # optional ParticleSystem for the exhaust
+        self.gun = None  # optional BulletBuffer (assets/gun.py) that fires instead of Bullet objects
 
     def handle_input(self, keys):
         if keys[K_LEFT]:
@@ -32,13 +46,22 @@ class Ship:
         if keys[K_UP]:
             thrust = pygame.Vector2(0, -SHIP_ACCEL).rotate(self.angle)
             self.vel += thrust
+            if self.particles is not None:
+                self.particles.exhaust(self.pos, self.vel, self.angle)
 
         if keys[K_SPACE] and self.cooldown == 0:
             self.shoot()
 
     def shoot(self):
-        self.bullets.append(Bullet(self.pos, self.angle))
-        self.cooldown = SHIP_COOLDOWN
+        if self.gun is not None:
+            self.gun.fire(self.pos, self.angle)
+            self.cooldown = self.gun.cooldown
+        else:
+            if self.store is not None:
+                self.bullets.append(self.store.add_bullet(self.pos, self.angle))
+            else:
+                self.bullets.append(BULLET_POOL.acquire(self.pos, self.angle))
+            self.cooldown = SHIP_COOLDOWN
         if self.sound_manager:
             self.sound_manager.play_sound('shoot')
 
@@ -51,11 +74,16 @@ class Ship:
         """Check if ship is currently invincible."""
         return self.invincible
 
+    def blinking(self):
+        """Whether to draw the dim sprite: every other SHIP_BLINK steps while invincible."""
+        return self.invincible and (self.invincibility_timer // SHIP_BLINK) % 2 == 0
+
     def update(self):
         # speed cap & friction
         if self.vel.length() > SHIP_MAX_SPEED:
             self.vel.scale_to_length(SHIP_MAX_SPEED)
         self.vel *= SHIP_FRICTION
+        self.prev.update(self.pos)
         self.pos += self.vel
         self.pos.xy = wrap_position(self.pos)
 
@@ -68,28 +96,38 @@ class Ship:
             if self.invincibility_timer <= 0:
                 self.invincible = False
 
-        # update bullets
-        alive = []
-        for b in self.bullets:
+        if self.gun is not None:
+            self.gun.update()
+        # update bullets, compacting the list in place
+        bullets = self.bullets
+        kept = 0
+        for b in bullets:
             b.update()
             if b.alive():
-                alive.append(b)
-        self.bullets = alive
+                bullets[kept] = b
+                kept += 1
+            elif self.store is None:
+                BULLET_POOL.release(b)
+        del bullets[kept:]
 
     def polygon(self):
         # triangle ship
-        tip = pygame.Vector2(0, -16).rotate(self.angle) + self.pos
-        left = pygame.Vector2(-10, 10).rotate(self.angle) + self.pos
-        right = pygame.Vector2(10, 10).rotate(self.angle) + self.pos
-        return [tip, left, right]
-
-    def draw(self, surf):
-        # Blinking animation when invincible
-        if self.invincible and (self.invincibility_timer // 6) % 2 == 0:
-            # Skip drawing every other frame for blinking effect
-            pass
-        else:
-            pygame.draw.polygon(surf, (255,255,255), self.polygon(), 2)
-        
+        return [pygame.Vector2(p).rotate(self.angle) + self.pos for p in SHIP_POINTS]
+
+    def draw(self, surf, alpha=1.0):
+        """Draw the ship and its bullets; returns the rects touched.
+
+        alpha < 1 draws them that far between the previous and current step
+        (the heading is not interpolated; sprites come in SHIP_TURN_SPEED steps anyway).
+        """
+        blink = self.blinking()
+        x, y = self.pos if alpha >= 1.0 else render_position(self.pos, self.prev, alpha)
+        s = SPRITES.scale
+        sprite, offset = SPRITES.ship(self.angle, blink)
+        rects = blit_wrapped(surf, sprite, int(x * s) - offset, int(y * s) - offset)
+
         for b in self.bullets:
-            b.draw(surf)
+            rects.append(b.draw(surf, alpha))
+        if self.gun is not None:
+            rects += self.gun.draw(surf, alpha)
+        return rects
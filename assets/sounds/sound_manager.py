@@ -1,134 +1,284 @@
 # assets/sounds/sound_manager.py
 import pygame
 import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from assets.config import SOUND_ENABLED
+from assets.pack import PACK_PATH, AssetPack, BufferReader
+
+# Define sound file mappings
+SOUND_FILES = {
+    'explosion': 'explosion.wav',
+    'shoot': 'shoot.wav',
+    'collision': 'collision.wav',
+    'powerup': 'powerup.wav',
+    'game_over': 'game_over.wav',
+    'victory': 'victory.wav',
+    'asteroid_hit': 'asteroid_hit.wav',
+    'ship_hit': 'ship_hit.wav'
+}
+
+# Define music file mappings
+MUSIC_FILES = {
+    'background': 'background.wav',  # Using WAV for now
+    'menu': 'menu.wav',
+    'game_over': 'game_over.wav'
+}
+
+MIXER_CHANNELS = 16
+# Sounds that must never be crowded out get a reserved channel of their own
+RESERVED_CHANNELS = {'victory': 0, 'game_over': 0, 'ship_hit': 1}
+# Most voices a single sound may have playing at once
+VOICE_LIMITS = {'shoot': 2, 'asteroid_hit': 2, 'explosion': 3}
+DEFAULT_VOICE_LIMIT = 3
+LOADER_THREADS = 4
 
 class SoundManager:
-    def __init__(self):
-        """Initialize the sound manager and load all game sounds."""
+    def __init__(self, enabled=None):
+        """Initialize the sound manager and start loading all game sounds.
+
+        Sounds decode on a background thread pool and are handed back to the
+        main thread by flush(). Until a sound is ready it plays as silence,
+        and music starts once its file is read, so neither construction nor
+        play_music() waits on disk or decoding.
+        enabled overrides SOUND_ENABLED from assets/config.py when given.
+        """
+        self.enabled = SOUND_ENABLED if enabled is None else enabled
         self.sounds = {}
         self.music_tracks = {}
-        self.sound_enabled = SOUND_ENABLED
-        self.music_enabled = SOUND_ENABLED
+        self.music_data = {}  # music name -> future of the file's bytes
+        self.pack = None
+        self.current_music = None
+        self.current_music_io = None
+        self.sound_enabled = self.enabled
+        self.music_enabled = self.enabled
         self.sound_volume = 0.7
         self.music_volume = 0.5
-        
+        self.pending = []  # sounds requested this frame, played by flush()
+        self.warned = set()
+        self.loader = None
+        self.loading = []
+        self.loaded = queue.SimpleQueue()  # (name, filename, future) from the loader threads
+        self.decoding = 0  # sounds submitted and not yet installed
+        self.music_request = None  # (name, loops) waiting for its file, started by flush()
+
         # Only initialize mixer and load sounds if sound is enabled
-        if SOUND_ENABLED:
+        if self.enabled:
             # Initialize pygame mixer if not already done
             if not pygame.mixer.get_init():
                 pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            
+            pygame.mixer.set_num_channels(MIXER_CHANNELS)
+            pygame.mixer.set_reserved(max(RESERVED_CHANNELS.values()) + 1)
+
             self.load_sounds()
-    
+
+    def _warn(self, message):
+        """Print each distinct warning once instead of every frame."""
+        if message not in self.warned:
+            self.warned.add(message)
+            print(message)
+
+    def _open_pack(self):
+        """The memory-mapped asset pack, if one has been built (build_asset_pack.py)."""
+        if not PACK_PATH.exists():
+            return None
+        try:
+            return AssetPack(PACK_PATH)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring asset pack {PACK_PATH}: {e}")
+            return None
+
     def load_sounds(self):
-        """Load all sound effects and music tracks."""
+        """Load all sound effects and music tracks.
+
+        From the asset pack when there is one: its PCM is already in the
+        mixer's format, so each sound is a view handed straight to Sound().
+        Anything not in the pack is queued for background loading.
+        """
         base_path = Path(__file__).parent
-        
-        # Define sound file mappings
-        sound_files = {
-            'explosion': 'explosion.wav',
-            'shoot': 'shoot.wav',
-            'collision': 'collision.wav',
-            'powerup': 'powerup.wav',
-            'game_over': 'game_over.wav',
-            'victory': 'victory.wav',
-            'asteroid_hit': 'asteroid_hit.wav',
-            'ship_hit': 'ship_hit.wav'
-        }
-        
+        self.loader = ThreadPoolExecutor(max_workers=LOADER_THREADS, thread_name_prefix='sound-loader')
+        silence = pygame.mixer.Sound(buffer=bytes(64))
+        self.pack = self._open_pack()
+        mixer_format = pygame.mixer.get_init()
+
         # Load sound effects
         sfx_path = base_path / 'sfx'
-        for sound_name, filename in sound_files.items():
+        for sound_name, filename in SOUND_FILES.items():
             file_path = sfx_path / filename
-            if file_path.exists():
-                try:
-                    self.sounds[sound_name] = pygame.mixer.Sound(str(file_path))
-                    self.sounds[sound_name].set_volume(self.sound_volume)
-                except pygame.error as e:
-                    print(f"Warning: Could not load sound {filename}: {e}")
+            buffer = self.pack.sound_buffer(sound_name, mixer_format) if self.pack else None
+            if buffer is not None:
+                self.sounds[sound_name] = pygame.mixer.Sound(buffer=buffer)
+                self.sounds[sound_name].set_volume(self.sound_volume)
+            elif file_path.exists():
+                self.sounds[sound_name] = silence
+                future = self.loader.submit(pygame.mixer.Sound, str(file_path))
+                # runs on a loader thread: only queue it, flush() installs it
+                future.add_done_callback(lambda f, name=sound_name, fn=filename: self.loaded.put((name, fn, f)))
+                self.loading.append(future)
+                self.decoding += 1
             else:
                 print(f"Warning: Sound file not found: {file_path}")
-        
-        # Define music file mappings
-        music_files = {
-            'background': 'background.wav',  # Using WAV for now
-            'menu': 'menu.wav',
-            'game_over': 'game_over.wav'
-        }
-        
+
         # Load music tracks
         music_path = base_path / 'music'
-        for music_name, filename in music_files.items():
+        for music_name, filename in MUSIC_FILES.items():
             file_path = music_path / filename
-            if file_path.exists():
+            if self.pack and ('music', music_name) in self.pack.entries:
+                self.music_tracks[music_name] = f"{PACK_PATH}:{music_name}"
+                self.music_data[music_name] = Future()
+                self.music_data[music_name].set_result(self.pack.view('music', music_name))
+            elif file_path.exists():
                 self.music_tracks[music_name] = str(file_path)
+                self.music_data[music_name] = self.loader.submit(file_path.read_bytes)
+                self.loading.append(self.music_data[music_name])
             else:
                 print(f"Warning: Music file not found: {file_path}")
-    
+
+    def _sound_loaded(self, sound_name, filename, future):
+        """Swap a finished sound in for its silence; main thread only."""
+        self.decoding -= 1
+        if future.cancelled():
+            return
+        try:
+            sound = future.result()
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load sound {filename}: {e}")
+            self.sounds.pop(sound_name, None)
+            return
+        sound.set_volume(self.sound_volume)
+        self.sounds[sound_name] = sound
+
+    def wait_until_loaded(self, timeout=None):
+        """Block until every queued sound and track has finished loading."""
+        for future in list(self.loading):
+            try:
+                future.result(timeout)
+            except (pygame.error, OSError):
+                pass  # reported by _sound_loaded
+        while self.decoding:  # done, but their callbacks may not have queued them yet
+            self._sound_loaded(*self.loaded.get())
+
+    def _install_loaded(self):
+        while not self.loaded.empty():
+            self._sound_loaded(*self.loaded.get())
+
     def play_sound(self, sound_name):
-        """Play a sound effect."""
+        """Request a sound effect; it plays on the next flush().
+
+        Asking for the same sound several times in one frame plays it once.
+        """
         if not self.sound_enabled:
             return
-        
-        if sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except pygame.error as e:
-                print(f"Error playing sound {sound_name}: {e}")
-        else:
-            print(f"Warning: Sound '{sound_name}' not found")
-    
+
+        if sound_name not in self.pending:
+            self.pending.append(sound_name)
+
+    def flush(self):
+        """Install sounds that finished loading, start music whose file is now
+        read, and play this frame's requested sounds; call once per frame."""
+        if not self.loaded.empty():
+            self._install_loaded()
+        if self.music_request is not None and self.music_data[self.music_request[0]].done():
+            self._start_music(*self.music_request)
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = []
+        for sound_name in pending:
+            self._play_now(sound_name)
+
+    def _play_now(self, sound_name):
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            self._warn(f"Warning: Sound '{sound_name}' not found")
+            return
+        try:
+            reserved = RESERVED_CHANNELS.get(sound_name)
+            if reserved is not None:
+                pygame.mixer.Channel(reserved).play(sound)
+            elif sound.get_num_channels() < VOICE_LIMITS.get(sound_name, DEFAULT_VOICE_LIMIT):
+                sound.play()
+        except pygame.error as e:
+            self._warn(f"Error playing sound {sound_name}: {e}")
+
     def play_music(self, music_name, loops=-1):
-        """Play background music."""
+        """Play background music from its in-memory copy.
+
+        If the file is still being read, it starts from flush() once it is.
+        """
         if not self.music_enabled:
             return
-        
+
         if music_name in self.music_tracks:
-            try:
-                pygame.mixer.music.load(self.music_tracks[music_name])
-                pygame.mixer.music.set_volume(self.music_volume)
-                pygame.mixer.music.play(loops)
-            except pygame.error as e:
-                print(f"Error playing music {music_name}: {e}")
+            self.music_request = (music_name, loops)
+            if self.music_data[music_name].done():
+                self._start_music(music_name, loops)
         else:
-            print(f"Warning: Music '{music_name}' not found")
-    
+            self._warn(f"Warning: Music '{music_name}' not found")
+
+    def _start_music(self, music_name, loops):
+        self.music_request = None
+        if not self.music_enabled:
+            return
+        try:
+            if music_name != self.current_music:
+                data = self.music_data[music_name].result()
+                # music streams from the buffer, so keep it referenced while loaded
+                self.current_music_io = BufferReader(data)
+                pygame.mixer.music.load(self.current_music_io, 'wav')
+                self.current_music = music_name
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(loops)
+        except (pygame.error, OSError) as e:
+            self._warn(f"Error playing music {music_name}: {e}")
+
     def stop_music(self):
         """Stop background music."""
+        self.music_request = None
         pygame.mixer.music.stop()
-    
+
     def pause_music(self):
         """Pause background music."""
         pygame.mixer.music.pause()
-    
+
     def unpause_music(self):
         """Unpause background music."""
         pygame.mixer.music.unpause()
-    
+
     def set_sound_volume(self, volume):
         """Set sound effects volume (0.0 to 1.0)."""
         self.sound_volume = max(0.0, min(1.0, volume))
         for sound in self.sounds.values():
             sound.set_volume(self.sound_volume)
-    
+
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)."""
         self.music_volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.music_volume)
-    
+
     def toggle_sound(self):
         """Toggle sound effects on/off."""
         self.sound_enabled = not self.sound_enabled
-    
+        self.pending = []
+
     def toggle_music(self):
         """Toggle music on/off."""
         self.music_enabled = not self.music_enabled
         if not self.music_enabled:
             self.stop_music()
-    
+
     def cleanup(self):
         """Clean up sound resources."""
-        if SOUND_ENABLED and pygame.mixer.get_init():
+        if self.loader is not None:
+            self.loader.shutdown(wait=True, cancel_futures=True)
+            self.loader = None
+        if self.enabled and pygame.mixer.get_init():
             pygame.mixer.quit()
+        if self.pack is not None:
+            # drop the views into the mapping first, so close() can unmap it
+            self.sounds.clear()
+            self.music_data.clear()
+            self.current_music = self.current_music_io = self.music_request = None
+            self.pack.close()
+            self.pack = None
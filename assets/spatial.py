@@ -0,0 +1,238 @@
+# assets/spatial.py
+from assets.config import WORLD_W, WORLD_H
+from assets.asteroids import SIZE_RADIUS
+
+# A cell at least as wide as the biggest asteroid radius means anything within
+# reach of a point sits in that point's cell or one of its 8 neighbours.
+CELL_SIZE = max(SIZE_RADIUS.values())
+
+class SpatialHash:
+    """Uniform grid over the wrapped world, bucketing asteroids by centre.
+
+    The grid wraps like the world does, so the neighbours of an edge cell
+    include the cells on the opposite side.
+    """
+    def __init__(self, cell_size=CELL_SIZE, width=WORLD_W, height=WORLD_H):
+        # whole number of cells per axis so the wrap lines up with the grid
+        self.cols = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self.cell_w = width / self.cols
+        self.cell_h = height / self.rows
+        self.cells = {}
+        self._neighbours = {}
+
+    def _cell(self, pos):
+        cx = int(pos[0] // self.cell_w) % self.cols
+        cy = int(pos[1] // self.cell_h) % self.rows
+        return cx, cy
+
+    def _around(self, cell):
+        """The 3x3 block of cells around cell, wrapped and without repeats."""
+        keys = self._neighbours.get(cell)
+        if keys is None:
+            cx, cy = cell
+            keys = []
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    key = ((cx + dx) % self.cols, (cy + dy) % self.rows)
+                    if key not in keys:
+                        keys.append(key)
+            self._neighbours[cell] = keys
+        return keys
+
+    def clear(self):
+        self.cells.clear()
+
+    def rebuild(self, items):
+        """Re-bucket every item; call once per frame after things have moved."""
+        self.cells.clear()
+        for item in items:
+            self.insert(item)
+
+    def insert(self, item):
+        cell = self._cell(item.pos)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            self.cells[cell] = [item]
+        else:
+            bucket.append(item)
+
+    def remove(self, item):
+        bucket = self.cells.get(self._cell(item.pos))
+        if bucket and item in bucket:
+            bucket.remove(item)
+
+    def query(self, pos):
+        """Yield every item that could be within CELL_SIZE of pos."""
+        cells = self.cells
+        for key in self._around(self._cell(pos)):
+            bucket = cells.get(key)
+            if bucket:
+                yield from bucket
+
+
+LETTER_CELL_FILL = 1    # asteroids per cell a letter's grid is sized for
+LETTER_SCAN_MAX = 24   # letters with at most this many asteroids are scanned, not gridded
+
+class LetterIndex:
+    """Asteroids by letter, for "nearest asteroid carrying one of these letters".
+
+    track() is called once per step and costs nothing; the first query
+    after it sorts the asteroids by letter, and each letter's grid is
+    only built when a query needs it, with cells sized to hold about
+    LETTER_CELL_FILL of that letter's asteroids. Letters with few
+    asteroids are scanned outright; the rest are searched ring by ring
+    outward from the query cell until nothing closer can remain.
+    Distances are measured the short way round the wrapped world, as
+    wrap_delta does.
+    """
+    def __init__(self, width=WORLD_W, height=WORLD_H):
+        self.width = width
+        self.height = height
+        self.source = []
+        self.stale = False
+        self.letters = {}  # letter -> asteroids
+        self.grids = {}    # letter -> (cols, rows, cell_w, cell_h, {cell: asteroids}), built on demand
+        self.rings = {}    # (r, cols, rows) -> cell offsets, kept across frames; no key names a position
+
+    def track(self, asteroids):
+        """Index asteroids (as they stand at the next query)."""
+        self.source = asteroids
+        self.stale = True
+
+    def _refresh(self):
+        letters = {}
+        for a in self.source:
+            bucket = letters.get(a.letter)
+            if bucket is None:
+                letters[a.letter] = [a]
+            else:
+                bucket.append(a)
+        self.letters = letters
+        self.grids = {}
+        self.stale = False
+
+    def _grid(self, letter):
+        grid = self.grids.get(letter)
+        if grid is None:
+            items = self.letters[letter]
+            cell = (self.width * self.height * LETTER_CELL_FILL / len(items)) ** 0.5
+            cols = max(1, int(self.width // cell))
+            rows = max(1, int(self.height // cell))
+            cw, ch = self.width / cols, self.height / rows
+            cells = {}
+            for a in items:
+                key = (int(a.pos[0] // cw) % cols, int(a.pos[1] // ch) % rows)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [a]
+                else:
+                    bucket.append(a)
+            grid = self.grids[letter] = (cols, rows, cw, ch, cells)
+        return grid
+
+    def _ring(self, cx, cy, r, cols, rows):
+        """Cells at Chebyshev distance r from (cx, cy), wrapped, without repeats."""
+        key = (r, cols, rows)
+        offsets = self.rings.get(key)
+        if offsets is None:
+            offsets = self.rings[key] = self._ring_offsets(r, cols, rows)
+        return [((cx + dx) % cols, (cy + dy) % rows) for dx, dy in offsets]
+
+    @staticmethod
+    def _ring_offsets(r, cols, rows):
+        """The ring around cell (0, 0), which is every ring moved to its centre."""
+        if r == 0:
+            return [(0, 0)]
+        cells = [(dx, -r) for dx in range(-r, r + 1)]
+        cells += [(dx, r) for dx in range(-r, r + 1)]
+        cells += [(-r, dy) for dy in range(-r + 1, r)]
+        cells += [(r, dy) for dy in range(-r + 1, r)]
+        cells = [(x % cols, y % rows) for x, y in cells]
+        if 2 * r + 1 > cols or 2 * r + 1 > rows:
+            # on a small grid the ring wraps onto itself and onto inner rings
+            cells = [(x, y) for x, y in dict.fromkeys(cells)
+                     if max(min(x, cols - x), min(y, rows - y)) == r]
+        return cells
+
+    def _search(self, pos, letter, k, radius):
+        """Up to k (squared distance, asteroid) of one letter, nearest first, none beyond radius."""
+        w, h = self.width, self.height
+        hw, hh = w / 2, h / 2
+        px, py = pos[0], pos[1]
+        limit = radius * radius
+        found = []
+        items = self.letters.get(letter)
+        if not items:
+            return found
+        if len(items) <= LETTER_SCAN_MAX:
+            return self._scan(items, pos, None, k, limit)
+        cols, rows, cw, ch, cells = self._grid(letter)
+        cx = int(px // cw) % cols
+        cy = int(py // ch) % rows
+        step = min(cw, ch)
+        # how far pos is from the edge of its own cell
+        fx = px % w - cx * cw
+        fy = py % h - cy * ch
+        margin = min(fx, cw - fx, fy, ch - fy)
+        for r in range(max(cols, rows) // 2 + 1):
+            # anything in ring r or beyond is outside the block of r - 1 rings around pos's cell
+            floor = (r - 1) * step + margin if r else 0.0
+            floor *= floor
+            if floor > limit or (len(found) >= k and found[k - 1][0] <= floor):
+                break
+            for key in self._ring(cx, cy, r, cols, rows):
+                bucket = cells.get(key)
+                if bucket:
+                    for a in bucket:
+                        dx = (a.pos[0] - px + hw) % w - hw
+                        dy = (a.pos[1] - py + hh) % h - hh
+                        d = dx*dx + dy*dy
+                        if d <= limit:
+                            found.append((d, a))
+            if len(found) > k:
+                found.sort(key=_first)
+                del found[k:]
+        found.sort(key=_first)
+        return found[:k]
+
+    def _scan(self, items, pos, letters, k, limit):
+        w, h = self.width, self.height
+        hw, hh = w / 2, h / 2
+        px, py = pos[0], pos[1]
+        found = []
+        for a in items:
+            if letters is not None and a.letter not in letters:
+                continue
+            dx = (a.pos[0] - px + hw) % w - hw
+            dy = (a.pos[1] - py + hh) % h - hh
+            d = dx*dx + dy*dy
+            if d <= limit:
+                found.append((d, a))
+        found.sort(key=_first)
+        return found[:k]
+
+    def nearest(self, pos, letters=None, k=1, radius=float('inf')):
+        """The k asteroids nearest pos carrying any of letters (every letter
+        if None), as (distance, asteroid), nearest first."""
+        if len(self.source) <= LETTER_SCAN_MAX:
+            # a small field: one pass beats sorting it by letter first
+            return [(d ** 0.5, a) for d, a in self._scan(self.source, pos, letters, k, radius * radius)]
+        if self.stale:
+            self._refresh()
+        if letters is None:
+            letters = self.letters
+        found = []
+        for letter in letters:
+            found += self._search(pos, letter, k, radius)
+        if len(letters) > 1:
+            found.sort(key=_first)
+        return [(d ** 0.5, a) for d, a in found[:k]]
+
+    def within(self, pos, radius, letters=None):
+        """Every asteroid within radius of pos carrying any of letters, nearest first."""
+        return self.nearest(pos, letters, len(self.source), radius)
+
+
+def _first(entry):
+    return entry[0]
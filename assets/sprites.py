@@ -0,0 +1,114 @@
+# assets/sprites.py
+import pygame
+
+# The shapes come from the modules that draw them, and those modules import
+# SPRITES, so the shape constants are imported inside the (cache miss) builders.
+
+def _prepare(surf):
+    """Black is see-through; convert to the display format once there is one."""
+    surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return surf
+
+class SpriteCache:
+    """Pre-rendered asteroid, ship and heart surfaces, so drawing is a blit.
+
+    Everything is built lazily on first use, after the display exists, so
+    importing this module costs nothing and headless runs never touch it.
+    """
+    def __init__(self, turn_step=None):
+        self.turn_step = turn_step  # one ship sprite per turn step; None means SHIP_TURN_SPEED
+        self.headings = None  # how many sprites go round the circle, set with the first ship
+        self._asteroids = {}
+        self._ship = {}
+        self._heart = None
+        self.outline = 2  # asteroid outline width in pixels
+        self.scale = 1.0  # drawing pixels per world unit; see assets/canvas.py
+
+    def set_scale(self, scale):
+        """Draw everything this many times its world size; the sprites are redrawn on next use."""
+        if scale != self.scale:
+            self.scale = scale
+            self.clear()
+
+    def set_outline(self, width):
+        """Change the asteroid outline width; the sprites are redrawn on next use."""
+        if width != self.outline:
+            self.outline = width
+            self._asteroids.clear()
+
+    def asteroid(self, size):
+        """(surface, offset) for an asteroid outline of this size."""
+        entry = self._asteroids.get(size)
+        if entry is None:
+            from assets.asteroids import SIZE_RADIUS, SIZE_COLOR
+            r = round(SIZE_RADIUS[size] * self.scale)
+            surf = pygame.Surface((2*r + 2, 2*r + 2))
+            pygame.draw.circle(surf, SIZE_COLOR[size], (r + 1, r + 1), r, max(1, round(self.outline * self.scale)))
+            entry = (_prepare(surf), r + 1)
+            self._asteroids[size] = entry
+        return entry
+
+    def ship(self, angle, blink=False):
+        """(surface, offset) for the ship at angle; blink picks the dim variant."""
+        if self.headings is None:
+            if self.turn_step is None:
+                from assets.ship import SHIP_TURN_SPEED
+                self.turn_step = SHIP_TURN_SPEED
+            # one sprite for every heading the ship can actually have; the
+            # step is a float once it comes from a per-second turn speed
+            self.headings = round(360 / self.turn_step)
+        step = round(angle / self.turn_step) % self.headings
+        entry = self._ship.get((step, blink))
+        if entry is None:
+            from assets.ship import SHIP_COLOR, SHIP_BLINK_COLOR, SHIP_POINTS
+            s = self.scale
+            half = round(max(max(abs(x), abs(y)) for x, y in SHIP_POINTS) * s) + 2
+            surf = pygame.Surface((2*half, 2*half))
+            center = pygame.Vector2(half, half)
+            pts = [pygame.Vector2(p).rotate(step * self.turn_step) * s + center for p in SHIP_POINTS]
+            pygame.draw.polygon(surf, SHIP_BLINK_COLOR if blink else SHIP_COLOR, pts, max(1, round(2 * s)))
+            entry = (_prepare(surf), half)
+            self._ship[(step, blink)] = entry
+        return entry
+
+    def heart(self):
+        if self._heart is None:
+            from assets.hearts import HEART_COLOR, _heart_points
+            pts = _heart_points(0, 0, self.scale)
+            w = int(max(x for x, _ in pts)) + 1
+            h = int(max(y for _, y in pts)) + 1
+            surf = pygame.Surface((w, h))
+            pygame.draw.polygon(surf, HEART_COLOR, pts)
+            self._heart = _prepare(surf)
+        return self._heart
+
+    def clear(self):
+        """Drop everything, e.g. after the display mode changes."""
+        self._asteroids.clear()
+        self._ship.clear()
+        self._heart = None
+
+
+SPRITES = SpriteCache()
+
+
+def blit_wrapped(surf, sprite, x, y):
+    """Blit sprite at (x, y) and again on the far side of any edge it hangs over.
+
+    Returns the on-screen rects that were drawn, one per piece.
+    """
+    w, h = surf.get_size()
+    sw, sh = sprite.get_size()
+    rect = surf.blit(sprite, (x, y))
+    if 0 <= x and x + sw <= w and 0 <= y and y + sh <= h:
+        return [rect]
+    xs = (x, x + w) if x < 0 else (x, x - w) if x + sw > w else (x,)
+    ys = (y, y + h) if y < 0 else (y, y - h) if y + sh > h else (y,)
+    rects = [rect]
+    for ox in xs:
+        for oy in ys:
+            if ox != x or oy != y:
+                rects.append(surf.blit(sprite, (ox, oy)))
+    return rects
@@ -0,0 +1,91 @@
+# assets/startup.py
+import os
+import sys
+import time
+import builtins
+
+def _process_start():
+    """perf_counter() value at which the process started, where Linux says; else now."""
+    now_wall, now_perf = time.time(), time.perf_counter()
+    try:
+        with open('/proc/self/stat') as f:
+            # field 22, counted after the ')' that closes the command name
+            ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/stat') as f:
+            boot = next(int(line.split()[1]) for line in f if line.startswith('btime'))
+        started_wall = boot + ticks / os.sysconf('SC_CLK_TCK')
+        return now_perf - max(0.0, now_wall - started_wall)
+    except (OSError, ValueError, IndexError, StopIteration, AttributeError):
+        return now_perf
+
+
+class StartupProfiler:
+    """Where the time goes between process start and the first frame.
+
+    track_imports() times every module imported from then on (nested imports
+    are indented under their parent); phase() times a named block such as a
+    subsystem init. report() prints both against time since process start.
+    """
+    def __init__(self):
+        self.origin = _process_start()
+        self.created = time.perf_counter()
+        self.records = []  # (start, duration, depth, label)
+        self.depth = 0
+        self._import = None
+
+    def track_imports(self):
+        if self._import is not None:
+            return
+        original = self._import = builtins.__import__
+        profiler = self
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            profiler.depth += 1
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                profiler.depth -= 1
+                profiler.records.append((start, time.perf_counter() - start, profiler.depth, f"import {name}"))
+
+        builtins.__import__ = timed_import
+
+    def stop_tracking_imports(self):
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    def phase(self, label):
+        return _Phase(self, label)
+
+    def mark(self, label):
+        """A zero-length event, e.g. 'first frame presented'."""
+        self.records.append((time.perf_counter(), 0.0, self.depth, label))
+
+    def report(self, file=None):
+        file = file or sys.stdout
+        print(f"Startup profile (ms since process start):", file=file)
+        print(f"  {0.0:9.1f} {(self.created - self.origin) * 1000:9.1f}  interpreter start-up", file=file)
+        for start, duration, depth, label in sorted(self.records, key=lambda r: (r[0], r[2])):
+            print(f"  {(start - self.origin) * 1000:9.1f} {duration * 1000:9.1f}  {'  ' * depth}{label}", file=file)
+
+
+class _Phase:
+    def __init__(self, profiler, label):
+        self.profiler = profiler
+        self.label = label
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.profiler.depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.depth -= 1
+        self.profiler.records.append((self.start, time.perf_counter() - self.start, self.profiler.depth, self.label))
+        return False
+
+
+PROFILER = StartupProfiler()
@@ -0,0 +1,155 @@
+# assets/swarm.py
+import pygame
+from assets.config import SCREEN_W, SCREEN_H, wrap_position, wrap_delta, render_position
+from assets.asteroids import SIZE_RADIUS, SIZE_COLOR, ASTEROID_SPEED
+from assets.bullet import BULLET_SPEED, BULLET_LIFETIME
+from assets.ship import SHIP_MAX_SPEED
+from assets.sprites import SPRITES
+from assets.text_cache import GLYPHS
+
+FAR_UPDATE_EVERY = 8  # a far asteroid moves once every this many steps, that many steps at a time
+MAX_ASTEROID_SPEED = ASTEROID_SPEED[1] * 1.2 ** 2  # fastest spawn speed, sped up by two splits
+# Beyond this nothing can touch an asteroid before its next far update: a bullet
+# flies BULLET_SPEED * BULLET_LIFETIME from where the ship was, the ship can have
+# moved on since, and both sides close in for FAR_UPDATE_EVERY steps.
+ACTIVE_RADIUS = (BULLET_SPEED * BULLET_LIFETIME + SHIP_MAX_SPEED * BULLET_LIFETIME + max(SIZE_RADIUS.values())
+                 + FAR_UPDATE_EVERY * (MAX_ASTEROID_SPEED + SHIP_MAX_SPEED))
+HYSTERESIS = 1.1  # active asteroids leave only past ACTIVE_RADIUS * HYSTERESIS
+
+LOD_GLYPH_RANGE = 300  # letters are drawn only this close to the ship...
+LOD_DOT_RANGE = 380    # ...and small asteroids further out than this are a single dot
+
+class FarField:
+    """Asteroids too far from the ship to be shot, hit or seen.
+
+    GameState.asteroids holds only the active asteroids near the ship;
+    those are gridded, collided and moved every step. The rest wait here
+    in FAR_UPDATE_EVERY buckets. Each step moves one bucket by that many
+    steps' worth of velocity, so every asteroid follows exactly the path it
+    would have, at an eighth of the Python calls. step() also trades
+    asteroids between the two sets as the ship moves.
+    """
+    def __init__(self, radius=ACTIVE_RADIUS, every=FAR_UPDATE_EVERY):
+        self.every = every
+        self.enter = radius * radius
+        self.leave = (radius * HYSTERESIS) ** 2
+        self.buckets = [[] for _ in range(every)]
+        self.phase = 0
+
+    def __len__(self):
+        return sum(len(b) for b in self.buckets)
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+    def clear(self):
+        for bucket in self.buckets:
+            bucket.clear()
+
+    def step(self, active, focus):
+        """Move this step's bucket, then swap asteroids with active (a list,
+        changed in place) by their distance from focus, the ship."""
+        k = self.every
+        bucket = self.buckets[self.phase]
+        kept = []
+        for a in bucket:
+            pos = a.pos
+            pos.x += a.vel.x * k
+            pos.y += a.vel.y * k
+            pos.xy = wrap_position(pos)
+            a.prev.update(pos)  # no drawing along the jump: it lands in one go
+            dx, dy = wrap_delta(focus, pos)
+            if dx*dx + dy*dy < self.enter:
+                active.append(a)  # up to date as of this step, like the active ones
+            else:
+                kept.append(a)
+        # active asteroids that drifted out are next moved k steps from now
+        leave = self.leave
+        n = 0
+        for a in active:
+            dx, dy = wrap_delta(focus, a.pos)
+            if dx*dx + dy*dy > leave:
+                kept.append(a)
+            else:
+                active[n] = a
+                n += 1
+        del active[n:]
+        self.buckets[self.phase] = kept
+        self.phase = (self.phase + 1) % k
+
+
+class Camera:
+    """A screen-sized window onto the wrapped world, centred on a point."""
+    def __init__(self, width=SCREEN_W, height=SCREEN_H):
+        self.width = width
+        self.height = height
+        self.center = (width / 2, height / 2)
+
+    def follow(self, pos):
+        self.center = (pos[0], pos[1])
+
+    @property
+    def origin(self):
+        """World position of the view's top-left corner."""
+        return (self.center[0] - self.width / 2, self.center[1] - self.height / 2)
+
+    def to_screen(self, pos, margin=0):
+        """Screen position of pos, the short way round the wrap, or None if
+        it is more than margin outside the view."""
+        dx, dy = wrap_delta(self.center, pos)
+        x = dx + self.width / 2
+        y = dy + self.height / 2
+        if -margin <= x <= self.width + margin and -margin <= y <= self.height + margin:
+            return x, y
+        return None
+
+
+def draw_world(surf, state, camera, font, alpha=1.0, small_glyphs=True):
+    """draw_frame's entity pass for a camera view; returns the rects touched.
+
+    Only active asteroids can be on screen, and of those only the ones in
+    the view are drawn: full (outline and letter) near the ship, outline
+    only further out, and small ones a single dot at the edges of the view.
+    small_glyphs=False leaves the letters off small asteroids everywhere.
+    The camera works in world units; surf has SPRITES.scale pixels to one.
+    """
+    rects = []
+    to_screen = camera.to_screen
+    s = SPRITES.scale
+    cx, cy = camera.width / 2, camera.height / 2
+    glyph_range = LOD_GLYPH_RANGE * LOD_GLYPH_RANGE
+    dot_range = LOD_DOT_RANGE * LOD_DOT_RANGE
+    for a in state.asteroids:
+        size = a.size
+        radius = SIZE_RADIUS[size]
+        at = to_screen(a.pos if alpha >= 1.0 else render_position(a.pos, a.prev, alpha), radius)
+        if at is None:
+            continue
+        x, y = at
+        d = (x - cx) * (x - cx) + (y - cy) * (y - cy)
+        x, y = x * s, y * s
+        if size == 1 and d > dot_range:
+            rects.append(surf.fill(SIZE_COLOR[size], (int(x), int(y), 1, 1)))
+            continue
+        sprite, offset = SPRITES.asteroid(size)
+        rects.append(surf.blit(sprite, (int(x) - offset, int(y) - offset)))
+        if font and d <= glyph_range and (small_glyphs or size > 1):
+            txt = GLYPHS.get(font, a.letter, (255,255,0))
+            rects.append(surf.blit(txt, txt.get_rect(center=(x, y))))
+
+    if state.particles is not None:
+        rects += state.particles.draw(surf, alpha, camera.origin)
+
+    ship = state.ship
+    at = to_screen(ship.pos if alpha >= 1.0 else render_position(ship.pos, ship.prev, alpha), 20)
+    if at is not None:
+        sprite, offset = SPRITES.ship(ship.angle, ship.blinking())
+        rects.append(surf.blit(sprite, (int(at[0] * s) - offset, int(at[1] * s) - offset)))
+    for b in ship.bullets:
+        at = to_screen(b.pos if alpha >= 1.0 else render_position(b.pos, b.prev, alpha))
+        if at is not None:
+            rects.append(pygame.draw.rect(surf, (255, 255, 255), (at[0] * s, at[1] * s, 2, 2)))
+    if ship.gun is not None:
+        rects += ship.gun.draw(surf, alpha, camera.origin)
+    return rects
@@ -0,0 +1,39 @@
+# assets/text_cache.py
+import pygame
+
+from assets.config import FONT_FILE
+
+def load_font(size):
+    """FONT_FILE (or pygame's bundled default font) at size, with no system font scan."""
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return pygame.font.Font(FONT_FILE, size)
+
+
+class GlyphCache:
+    """Rendered text surfaces keyed by (font, text, color).
+
+    Meant for the small, fixed set of strings drawn over and over, like
+    the 26 asteroid letters. A hit is a single dict lookup; once max_items
+    is reached the oldest entry is dropped to make room.
+    """
+    def __init__(self, max_items=512):
+        self.max_items = max_items
+        self.surfaces = {}
+
+    def get(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = font.render(text, antialias, color)
+            if len(self.surfaces) >= self.max_items:
+                del self.surfaces[next(iter(self.surfaces))]
+            self.surfaces[key] = surf
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# shared by everything that draws text
+GLYPHS = GlyphCache()
@@ -0,0 +1,294 @@
+# assets/world.py
+import random
+import pygame
+try:
+    import numpy as np
+except ImportError:  # the store is optional; plain Asteroid/Bullet objects need no numpy
+    np = None
+
+from assets.config import WORLD_W, WORLD_H
+from assets.asteroids import Asteroid, SIZE_HP, SIZE_RADIUS, ASTEROID_SPEED
+from assets.bullet import Bullet, BULLET_SPEED, BULLET_LIFETIME
+from assets.spatial import SpatialHash
+
+ASTEROID = 0
+BULLET = 1
+
+# offsets of the 3x3 block of grid cells around a cell
+_NEIGHBOUR_DX = (-1, 0, 1, -1, 0, 1, -1, 0, 1)
+_NEIGHBOUR_DY = (-1, -1, -1, 0, 0, 0, 1, 1, 1)
+
+def first_free(chooser, choice):
+    """One-to-one matching from candidate pairs, taken greedily.
+
+    chooser and choice are parallel arrays grouped by chooser in turn order,
+    each group in order of preference. Every chooser takes its first choice
+    that an earlier chooser has not taken. Returns the (chooser, choice)
+    pairs kept, in turn order.
+    """
+    first = np.flatnonzero(np.r_[True, chooser[1:] != chooser[:-1]])
+    picked = choice[first]
+    if len(np.unique(picked)) == len(picked):
+        return chooser[first], picked  # no two want the same one: nobody has to move on
+    taken = set()
+    kept_chooser, kept_choice = [], []
+    for c, t in zip(chooser.tolist(), choice.tolist()):
+        if t not in taken and (not kept_chooser or kept_chooser[-1] != c):
+            taken.add(t)
+            kept_chooser.append(c)
+            kept_choice.append(t)
+    return np.array(kept_chooser, np.intp), np.array(kept_choice, np.intp)
+
+class EntityStore:
+    """Asteroids and bullets kept as rows of contiguous NumPy arrays.
+
+    Each entity owns a slot. Freed slots are recycled, and a per-slot
+    generation number lets a stale view tell that its slot was reused.
+    update() moves, wraps and ages every live entity in a few array
+    operations instead of one Python call per object.
+    """
+    def __init__(self, capacity=256, rng=random):
+        if np is None:
+            raise RuntimeError("EntityStore needs numpy (pip install numpy)")
+        self.rng = rng
+        self.capacity = 0
+        self.high = 0  # one past the highest slot ever handed out
+        self.pos = np.zeros((0, 2))
+        self.prev = np.zeros((0, 2))  # pos before the last update(), for drawing between steps
+        self.vel = np.zeros((0, 2))
+        self.size = np.zeros(0, np.int8)
+        self.hp = np.zeros(0, np.int16)
+        self.letter = np.zeros(0, np.uint8)
+        self.age = np.zeros(0, np.int32)
+        self.kind = np.zeros(0, np.int8)
+        self.alive = np.zeros(0, bool)
+        self.gen = np.zeros(0, np.int64)
+        self.views = []
+        self._free = []
+        self._grow(capacity)
+
+        self.bounds = np.array([WORLD_W, WORLD_H], float)
+        self.radius_lut = np.zeros(max(SIZE_RADIUS) + 1)
+        for size, radius in SIZE_RADIUS.items():
+            self.radius_lut[size] = radius
+        grid = SpatialHash()
+        self._grid = (grid.cols, grid.rows, grid.cell_w, grid.cell_h)
+
+    def _grow(self, capacity):
+        old = self.capacity
+        for name in ('pos', 'prev', 'vel', 'size', 'hp', 'letter', 'age', 'kind', 'alive', 'gen'):
+            arr = getattr(self, name)
+            grown = np.zeros((capacity,) + arr.shape[1:], arr.dtype)
+            grown[:old] = arr
+            setattr(self, name, grown)
+        self.views.extend([None] * (capacity - old))
+        # pop() hands out the lowest free slot first, keeping `high` small
+        self._free = list(range(capacity - 1, old - 1, -1)) + self._free
+        self.capacity = capacity
+
+    def __len__(self):
+        return int(self.alive[:self.high].sum())
+
+    def _alloc(self, kind, pos, vel):
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.high = max(self.high, slot + 1)
+        self.kind[slot] = kind
+        self.pos[slot] = pos
+        self.prev[slot] = pos
+        self.vel[slot] = vel
+        self.age[slot] = 0
+        self.alive[slot] = True
+        return slot
+
+    def free(self, slot):
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.vel[slot] = 0  # dead rows still get integrated; keep them still
+        self.gen[slot] += 1
+        self.views[slot] = None
+        self._free.append(int(slot))
+
+    def clear(self):
+        for slot in np.flatnonzero(self.alive[:self.high]):
+            self.free(slot)
+
+    def add_asteroid(self, pos, size=3, letter=None):
+        """Same random draws as Asteroid.__init__, returning an AsteroidView."""
+        ang = self.rng.uniform(0, 360)
+        speed = self.rng.uniform(*ASTEROID_SPEED)
+        vel = pygame.Vector2(speed, 0).rotate(ang)
+        letter = letter or chr(self.rng.randint(65, 90))
+        slot = self._alloc(ASTEROID, pos, vel)
+        self.size[slot] = size
+        self.hp[slot] = SIZE_HP[size]
+        self.letter[slot] = ord(letter)
+        view = AsteroidView(self, slot)
+        self.views[slot] = view
+        return view
+
+    def add_bullet(self, pos, angle):
+        slot = self._alloc(BULLET, pos, pygame.Vector2(0, -BULLET_SPEED).rotate(angle))
+        view = BulletView(self, slot)
+        self.views[slot] = view
+        return view
+
+    def update(self):
+        """Move, wrap and age everything; expired bullets are freed."""
+        n = self.high
+        live = self.alive[:n]
+        pos = self.pos[:n]
+        self.prev[:n] = pos
+        pos += self.vel[:n]
+        np.mod(pos, self.bounds, out=pos)
+        self.age[:n] += live
+        expired = live & (self.kind[:n] == BULLET) & (self.age[:n] >= BULLET_LIFETIME)
+        for slot in np.flatnonzero(expired):
+            self.free(slot)
+
+    def _wrapped(self, d):
+        """Fold (N, 2) deltas so they measure the short way round the world."""
+        half = self.bounds / 2
+        d += half
+        np.mod(d, self.bounds, out=d)
+        d -= half
+        return d
+
+    def asteroid_at(self, point):
+        """First live asteroid whose circle contains point, or None."""
+        n = self.high
+        slots = np.flatnonzero(self.alive[:n] & (self.kind[:n] == ASTEROID))
+        if not len(slots):
+            return None
+        d = self._wrapped(self.pos[slots] - (point[0], point[1]))
+        r = self.radius_lut[self.size[slots]]
+        hits = slots[(d * d).sum(1) <= r * r]
+        return self.views[hits[0]] if len(hits) else None
+
+    def bullet_hits(self):
+        """Pair each bullet with the asteroid it hits this frame.
+
+        Returns (bullet_slots, asteroid_slots). A bullet hits at most one
+        asteroid and an asteroid takes at most one bullet, as in
+        bullets_vs_asteroids, which this matches hit for hit: bullets take
+        their turns in slot order and try asteroids in the SpatialHash's
+        query order. Asteroids are bucketed by grid cell with a sort, so the
+        candidate pairs come from each bullet's 3x3 block of cells rather
+        than from every asteroid.
+        """
+        empty = np.empty(0, np.intp)
+        n = self.high
+        live = self.alive[:n]
+        kind = self.kind[:n]
+        ast = np.flatnonzero(live & (kind == ASTEROID))
+        bul = np.flatnonzero(live & (kind == BULLET))
+        if not len(ast) or not len(bul):
+            return empty, empty
+
+        cols, rows, cw, ch = self._grid
+        apos = self.pos[ast]
+        acell = (apos[:, 0] // cw).astype(np.intp) % cols + (apos[:, 1] // ch).astype(np.intp) % rows * cols
+        order = np.argsort(acell, kind='stable')
+        ast = ast[order]
+        start = np.searchsorted(acell[order], np.arange(cols * rows + 1))
+
+        bpos = self.pos[bul]
+        bx = (bpos[:, 0] // cw).astype(np.intp)
+        by = (bpos[:, 1] // ch).astype(np.intp)
+        cells = ((by[:, None] + _NEIGHBOUR_DY) % rows * cols + (bx[:, None] + _NEIGHBOUR_DX) % cols).ravel()
+        lo = start[cells]
+        count = start[cells + 1] - lo
+        total = int(count.sum())
+        if not total:
+            return empty, empty
+
+        # expand each (bullet, cell) range into one row per candidate asteroid
+        owner = np.repeat(np.repeat(np.arange(len(bul)), 9), count)
+        offset = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+        cand = ast[np.repeat(lo, count) + offset]
+
+        d = self._wrapped(bpos[owner] - self.pos[cand])
+        r = self.radius_lut[self.size[cand]]
+        hit = (d * d).sum(1) <= r * r
+        if not hit.any():
+            return empty, empty
+        # bullets in slot order, each taking its first asteroid not yet taken
+        owner, cand = first_free(owner[hit], cand[hit])
+        return bul[owner], cand
+
+
+def _row_property(name):
+    def get(self):
+        return getattr(self.store, name)[self.slot]
+    def set(self, value):
+        getattr(self.store, name)[self.slot] = value
+    return property(get, set)
+
+def _vector_property(name):
+    def get(self):
+        x, y = getattr(self.store, name)[self.slot]
+        return pygame.Vector2(x, y)
+    def set(self, value):
+        getattr(self.store, name)[self.slot] = (value[0], value[1])
+    return property(get, set)
+
+
+class AsteroidView(Asteroid):
+    """An Asteroid whose state lives in an EntityStore row."""
+    __slots__ = ('store', 'slot')
+    pos = _vector_property('pos')
+    prev = _vector_property('prev')
+    vel = _vector_property('vel')
+    hp = _row_property('hp')
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+
+    @property
+    def rng(self):
+        return self.store.rng
+
+    @property
+    def size(self):
+        return int(self.store.size[self.slot])
+
+    @property
+    def letter(self):
+        return chr(self.store.letter[self.slot])
+
+    def update(self):
+        pass  # integrated by EntityStore.update()
+
+    def split(self):
+        """Return list of child asteroids if any (for size > 1)."""
+        if self.size <= 1:
+            return []
+        children = []
+        for _ in range(2):
+            child = self.store.add_asteroid(self.pos, self.size-1, self.letter)
+            child.vel = self.vel.rotate(self.store.rng.uniform(-35, 35)) * 1.2
+            children.append(child)
+        return children
+
+
+class BulletView(Bullet):
+    """A Bullet whose state lives in an EntityStore row."""
+    __slots__ = ('store', 'slot', 'gen')
+    pos = _vector_property('pos')
+    prev = _vector_property('prev')
+    vel = _vector_property('vel')
+    age = _row_property('age')
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+        self.gen = store.gen[slot]
+
+    def update(self):
+        pass  # integrated by EntityStore.update()
+
+    def alive(self):
+        return bool(self.store.alive[self.slot]) and self.store.gen[self.slot] == self.gen
@@ -0,0 +1,93 @@
+# autopilot.py
+import math
+from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_SPACE
+from assets.config import wrap_delta
+from simulation import make_inputs
+
+AIM_TOLERANCE = 6     # degrees off target at which it still fires
+THRUST_CONE = 30      # only thrusts when roughly facing the target...
+ENGAGE_RANGE = 220    # ...and further away than this
+DANGER_RANGE = 70     # clearance kept from any asteroid's edge
+THREAT_CANDIDATES = 3  # nearest asteroids (by centre) checked for the nearest edge
+ASSIST_RANGE = 350    # aim assist only turns toward targets this close
+
+# every combination of the four keys, built once
+_INPUTS = {(l, r, u, f): make_inputs(l, r, u, f)
+           for l in (False, True) for r in (False, True) for u in (False, True) for f in (False, True)}
+
+class Autopilot:
+    """A scripted pilot for headless play (balance runs, soak tests).
+
+    Goes after the nearest asteroid carrying a letter the word still needs,
+    or the nearest asteroid at all when none on the field does, and turns
+    away from anything about to hit it. inputs(state) returns the keys for
+    this step, in the form GameState.step() takes. Targets come from the
+    state's LetterIndex, so the field size hardly matters.
+    """
+    def __init__(self, aim_tolerance=AIM_TOLERANCE, engage_range=ENGAGE_RANGE):
+        self.aim_tolerance = aim_tolerance
+        self.engage_range = engage_range
+
+    def target(self, state):
+        """((asteroid, dx, dy) to go after, (asteroid, dx, dy, gap) of the
+        closest threat); either is None on an empty field."""
+        pos = state.ship.pos
+        index = state.by_letter
+        near = index.nearest(pos, None, THREAT_CANDIDATES)
+        if not near:
+            return None, None
+        d, a = min(near, key=lambda e: e[0] - e[1].radius)
+        threat = (a, *wrap_delta(pos, a.pos), d - a.radius)
+        best = index.nearest(pos, state.progress.missing())
+        a = best[0][1] if best else near[0][1]
+        return (a, *wrap_delta(pos, a.pos)), threat
+
+    def inputs(self, state, keys=None):
+        """keys (the player's) are ignored; the pilot flies alone."""
+        found, threat = self.target(state)
+        if found is None:
+            return _INPUTS[(False, False, False, False)]
+        ship = state.ship
+        if threat[3] < DANGER_RANGE and not ship.invincible:
+            # too close: shoot it if it's in front, else turn away and thrust clear
+            _, dx, dy, _ = threat
+            diff = _heading_diff(ship.angle, dx, dy)
+            if abs(diff) < self.aim_tolerance:
+                return _INPUTS[(False, False, False, True)]
+            away = (diff + 360) % 360 - 180
+            return _INPUTS[(away < 0, away > 0, abs(away) < THRUST_CONE, False)]
+        a, dx, dy = found
+        diff = _heading_diff(ship.angle, dx, dy)
+        half = self.aim_tolerance / 2
+        return _INPUTS[(diff < -half, diff > half,
+                        abs(diff) < THRUST_CONE and math.hypot(dx, dy) > self.engage_range,
+                        abs(diff) < self.aim_tolerance)]
+
+
+class AimAssist:
+    """Aim assist: while the player holds fire and isn't turning, turns the
+    ship toward the nearest asteroid (within ASSIST_RANGE) carrying a letter
+    the word still needs. Thrust and fire stay with the player.
+    inputs(state, keys) returns the keys to step with.
+    """
+    def __init__(self, aim_tolerance=AIM_TOLERANCE, reach=ASSIST_RANGE):
+        self.aim_tolerance = aim_tolerance
+        self.reach = reach
+
+    def inputs(self, state, keys):
+        if not keys[K_SPACE] or keys[K_LEFT] or keys[K_RIGHT]:
+            return keys
+        ship = state.ship
+        found = state.by_letter.nearest(ship.pos, state.progress.missing(), 1, self.reach)
+        if not found:
+            return keys
+        dx, dy = wrap_delta(ship.pos, found[0][1].pos)
+        diff = _heading_diff(ship.angle, dx, dy)
+        half = self.aim_tolerance / 2
+        return _INPUTS[(diff < -half, diff > half, bool(keys[K_UP]), True)]
+
+
+def _heading_diff(angle, dx, dy):
+    """Degrees to turn from angle to face (dx, dy), in -180..180.
+    0 degrees points up the screen and angles grow clockwise."""
+    return (math.degrees(math.atan2(dx, -dy)) - angle + 180) % 360 - 180
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Play thousands of headless games with the autopilot to measure game balance.
+
+    python balance.py --games 10000 --out results.npz
+    python balance.py --games 2000 --lives 3 --asteroids 8 --size-hp 3,2,2
+    python balance.py --games 2000 --letter-weights weights.json --word SPELL
+
+Games are split into chunks and run on a multiprocessing pool, one process
+per core by default; each game gets its own seed, drawn from --seed. The
+results are saved column by column (one NumPy array per metric) in an .npz
+file. Load them with numpy.load(path).
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+import numpy as np
+from multiprocessing import Pool
+
+from assets.asteroids import SIZE_HP
+from assets.config import SIM_RATE, STARTING_LIVES
+from autopilot import Autopilot
+from simulation import GameState, TARGET_WORD, ASTEROID_COUNT
+from words import letter_mask
+
+COLUMNS = np.dtype([
+    ('seed', 'i8'),
+    ('won', '?'),
+    ('winnable', '?'),     # the letter field held every letter of the word
+    ('steps', 'u4'),       # to the win, the game over or max_steps
+    ('letters', 'u2'),     # letters collected
+    ('wasted', 'u2'),      # collected letters the word did not need
+    ('lives_lost', 'u1'),
+    ('shots', 'u4'),
+])
+CHUNK = 25  # games per task: big enough that pickling results is noise
+
+def play_one(seed, params, max_steps, pilot=None):
+    """Play one game to the end (or max_steps); returns a row of COLUMNS."""
+    pilot = pilot or Autopilot()
+    state = GameState(seed, target_word=params['word'], use_store=False, asteroid_count=params['asteroids'],
+                      lives=params['lives'], letter_weights=params['letter_weights'])
+    shots = 0
+    steps = 0
+    while not state.over and steps < max_steps:
+        shots += state.step(pilot.inputs(state)).count('shoot')
+        steps += 1
+    wanted = letter_mask(state.target_word)
+    useful = bin(wanted).count('1') - bin(state.progress.needed).count('1')
+    return (seed, state.win, wanted & letter_mask(''.join(state.field_letters)) == wanted, steps,
+            len(state.collected), len(state.collected) - useful, params['lives'] - state.ship.lives, shots)
+
+def _init_worker(params):
+    # each worker is its own process, so the module-level table is ours to change
+    SIZE_HP.update(params['size_hp'])
+
+def _play_chunk(task):
+    seeds, params, max_steps = task
+    pilot = Autopilot()
+    return np.array([play_one(seed, params, max_steps, pilot) for seed in seeds], dtype=COLUMNS)
+
+def run_batch(games, params, seed=0, workers=None, max_steps=SIM_RATE * 300, progress=None):
+    """Play games games over a process pool; returns a structured array of COLUMNS.
+
+    Rows are written into one preallocated array as chunks come back,
+    in whatever order the workers finish them.
+    """
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(62) for _ in range(games)]
+    tasks = [(seeds[i:i + CHUNK], params, max_steps) for i in range(0, games, CHUNK)]
+    results = np.zeros(games, dtype=COLUMNS)
+    done = 0
+    with Pool(workers or os.cpu_count(), initializer=_init_worker, initargs=(params,)) as pool:
+        for rows in pool.imap_unordered(_play_chunk, tasks):
+            results[done:done + len(rows)] = rows
+            done += len(rows)
+            if progress:
+                progress(done, games)
+    return results
+
+def summarize(results):
+    won = results[results['won']]
+    lines = [
+        f"games        {len(results)}",
+        f"winnable     {results['winnable'].mean():.1%}",
+        f"won          {results['won'].mean():.1%}",
+    ]
+    if len(won):
+        seconds = won['steps'] / SIM_RATE
+        lines.append(f"time to win  median {np.median(seconds):.1f} s, p10 {np.percentile(seconds, 10):.1f} s, "
+                     f"p90 {np.percentile(seconds, 90):.1f} s")
+    lines += [
+        f"game length  median {np.median(results['steps']) / SIM_RATE:.1f} s",
+        f"letters      mean {results['letters'].mean():.1f} collected, {results['wasted'].mean():.1f} wasted",
+        f"lives lost   mean {results['lives_lost'].mean():.2f}",
+        f"shots        mean {results['shots'].mean():.0f}",
+    ]
+    return '\n'.join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0, help="seeds the per-game seeds")
+    parser.add_argument("--max-seconds", type=float, default=300, help="give up on a game after this long")
+    parser.add_argument("--out", default="balance.npz")
+    parser.add_argument("--word", default=TARGET_WORD)
+    parser.add_argument("--lives", type=int, default=STARTING_LIVES)
+    parser.add_argument("--asteroids", type=int, default=ASTEROID_COUNT, help="asteroids kept on the field")
+    parser.add_argument("--size-hp", default=','.join(str(SIZE_HP[s]) for s in (3, 2, 1)),
+                        help="hit points of large,medium,small asteroids")
+    parser.add_argument("--letter-weights", help="JSON file of {letter: weight} (default LETTER_SCORES)")
+    args = parser.parse_args()
+
+    letter_weights = None
+    if args.letter_weights:
+        with open(args.letter_weights) as f:
+            letter_weights = {k.upper(): int(v) for k, v in json.load(f).items()}
+    params = {
+        'word': args.word.upper(),
+        'lives': args.lives,
+        'asteroids': args.asteroids,
+        'size_hp': dict(zip((3, 2, 1), (int(v) for v in args.size_hp.split(',')))),
+        'letter_weights': letter_weights,
+    }
+
+    def progress(done, total):
+        print(f"\r{done}/{total} games", end='', file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    results = run_batch(args.games, params, args.seed, args.workers, int(args.max_seconds * SIM_RATE), progress)
+    elapsed = time.perf_counter() - start
+    print(f"\r{args.games} games in {elapsed:.1f} s ({args.games / elapsed:.0f} games/s)", file=sys.stderr)
+
+    np.savez(args.out, params=json.dumps({**params, 'size_hp': args.size_hp}),
+             **{name: results[name] for name in COLUMNS.names})
+    print(summarize(results))
+    print(f"\nSaved {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the per-frame hot paths.
+
+    python benchmarks/bench.py run --out bench.json
+    python benchmarks/bench.py compare benchmarks/baseline.json bench.json
+
+Runs headless (SDL dummy video and audio drivers). Each benchmark is timed
+over a set of scenarios from a handful to thousands of asteroids and bullets;
+compare exits non-zero if any median got slower than the threshold allows.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+from assets.config import SCREEN_W, SCREEN_H
+from assets.asteroids import Asteroid, POOL as ASTEROID_POOL
+from assets.bullet import Bullet, POOL as BULLET_POOL, BULLET_LIFETIME
+from assets.gun import BulletBuffer
+from assets.collision import bullets_vs_asteroids, ship_vs_asteroids, asteroids_vs_asteroids
+from assets.spatial import SpatialHash
+from assets.hud import HudLayer
+from assets.text_cache import load_font
+from assets.sounds.sound_manager import SoundManager
+from simulation import GameState
+import game
+
+ASTEROID_COUNTS = [6, 100, 1000, 10000]
+BULLET_COUNTS = [0, 200, 2000]
+SEED = 1234
+
+
+class Scenario:
+    """A fixed, seeded field of asteroids plus a ship with live bullets."""
+    def __init__(self, n_asteroids, n_bullets):
+        self.name = f"a{n_asteroids}_b{n_bullets}"
+        rng = random.Random(SEED)
+        self.state = GameState(SEED, use_store=False)
+        self.ship = self.state.ship
+        self.asteroids = [
+            Asteroid((rng.uniform(0, SCREEN_W), rng.uniform(0, SCREEN_H)), rng.choice([1, 2, 3]), rng=rng)
+            for _ in range(n_asteroids)
+        ]
+        self.bullets = [
+            Bullet((rng.uniform(0, SCREEN_W), rng.uniform(0, SCREEN_H)), rng.uniform(0, 360))
+            for _ in range(n_bullets)
+        ]
+        # the same bullets as rows of a BulletBuffer
+        self.gun = BulletBuffer(capacity=max(n_bullets, 1))
+        self.gun_pos = [tuple(b.pos) for b in self.bullets]
+        for row, b in enumerate(self.bullets):
+            self.gun.vel[row] = b.vel
+        self.initial = [(a, a.rng, a.pos.xy, a.vel.xy, a.size, a.hp, a.letter) for a in self.asteroids]
+        self.state.asteroids = self.asteroids
+        self.reset()
+
+    def reset(self):
+        """Undo what the last timed call did to bullets and asteroids.
+
+        Collisions compact the asteroid list in place and recycle objects
+        through the pools, so restore every field and empty the pools.
+        """
+        ASTEROID_POOL.clear()
+        BULLET_POOL.clear()
+        for b in self.bullets:
+            b.age = 0
+        self.ship.bullets = list(self.bullets)
+        for a, rng, pos, vel, size, hp, letter in self.initial:
+            a.rng = rng
+            a.pos.update(pos)
+            a.vel.update(vel)
+            a.size, a.hp, a.letter = size, hp, letter
+        self.asteroids[:] = [entry[0] for entry in self.initial]
+        n = len(self.gun_pos)
+        self.gun.clear()
+        if n:
+            self.gun.pos[:n] = self.gun_pos
+            self.gun.age[:n] = 0
+            self.gun.active = BULLET_LIFETIME
+
+
+def _time(fn, setup=None, min_time=0.2, min_reps=3, max_reps=200):
+    """Time fn() repeatedly, excluding setup(); returns stats in milliseconds."""
+    samples = []
+    total = 0.0
+    while (total < min_time or len(samples) < min_reps) and len(samples) < max_reps:
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        samples.append(dt * 1000)
+        total += dt
+    return {
+        "reps": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def bench_ship_update(sc, ctx):
+    return _time(sc.ship.update, sc.reset)
+
+def bench_asteroid_update(sc, ctx):
+    def run():
+        for a in sc.asteroids:
+            a.update()
+    return _time(run)
+
+def bench_bullets_vs_asteroids(sc, ctx):
+    grid = SpatialHash()
+    def run():
+        grid.rebuild(sc.asteroids)
+        bullets_vs_asteroids(sc.ship, sc.asteroids, grid)
+    return _time(run, sc.reset)
+
+def bench_ship_vs_asteroids(sc, ctx):
+    grid = SpatialHash()
+    def run():
+        sc.ship.invincible = False
+        grid.rebuild(sc.asteroids)
+        ship_vs_asteroids(sc.ship, sc.asteroids, grid)
+    return _time(run)
+
+def bench_asteroids_vs_asteroids(sc, ctx):
+    return _time(lambda: asteroids_vs_asteroids(sc.asteroids))
+
+def bench_draw(sc, ctx):
+    hud = HudLayer(ctx["font"], ctx["bigfont"])
+    def run():
+        game.draw_frame(ctx["screen"], sc.state, hud, ctx["font"], ctx["bigfont"])
+    return _time(run, sc.reset)
+
+def bench_gun_update(sc, ctx):
+    return _time(sc.gun.update, sc.reset)
+
+def bench_gun_hits(sc, ctx):
+    return _time(lambda: sc.gun.hits(sc.asteroids), sc.reset)
+
+def bench_gun_draw(sc, ctx):
+    return _time(lambda: sc.gun.draw(ctx["screen"], 0.5), sc.reset)
+
+def bench_sound_startup(sc, ctx):
+    def setup():
+        pygame.mixer.quit()
+    return _time(lambda: SoundManager(enabled=True), setup, min_reps=5, max_reps=20)
+
+
+# name -> (function, uses asteroid counts, uses bullet counts)
+BENCHMARKS = {
+    "Ship.update": (bench_ship_update, False, True),
+    "Asteroid.update": (bench_asteroid_update, True, False),
+    "bullets_vs_asteroids": (bench_bullets_vs_asteroids, True, True),
+    "ship_vs_asteroids": (bench_ship_vs_asteroids, True, False),
+    "asteroids_vs_asteroids": (bench_asteroids_vs_asteroids, True, False),
+    "draw_frame": (bench_draw, True, True),
+    "BulletBuffer.update": (bench_gun_update, False, True),
+    "BulletBuffer.hits": (bench_gun_hits, True, True),
+    "BulletBuffer.draw": (bench_gun_draw, False, True),
+    "SoundManager startup": (bench_sound_startup, False, False),
+}
+
+
+def run(args):
+    pygame.display.init()
+    ctx = {
+        "screen": pygame.display.set_mode((SCREEN_W, SCREEN_H)),
+        "font": load_font(28),
+        "bigfont": load_font(48),
+    }
+    asteroid_counts = [n for n in ASTEROID_COUNTS if n <= args.max_asteroids]
+    bullet_counts = [n for n in BULLET_COUNTS if n <= args.max_bullets]
+    scenarios = {}
+    results = {}
+    for name, (fn, by_asteroids, by_bullets) in BENCHMARKS.items():
+        if args.filter and args.filter.lower() not in name.lower():
+            continue
+        results[name] = {}
+        for na in (asteroid_counts if by_asteroids else asteroid_counts[:1]):
+            for nb in (bullet_counts if by_bullets else bullet_counts[:1]):
+                key = (na, nb)
+                if key not in scenarios:
+                    scenarios[key] = Scenario(na, nb)
+                sc = scenarios[key]
+                stats = fn(sc, ctx)
+                results[name][sc.name] = stats
+                print(f"{name:<24} {sc.name:<14} median {stats['median']:9.3f} ms  ({stats['reps']} reps)")
+    pygame.quit()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {args.out}")
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        base = json.load(f)["results"]
+    with open(args.current) as f:
+        cur = json.load(f)["results"]
+    regressions = 0
+    for name, scenarios in cur.items():
+        for scenario, stats in scenarios.items():
+            old = base.get(name, {}).get(scenario)
+            if old is None:
+                continue
+            ratio = stats["median"] / old["median"] if old["median"] else 1.0
+            flag = ""
+            if ratio > 1 + args.threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            elif ratio < 1 - args.threshold:
+                flag = "  faster"
+            print(f"{name:<24} {scenario:<14} {old['median']:9.3f} -> {stats['median']:9.3f} ms  x{ratio:5.2f}{flag}")
+    print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="run the benchmarks and save JSON results")
+    p_run.add_argument("--out", default="bench.json")
+    p_run.add_argument("--filter", help="only benchmarks whose name contains this")
+    p_run.add_argument("--max-asteroids", type=int, default=max(ASTEROID_COUNTS))
+    p_run.add_argument("--max-bullets", type=int, default=max(BULLET_COUNTS))
+    p_run.set_defaults(func=run)
+
+    p_cmp = sub.add_parser("compare", help="flag regressions against a baseline")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    p_cmp.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
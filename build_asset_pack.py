@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Pack the game's sound effects, music and any extra files into one indexed,
+memory-mappable file (assets/assets.pack by default).
+
+    python build_asset_pack.py
+    python build_asset_pack.py --extra fonts/title.ttf --extra sprites/ship.png
+
+SoundManager uses the pack when it exists and falls back to the loose files
+under assets/sounds otherwise. Rebuild after changing any packed file.
+"""
+
+import argparse
+from pathlib import Path
+
+from assets.pack import PACK_PATH, write_pack
+from assets.sounds.sound_manager import SOUND_FILES, MUSIC_FILES
+
+SOUNDS_DIR = Path(__file__).resolve().parent / 'assets' / 'sounds'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=str(PACK_PATH))
+    parser.add_argument("--extra", action="append", default=[],
+                        help="another file (sprite, font...) to pack under its relative path")
+    args = parser.parse_args()
+
+    sfx = [(name, SOUNDS_DIR / 'sfx' / filename) for name, filename in SOUND_FILES.items()]
+    music = [(name, SOUNDS_DIR / 'music' / filename) for name, filename in MUSIC_FILES.items()]
+    blobs = [(Path(path).as_posix(), path) for path in args.extra]
+
+    entries = write_pack(args.out, sfx, music, blobs)
+    for entry in entries:
+        print(f"  {entry['kind']:<6} {entry['name']:<24} {entry['length']:>10} bytes")
+    print(f"\nWrote {args.out} ({Path(args.out).stat().st_size} bytes, {len(entries)} entries)")
+
+if __name__ == "__main__":
+    main()
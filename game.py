@@ -1,135 +1,258 @@
 # game.py
-import pygame
-from pygame.locals import *
+from assets.config import (SIM_RATE, MAX_CATCHUP_STEPS, DISPLAY_FPS, DIRTY_RECTS, PARTICLES, PROFILE_STARTUP,
+                           FRAME_PROFILE_OUT, RECORD_INPUT, SWARM_MODE, ADAPTIVE_QUALITY, PILOT, WORD_LIST,
+                           render_position)
+from assets.startup import PROFILER
+if PROFILE_STARTUP:
+    PROFILER.track_imports()  # before anything heavy, so the imports below are timed
+
 import random
+from time import perf_counter
+
+import pygame
+from pygame.locals import QUIT, KEYDOWN, K_F3
 
-from assets.config import SCREEN_W, SCREEN_H, wrap_position
-from assets.ship import Ship
-from assets.asteroids import Asteroid
-from assets.hearts import Hearts
-from assets.collision import bullets_vs_asteroids, ship_vs_asteroids
+from assets.canvas import open_window
+from assets.hud import HudLayer
+from assets.dirty import DirtyRenderer
+from assets.frame_profiler import FrameProfiler
+from assets.governor import QualityGovernor
+from assets.particles import ParticleSystem, AVAILABLE as PARTICLES_AVAILABLE
+from assets.swarm import Camera, draw_world
+from assets.recording import InputRecorder, RESTART_BIT, key_mask, mask_inputs
+from assets.text_cache import load_font
 from assets.sounds.sound_manager import SoundManager
-from letterfrequency import build_frequency_list
-
-FPS = 60
-
-def make_field_letters(n=6):
-    # letters the asteroids will carry
-    freq = build_frequency_list()
-    return [random.choice(freq) for _ in range(n)]
-
-def spawn_asteroids(field_letters, count=6):
-    asteroids = []
-    for _ in range(count):
-        edge = random.choice(['top','bottom','left','right'])
-        if edge == 'top':
-            pos = (random.randrange(SCREEN_W), 0)
-        elif edge == 'bottom':
-            pos = (random.randrange(SCREEN_W), SCREEN_H-1)
-        elif edge == 'left':
-            pos = (0, random.randrange(SCREEN_H))
-        else:
-            pos = (SCREEN_W-1, random.randrange(SCREEN_H))
-        letter = random.choice(field_letters)
-        asteroids.append(Asteroid(pos, size=random.choice([2,3]), letter=letter))
-    return asteroids
-
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
-    pygame.display.set_caption("Asteroids Spelling")
+from simulation import GameState
+from autopilot import Autopilot, AimAssist
+
+PROFILE_KEY = K_F3  # shows/hides the frame timings overlay
+
+def draw_frame(screen, state, hud, font, bigfont, clear=True, alpha=1.0, camera=None, quality=None):
+    """Draw one frame; returns the rects touched, for dirty-rect updates.
+
+    alpha is how far the frame falls between the last simulation step and
+    the next one; moving things are drawn that far along from the step before.
+    camera, in swarm mode, is the Camera whose view of the world to draw.
+    hud is the HudLayer for the hearts, the HUD line and the end popup.
+    quality, a QualityGovernor, says what detail to leave out; None draws everything.
+    """
+    prof = state.profiler
+    small_glyphs = quality is None or quality.small_glyphs
+    if clear:
+        screen.fill((0,0,0))
+        if prof is not None:
+            prof.mark('draw clear')
+
+    if camera is not None:
+        rects = draw_world(screen, state, camera, font, alpha, small_glyphs)
+        if prof is not None:
+            prof.mark('draw world')
+    else:
+        rects = []
+        small_font = font if small_glyphs else None
+        for a in state.asteroids:
+            rects += a.draw(screen, font if a.size > 1 else small_font, alpha)
+        if prof is not None:
+            prof.mark('draw asteroids')
+
+        if state.particles is not None:
+            rects += state.particles.draw(screen, alpha)
+            if prof is not None:
+                prof.mark('draw particles')
+
+        rects += state.ship.draw(screen, alpha)
+        if prof is not None:
+            prof.mark('draw ship')
+    rects += hud.draw(screen, state.ship.lives, (state.target_word, state.collected),
+                      lambda: f"Target: {state.target_word}  Collected: {state.progress.collected()}",
+                      state.win if state.over else None)
+    if prof is not None:
+        prof.mark('draw HUD')
+    return rects
+
+def main(seed=None, record=RECORD_INPUT, replay=None, tick=True, profile_out=FRAME_PROFILE_OUT,
+         word_list=WORD_LIST):
+    """Run the game until the window is closed.
+
+    The simulation advances in fixed steps of 1/SIM_RATE seconds however
+    fast frames are drawn: each frame runs as many steps as the time since
+    the last frame covers (at most MAX_CATCHUP_STEPS) and draws in between.
+
+    record saves the seed and every step's keys to that path on exit.
+    replay, a Recording, drives the game instead of the keyboard and ends
+    it after the last recorded step. tick=False drops real time: exactly
+    one step per frame, frames back to back. word_list, a one-word-per-line
+    file, gives every round a new target word. Returns the steps played.
+    """
+    if replay is not None:
+        seed = replay.seed
+    elif record and seed is None:
+        seed = random.getrandbits(63)  # the recording needs a concrete seed
+    recorder = InputRecorder(seed) if record else None
+    masks = replay.masks() if replay is not None else None
+
+    # Only the subsystems the game uses are started, each when first needed:
+    # display here, font in load_font(), mixer in SoundManager (if enabled).
+    with PROFILER.phase("display init"):
+        pygame.display.init()
+        canvas = open_window("Asteroids Spelling")
+        screen = canvas.surface
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 28)
-    bigfont = pygame.font.SysFont(None, 48)
+    with PROFILER.phase("fonts"):
+        font = load_font(canvas.px(28))
+        bigfont = load_font(canvas.px(48))
+        smallfont = load_font(canvas.px(18))
 
     # Initialize sound manager
-    sound_manager = SoundManager()
+    with PROFILER.phase("SoundManager"):
+        sound_manager = SoundManager()
+
+    words = None
+    if word_list:
+        with PROFILER.phase("WordIndex"):
+            from words import WordIndex
+            words = WordIndex.load(word_list)
 
-    ship = Ship((SCREEN_W/2, SCREEN_H/2), sound_manager=sound_manager)
-    hearts = Hearts(ship, (10, SCREEN_H-26))
+    # the simulation raises events named after the sounds they play
+    with PROFILER.phase("GameState"):
+        state = GameState(seed, words=words)
+        state.subscribe(sound_manager.play_sound)
+        if PARTICLES and PARTICLES_AVAILABLE:
+            state.particles = state.ship.particles = ParticleSystem()
+        hud = HudLayer(font, bigfont)
 
     # Start background music
     sound_manager.play_music('background')
+    first_frame = True
 
-    target_word = "PYGAME"
-    collected = ""
-    field_letters = make_field_letters(8)
-    asteroids = spawn_asteroids(field_letters, 6)
-
-    game_over = False
-    win = False
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                sound_manager.cleanup()
-                return
-            if event.type == KEYDOWN and (game_over or win):
-                # restart
-                ship = Ship((SCREEN_W/2, SCREEN_H/2), sound_manager=sound_manager)
-                hearts = Hearts(ship, (10, SCREEN_H-26))
-                collected = ""
-                asteroids = spawn_asteroids(field_letters, 6)
-                game_over = False
-                win = False
-
-        keys = pygame.key.get_pressed()
-        if not (game_over or win):
-            ship.handle_input(keys)
-            ship.update()
-
-            # collisions
-            letters, asteroids = bullets_vs_asteroids(ship, asteroids)
-            for L in letters:
-                collected += L
-                sound_manager.play_sound('asteroid_hit')  # Play hit sound
-                if all(ch in collected for ch in target_word):
-                    sound_manager.play_sound('victory')  # Play victory sound
-                    win = True
-
-            # ship hits
-            lives_delta = ship_vs_asteroids(ship, asteroids)
-            if lives_delta < 0:
-                ship.lives += lives_delta
-                sound_manager.play_sound('ship_hit')  # Play ship hit sound
-                if ship.lives <= 0:
-                    sound_manager.play_sound('game_over')  # Play game over sound
-                    game_over = True
-
-            # update asteroids
-            for a in asteroids:
-                a.update()
-
-            # respawn a few if needed
-            while len(asteroids) < 6 and not (game_over or win):
-                asteroids.extend(spawn_asteroids(field_letters, 1))
-
-        # draw
-        screen.fill((0,0,0))
+    # the view scrolls every frame in swarm mode, and a scaled canvas is
+    # stretched over the whole window, so dirty rects can't help there
+    renderer = DirtyRenderer(screen) if DIRTY_RECTS and not SWARM_MODE and not canvas.scaled else None
+    camera = Camera() if SWARM_MODE else None
+    end_shown = False  # the end screen is static, so dirty mode draws it once
+    pilot = {'assist': AimAssist, 'autopilot': Autopilot}[PILOT]() if PILOT else None
+    # without real time (tick=False) there is no frame budget to hold
+    governor = QualityGovernor(1.0 / (DISPLAY_FPS or SIM_RATE), state.particles) if ADAPTIVE_QUALITY and tick else None
+
+    # timings are only taken while the overlay is up or being streamed to a file
+    profiler = state.profiler = FrameProfiler(profile_out) if profile_out else None
+    show_profile = False
+    played = 0
+    step_time = 1.0 / SIM_RATE
+    lag = 0.0  # real time not yet simulated
+    last = perf_counter()
+    restart = False
+
+    try:
+        while True:
+            frame_start = perf_counter()
+            prof = profiler
+            if prof is not None:
+                prof.start_frame()
+            for event in pygame.event.get():
+                if event.type == QUIT:
+                    return played
+                if event.type == KEYDOWN and event.key == PROFILE_KEY:
+                    show_profile = not show_profile
+                    if show_profile and profiler is None:
+                        profiler = FrameProfiler()
+                    elif not show_profile and profiler.out is None:
+                        profiler = None
+                    state.profiler = profiler
+                    if renderer is not None:
+                        renderer.invalidate()
+                elif event.type == KEYDOWN and state.over:
+                    restart = True
+
+            if prof is not profiler:
+                prof = None  # toggled this frame; start timing from the next one
+            if prof is not None:
+                prof.mark('event pump')
+
+            if tick:
+                now = perf_counter()
+                lag += now - last
+                last = now
+            else:
+                lag += step_time
+            live_keys = pygame.key.get_pressed() if masks is None else None
+            steps = 0
+            while lag >= step_time:
+                if steps == MAX_CATCHUP_STEPS:
+                    lag %= step_time  # too far behind to catch up; let the game slow down
+                    break
+                if masks is None:
+                    keys = live_keys if pilot is None else pilot.inputs(state, live_keys)
+                else:
+                    mask = next(masks, None)
+                    if mask is None:
+                        return played
+                    keys = mask_inputs(mask)
+                    restart = bool(mask & RESTART_BIT)  # the recorded restarts, not live keys
+                if recorder is not None:
+                    recorder.record(key_mask(keys) | (RESTART_BIT if restart else 0))
+                if restart:
+                    restart = False
+                    state.reset()
+                    end_shown = False
+                    if renderer is not None:
+                        renderer.invalidate()
+                state.step(keys)
+                played += 1
+                steps += 1
+                lag -= step_time
+            alpha = lag / step_time
+            if camera is not None:
+                camera.follow(render_position(state.ship.pos, state.ship.prev, alpha))
+
+            sound_manager.flush()
+            if prof is not None:
+                prof.mark('sound')
 
-        for a in asteroids:
-            a.draw(screen, font)
-
-        ship.draw(screen)
-        hearts.draw(screen)
-
-        # HUD
-        hud = font.render(f"Target: {target_word}  Collected: {''.join(sorted(collected))}", True, (200,200,200))
-        screen.blit(hud, (10,10))
-
-        if game_over or win:
-            overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-            overlay.fill((0,0,0,180))
-            txt = bigfont.render("YOU WIN!" if win else "GAME OVER", True, (255,255,0) if win else (255,255,255))
-            rect = txt.get_rect(center=(SCREEN_W/2, SCREEN_H/2 - 20))
-            overlay.blit(txt, rect)
-            sub = font.render("Press any key to restart", True, (200,200,200))
-            srect = sub.get_rect(center=(SCREEN_W/2, SCREEN_H/2 + 20))
-            overlay.blit(sub, srect)
-            screen.blit(overlay, (0,0))
-
-        pygame.display.flip()
-        clock.tick(FPS)
+            if renderer is None:
+                draw_frame(screen, state, hud, font, bigfont, alpha=alpha, camera=camera, quality=governor)
+                if show_profile:
+                    panel = profiler.overlay(smallfont)
+                    screen.blit(panel, (screen.get_width() - panel.get_width() - canvas.px(10), canvas.px(40)))
+                    if prof is not None:
+                        prof.mark('draw profiler')
+                canvas.present()
+                if prof is not None:
+                    prof.mark('display.flip')
+            elif not end_shown:
+                renderer.erase()
+                if prof is not None:
+                    prof.mark('draw erase')
+                rects = draw_frame(screen, state, hud, font, bigfont, clear=False, alpha=alpha, quality=governor)
+                if show_profile:
+                    panel = profiler.overlay(smallfont)
+                    rects.append(screen.blit(panel, (screen.get_width() - panel.get_width() - canvas.px(10), canvas.px(40))))
+                    if prof is not None:
+                        prof.mark('draw profiler')
+                renderer.present(rects)
+                if prof is not None:
+                    prof.mark('display.update')
+                end_shown = state.over
+            if first_frame:
+                first_frame = False
+                PROFILER.mark("first frame presented")
+                if PROFILE_STARTUP:
+                    PROFILER.stop_tracking_imports()
+                    PROFILER.report()
+            if governor is not None:
+                governor.frame(perf_counter() - frame_start)
+            if tick:
+                clock.tick(DISPLAY_FPS)
+            if prof is not None:
+                prof.mark('clock.tick idle')
+                bullets = len(state.ship.bullets) + (len(state.gun) if state.gun is not None else 0)
+                prof.end_frame(asteroids=len(state.asteroids), bullets=bullets)
+    finally:
+        sound_manager.cleanup()
+        if profiler is not None:
+            profiler.close()
+        if recorder is not None:
+            recorder.save(record)
 
 if __name__ == "__main__":
     main()
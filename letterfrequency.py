@@ -11,14 +11,90 @@ LETTER_SCORES = {
     1: list('QZ')
 }
 
-def build_frequency_list():
+def build_frequency_list(rng=random):
     """Return a list with each letter repeated its value‑score times."""
     freq_list = []
     for score, letters in LETTER_SCORES.items():
         freq_list.extend(letters * score)
-    random.shuffle(freq_list)
+    rng.shuffle(freq_list)
     return freq_list
 
 def frequency_counter():
     """Convenience Counter for debug / UI."""
     return Counter(build_frequency_list())
+
+def letter_weights():
+    """{letter: score} from LETTER_SCORES."""
+    return {letter: score for score, letters in LETTER_SCORES.items() for letter in letters}
+
+
+class LetterSampler:
+    """Draw letters with probability proportional to their weight.
+
+    Weights live in a Fenwick (binary indexed) tree, so a draw and a weight
+    change both cost O(log n) and the table is built once. exclude() and
+    include() switch letters off and on, e.g. letters already guessed.
+    """
+    def __init__(self, weights=None):
+        self.base = dict(weights if weights is not None else letter_weights())
+        self.letters = sorted(self.base)
+        self.index = {letter: i for i, letter in enumerate(self.letters)}
+        self.weights = [0] * len(self.letters)
+        self.tree = [0] * (len(self.letters) + 1)
+        self.total = 0
+        for letter, w in self.base.items():
+            self.set_weight(letter, w)
+
+    def set_weight(self, letter, weight):
+        """Change one letter's weight (a whole number >= 0)."""
+        i = self.index[letter]
+        delta = weight - self.weights[i]
+        if not delta:
+            return
+        self.weights[i] = weight
+        self.total += delta
+        i += 1
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def weight(self, letter):
+        return self.weights[self.index[letter]]
+
+    def exclude(self, letter):
+        self.set_weight(letter, 0)
+
+    def include(self, letter):
+        """Give letter back its original weight."""
+        self.set_weight(letter, self.base.get(letter, 0))
+
+    def reset(self):
+        for letter, w in self.base.items():
+            self.set_weight(letter, w)
+
+    def _find(self, target):
+        """Letter whose cumulative weight range contains target (0 <= target < total)."""
+        tree = self.tree
+        pos = 0
+        step = 1 << (len(self.letters).bit_length())
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return self.letters[pos]
+
+    def draw(self, rng=random):
+        if self.total <= 0:
+            raise ValueError("every letter is excluded")
+        return self._find(rng.randrange(self.total))
+
+    def draws(self, n, rng=random):
+        """n independent draws, e.g. for spawning a batch of asteroids."""
+        if self.total <= 0:
+            raise ValueError("every letter is excluded")
+        total = self.total
+        find = self._find
+        return [find(rng.randrange(total)) for _ in range(n)]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Two players race to spell the word in one asteroid field, over UDP.
+
+    python netplay.py host                        # player 1; waits for player 2
+    python netplay.py join 192.168.1.20           # player 2
+    python netplay.py join 127.0.0.1 --loss 0.1 --latency 80 --jitter 20
+
+The host runs the game and sends snapshots; the joining side sends its
+keys and predicts its own ship in between (assets/net.py). --loss,
+--latency and --jitter (milliseconds, one way) impair what this side
+sends, to try bad networks on one machine; give them to both sides to
+impair both directions. Traffic is printed on exit.
+"""
+
+import argparse
+
+import pygame
+from pygame.locals import QUIT, KEYDOWN
+
+from assets.config import SIM_RATE, DISPLAY_FPS, MAX_CATCHUP_STEPS
+from assets.canvas import open_window
+from assets.hud import HudLayer
+from assets.net import Link, Host, Client, PORT
+from assets.recording import RESTART_BIT, key_mask
+from assets.sprites import SPRITES
+from assets.text_cache import GLYPHS, load_font
+from simulation import VersusState
+
+LABEL_OFFSET = 26  # pixels from a ship's centre down to its P1/P2 tag
+
+def _missing(needed):
+    return ''.join(chr(65 + n) for n in range(26) if needed >> n & 1) or '-'
+
+def draw_race(screen, view, me, needed, hud, fonts, alpha):
+    """Draw the field, both ships (tagged P1/P2), the HUD and the end screen.
+
+    view is the Host's VersusState or the Client; me is this side's ship
+    index, needed the needed-letters mask of each ship and hud a HudLayer.
+    """
+    font, bigfont, smallfont = fonts
+    screen.fill((0, 0, 0))
+    for a in view.asteroids:
+        a.draw(screen, font, alpha)
+    for b in getattr(view, 'shots', ()):
+        b.draw(screen, alpha)
+    for i, ship in enumerate(view.ships):
+        if ship.lives <= 0:
+            continue
+        ship.draw(screen, alpha)
+        tag = GLYPHS.get(smallfont, "YOU" if i == me else f"P{i + 1}", (120, 200, 255) if i == me else (255, 140, 120))
+        x, y = ship.pos
+        s = SPRITES.scale
+        screen.blit(tag, tag.get_rect(center=(x * s, (y + LABEL_OFFSET) * s)))
+    hud.draw(screen, view.ships[me].lives, (view.target_word, needed),
+             lambda: f"Target: {view.target_word}  " + "  ".join(
+                 f"{'You' if i == me else f'P{i + 1}'} need {_missing(n)}" for i, n in enumerate(needed)),
+             view.winner == me if view.over else None)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("role", choices=("host", "join"))
+    parser.add_argument("address", nargs="?", default="127.0.0.1", help="the host to join")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--loss", type=float, default=0.0, help="share of sent packets to drop")
+    parser.add_argument("--latency", type=float, default=0.0, help="ms to hold each sent packet back")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many ms more, at random")
+    args = parser.parse_args()
+
+    impair = dict(loss=args.loss, latency=args.latency / 1000, jitter=args.jitter / 1000)
+    if args.role == "host":
+        link = Link(args.port, **impair)
+        host = Host(VersusState(args.seed), link)
+        client = None
+        me = 0
+    else:
+        link = Link(**impair)
+        host = None
+        client = Client(link, (args.address, args.port))
+        me = 1
+
+    pygame.display.init()
+    canvas = open_window(f"Asteroids Spelling - {'host' if host else 'player 2'}")
+    screen = canvas.surface
+    clock = pygame.time.Clock()
+    fonts = (load_font(canvas.px(28)), load_font(canvas.px(48)), load_font(canvas.px(18)))
+    hud = HudLayer(fonts[0], fonts[1])
+    step_time = 1.0 / SIM_RATE
+    lag = 0.0
+    last = link.clock()
+    restart = False
+    steps = 0
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == QUIT:
+                    return
+                if event.type == KEYDOWN:
+                    restart = True
+            if not (host or client).poll():
+                print("Connection lost")
+                return
+            now = link.clock()
+            lag += now - last
+            last = now
+            keys = pygame.key.get_pressed()
+            n = 0
+            while lag >= step_time:
+                if n == MAX_CATCHUP_STEPS:
+                    lag %= step_time
+                    break
+                if not (host or client).connected:
+                    lag = 0.0  # nothing runs until both players are in
+                    break
+                if host is not None:
+                    if restart and host.state.over:
+                        host.state.reset()
+                    host.step(keys)
+                else:
+                    client.step(key_mask(keys) | (RESTART_BIT if restart and client.over else 0))
+                restart = False
+                steps += 1
+                n += 1
+                lag -= step_time
+            link.flush()
+
+            if host is not None:
+                view = host.state
+                needed = tuple(p.needed for p in view.progress)
+                waiting = not host.connected
+            else:
+                view = client
+                needed = client.needed
+                waiting = not client.connected
+            if waiting:
+                screen.fill((0, 0, 0))
+                text = (f"Waiting for player 2 on port {link.port}" if host else
+                        f"Joining {args.address}:{args.port}")
+                msg = GLYPHS.get(fonts[0], text, (200, 200, 200))
+                screen.blit(msg, msg.get_rect(center=screen.get_rect().center))
+            else:
+                draw_race(screen, view, me, needed, hud, fonts, lag / step_time)
+            canvas.present()
+            clock.tick(DISPLAY_FPS)
+    finally:
+        seconds = steps / SIM_RATE
+        if seconds:
+            print(f"Sent {link.sent_packets} packets, {link.sent_bytes / seconds / 1024:.1f} KiB/s "
+                  f"({link.dropped} dropped on purpose)")
+        if host is not None and host.snapshots:
+            print(f"Snapshots: {host.snapshots}, {host.snapshot_bytes / host.snapshots:.0f} bytes on average")
+        if client is not None:
+            print(f"Prediction ran {client.lead} steps ahead of the last snapshot")
+        link.close()
+        pygame.quit()
+
+if __name__ == "__main__":
+    main()
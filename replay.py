@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Play back a session recorded with RECORD_INPUT (assets/config.py).
+
+    python replay.py session.rec                  # in a window, at normal speed
+    python replay.py session.rec --no-tick        # in a window, as fast as it draws
+    python replay.py session.rec --headless --profile frames.jsonl
+
+The recording holds the seed and the keys of every frame, so the replay is
+the same game frame for frame. --headless uses SDL's dummy video and audio
+drivers and never waits on the clock.
+"""
+
+import os
+import time
+import argparse
+
+from assets.recording import Recording
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording")
+    parser.add_argument("--headless", action="store_true", help="no window, no frame rate cap")
+    parser.add_argument("--no-tick", action="store_true", help="don't cap the frame rate")
+    parser.add_argument("--profile", metavar="FILE", help="frame timings to a .jsonl or Chrome trace .json file")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import game  # after the SDL drivers are chosen
+
+    recording = Recording.load(args.recording)
+    start = time.perf_counter()
+    frames = game.main(record=None, replay=recording, tick=not (args.headless or args.no_tick),
+                       profile_out=args.profile)
+    elapsed = time.perf_counter() - start
+    played = frames / game.SIM_RATE
+    print(f"Replayed {frames} of {recording.frames} steps (seed {recording.seed}) in {elapsed:.2f} s, "
+          f"{played / elapsed if elapsed else 0:.1f}x real time")
+
+if __name__ == "__main__":
+    main()
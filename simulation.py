@@ -0,0 +1,329 @@
+# simulation.py
+import random
+from pygame.locals import K_LEFT, K_RIGHT, K_UP, K_SPACE
+
+from assets.config import (wrap_delta, WORLD_W, WORLD_H, ENTITY_STORE, STARTING_LIVES, SWARM_MODE, SWARM_ASTEROIDS,
+                           WEAPON)
+from assets.ship import Ship
+from assets.asteroids import Asteroid, POOL as ASTEROID_POOL
+from assets.bullet import POOL as BULLET_POOL
+from assets.collision import bullets_vs_asteroids, ship_vs_asteroids
+from assets.gun import BulletBuffer, AVAILABLE as GUN_AVAILABLE
+from assets.spatial import SpatialHash, LetterIndex
+from assets.swarm import FarField, ACTIVE_RADIUS
+from letterfrequency import LetterSampler
+from words import WordProgress
+
+TARGET_WORD = "PYGAME"
+FIELD_LETTERS = 8
+ASTEROID_COUNT = 6
+SPAWN_TRIES = 1000  # random spots tried for each asteroid that must spawn out of the ship's reach
+
+def make_inputs(left=False, right=False, up=False, fire=False):
+    """Key state for GameState.step() without a window to read keys from."""
+    return {K_LEFT: left, K_RIGHT: right, K_UP: up, K_SPACE: fire}
+
+NO_INPUT = make_inputs()
+
+def make_field_letters(n=6, rng=random, sampler=None):
+    # letters the asteroids will carry, weighted by LETTER_SCORES
+    if sampler is None:
+        sampler = LetterSampler()
+    return sampler.draws(n, rng)
+
+def spawn_asteroids(field_letters, count=6, store=None, rng=random, avoid=None):
+    """count new asteroids at the edges of the world, or, when avoid (a
+    point) is given, anywhere at least ACTIVE_RADIUS away from it.
+
+    Raises ValueError when no such spot turns up, as in a world too small
+    for swarm mode (see SWARM_MODE in assets/config.py).
+    """
+    asteroids = []
+    for _ in range(count):
+        edge = rng.choice(['top','bottom','left','right']) if avoid is None else None
+        if avoid is not None:
+            for _ in range(SPAWN_TRIES):
+                pos = (rng.randrange(WORLD_W), rng.randrange(WORLD_H))
+                dx, dy = wrap_delta(avoid, pos)
+                if dx*dx + dy*dy > ACTIVE_RADIUS * ACTIVE_RADIUS:
+                    break
+            else:
+                raise ValueError(f"no spot {ACTIVE_RADIUS:.0f} from the ship in a {WORLD_W}x{WORLD_H} world")
+        elif edge == 'top':
+            pos = (rng.randrange(WORLD_W), 0)
+        elif edge == 'bottom':
+            pos = (rng.randrange(WORLD_W), WORLD_H-1)
+        elif edge == 'left':
+            pos = (0, rng.randrange(WORLD_H))
+        else:
+            pos = (WORLD_W-1, rng.randrange(WORLD_H))
+        letter = rng.choice(field_letters)
+        size = rng.choice([2,3])
+        if store is not None:
+            asteroids.append(store.add_asteroid(pos, size=size, letter=letter))
+        else:
+            asteroids.append(ASTEROID_POOL.acquire(pos, size=size, letter=letter, rng=rng))
+    return asteroids
+
+
+class EventBus:
+    """Fans simulation events out to whoever subscribed (sound, rendering).
+
+    Event names are the SoundManager sound names, and play_sound() is an
+    alias of emit() so the bus can be handed to Ship as its sound hook.
+    """
+    def __init__(self):
+        self.subscribers = []
+        self.frame_events = []
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def emit(self, name):
+        self.frame_events.append(name)
+        for callback in self.subscribers:
+            callback(name)
+
+    play_sound = emit
+
+
+class GameState:
+    """The game's rules with no display, mixer or clock attached.
+
+    Every random draw comes from one random.Random(seed), so the same seed
+    and the same inputs always give the same game, and step() runs as fast
+    as the CPU allows.
+    """
+    SWARM = SWARM_MODE  # the world is only big enough for a swarm when the config made it so
+
+    def __init__(self, seed=None, target_word=TARGET_WORD, use_store=ENTITY_STORE, words=None,
+                 asteroid_count=None, lives=STARTING_LIVES, letter_weights=None, weapon=WEAPON):
+        """asteroid_count, lives and letter_weights ({letter: weight}, default
+        LETTER_SCORES) are the balance knobs; see balance.py.
+
+        With SWARM_MODE (which also sets the world's size), asteroid_count
+        (default SWARM_ASTEROIDS) asteroids are scattered over the world. Without the store, only the ones near the ship are in
+        self.asteroids; the rest move in the background in self.far.
+
+        weapon, a name in assets/gun.py's WEAPONS, arms the ship with a
+        BulletBuffer (self.gun); not with the store, which keeps its own bullets.
+        """
+        if asteroid_count is None:
+            asteroid_count = SWARM_ASTEROIDS if self.SWARM else ASTEROID_COUNT
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.events = EventBus()
+        self.words = words  # optional WordIndex: each round then gets a new target
+        self.target_word = target_word
+        self.store = None
+        if use_store:
+            from assets.world import EntityStore
+            self.store = EntityStore(rng=self.rng)
+        self.grid = SpatialHash()
+        self.by_letter = LetterIndex()  # nearest-asteroid-with-letter queries, over self.asteroids
+        self.profiler = None  # a FrameProfiler to time each phase of step()
+        self.particles = None  # a ParticleSystem for explosions and exhaust; purely visual
+        self.asteroid_count = asteroid_count
+        self.swarm = self.SWARM
+        self.far = FarField() if self.swarm and not use_store else None
+        self.gun = BulletBuffer(weapon) if weapon and not use_store and GUN_AVAILABLE else None
+        self.lives = lives
+        self.letters = LetterSampler(letter_weights)  # exclude()/include() change what can spawn
+        self.field_letters = make_field_letters(FIELD_LETTERS, self.rng, self.letters)
+        self.reset()
+
+    def subscribe(self, callback):
+        """callback(name) is called for every event as it happens."""
+        self.events.subscribe(callback)
+
+    def reset(self):
+        """Start a new round on the same letter field."""
+        if self.store is not None:
+            self.store.clear()
+        if self.words is not None:
+            self.target_word = self.words.choose(self.rng, 4, 8)
+        self.progress = WordProgress(self.target_word)
+        self.ship = Ship((WORLD_W/2, WORLD_H/2), self.lives, sound_manager=self.events, store=self.store)
+        self.ship.particles = self.particles
+        if self.particles is not None:
+            self.particles.clear()
+        self.ship.gun = self.gun
+        if self.gun is not None:
+            self.gun.clear()
+        self.collected = ""
+        if self.far is not None:
+            self.far.clear()
+        self.asteroids = spawn_asteroids(self.field_letters, self.asteroid_count, self.store, self.rng,
+                                         self.ship.pos if self.swarm else None)
+        if self.far is not None:
+            # everything starts out of reach; the first steps pull in what is near
+            for i, a in enumerate(self.asteroids):
+                self.far.buckets[i % self.far.every].append(a)
+            self.asteroids = []
+        self.by_letter.track(self.asteroids)
+        self.game_over = False
+        self.win = False
+        self.frame = 0
+
+    @property
+    def over(self):
+        return self.game_over or self.win
+
+    def step(self, inputs):
+        """Advance one frame; inputs is anything indexable by K_LEFT etc.
+
+        Returns the names of the events raised during the frame.
+        """
+        events = self.events
+        events.frame_events = []
+        if self.over:
+            return events.frame_events
+        self.frame += 1
+        prof = self.profiler
+        ship = self.ship
+        ship.handle_input(inputs)
+        if prof is not None:
+            prof.mark('handle_input')
+        ship.update()
+        if prof is not None:
+            prof.mark('Ship.update')
+
+        # collisions (the store does its own vectorized broadphase)
+        if self.store is None:
+            self.grid.rebuild(self.asteroids)
+            if prof is not None:
+                prof.mark('grid rebuild')
+        letters, self.asteroids = bullets_vs_asteroids(ship, self.asteroids, self.grid, self.particles)
+        for L in letters:
+            self.collected += L
+            events.emit('asteroid_hit')
+            if self.progress.collect(L) and self.progress.solved:
+                events.emit('victory')
+                self.win = True
+        if prof is not None:
+            prof.mark('bullets_vs_asteroids')
+
+        # ship hits
+        lives_delta = ship_vs_asteroids(ship, self.asteroids, self.grid)
+        if lives_delta < 0:
+            ship.lives += lives_delta
+            events.emit('ship_hit')
+            if ship.lives <= 0:
+                events.emit('game_over')
+                self.game_over = True
+        if prof is not None:
+            prof.mark('ship_vs_asteroids')
+
+        # update asteroids
+        if self.store is not None:
+            self.store.update()
+        else:
+            for a in self.asteroids:
+                a.update()
+        if self.far is not None:
+            self.far.step(self.asteroids, ship.pos)
+        if prof is not None:
+            prof.mark('asteroid updates')
+        if self.particles is not None:
+            self.particles.update()
+            if prof is not None:
+                prof.mark('particles')
+
+        # respawn a few if needed
+        live = len(self.asteroids) if self.far is None else len(self.asteroids) + len(self.far)
+        if live < self.asteroid_count and not self.over:
+            fresh = spawn_asteroids(self.field_letters, self.asteroid_count - live, self.store, self.rng,
+                                    ship.pos if self.swarm else None)
+            if self.far is None:
+                self.asteroids.extend(fresh)
+            else:
+                # into the bucket just moved, so their first move is k steps away too
+                self.far.buckets[self.far.phase - 1].extend(fresh)
+        self.by_letter.track(self.asteroids)
+        if prof is not None:
+            prof.mark('respawn')
+        return events.frame_events
+
+
+class VersusState(GameState):
+    """Two ships racing to spell the same word in one asteroid field.
+
+    ships[i] collects into progress[i] and collected[i], and the first to
+    finish the word wins (winner is its index). A ship out of lives sits
+    out the rest of the round; the round is over when both are out.
+    step() takes one key state per ship. Always plain objects on a
+    one-screen world: no entity store, no swarm, single shots.
+    """
+    PLAYERS = 2
+    SWARM = False
+
+    def __init__(self, seed=None, target_word=TARGET_WORD, words=None, asteroid_count=None,
+                 lives=STARTING_LIVES, letter_weights=None):
+        super().__init__(seed, target_word, use_store=False, words=words, asteroid_count=asteroid_count,
+                         lives=lives, letter_weights=letter_weights, weapon=None)
+
+    def reset(self):
+        if self.words is not None:
+            self.target_word = self.words.choose(self.rng, 4, 8)
+        self.ships = [Ship((WORLD_W * (i + 1) / (self.PLAYERS + 1), WORLD_H/2), self.lives,
+                           sound_manager=self.events) for i in range(self.PLAYERS)]
+        self.ship = self.ships[0]
+        for ship in self.ships:
+            ship.particles = self.particles
+        if self.particles is not None:
+            self.particles.clear()
+        self.progress = [WordProgress(self.target_word) for _ in self.ships]
+        self.collected = [""] * self.PLAYERS
+        self.asteroids = spawn_asteroids(self.field_letters, self.asteroid_count, None, self.rng)
+        self.by_letter.track(self.asteroids)
+        self.game_over = False
+        self.win = False
+        self.winner = None
+        self.frame = 0
+
+    def step(self, inputs):
+        """Advance one frame; inputs holds one key state per ship.
+
+        Returns the names of the events raised during the frame.
+        """
+        events = self.events
+        events.frame_events = []
+        if self.over:
+            return events.frame_events
+        self.frame += 1
+        playing = [(i, ship) for i, ship in enumerate(self.ships) if ship.lives > 0]
+        for i, ship in playing:
+            ship.handle_input(inputs[i])
+            ship.update()
+
+        self.grid.rebuild(self.asteroids)
+        for i, ship in playing:
+            letters, self.asteroids = bullets_vs_asteroids(ship, self.asteroids, self.grid, self.particles)
+            for L in letters:
+                self.collected[i] += L
+                events.emit('asteroid_hit')
+                if self.progress[i].collect(L) and self.progress[i].solved and not self.win:
+                    events.emit('victory')
+                    self.win = True
+                    self.winner = i
+            if ship_vs_asteroids(ship, self.asteroids, self.grid) < 0:
+                ship.lives -= 1
+                events.emit('ship_hit')
+                if ship.lives <= 0:
+                    for b in ship.bullets:
+                        BULLET_POOL.release(b)
+                    ship.bullets.clear()
+        if all(ship.lives <= 0 for ship in self.ships):
+            events.emit('game_over')
+            self.game_over = True
+
+        for a in self.asteroids:
+            a.update()
+        if self.particles is not None:
+            self.particles.update()
+
+        if len(self.asteroids) < self.asteroid_count and not self.over:
+            self.asteroids.extend(spawn_asteroids(self.field_letters, self.asteroid_count - len(self.asteroids),
+                                                  None, self.rng))
+        self.by_letter.track(self.asteroids)
+        return events.frame_events
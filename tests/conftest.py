@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+
+# headless: no window or sound device is needed (or opened) by any test
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
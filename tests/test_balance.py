@@ -0,0 +1,19 @@
+# tests/test_balance.py
+from balance import COLUMNS, play_one, run_batch
+
+PARAMS = {'word': 'AT', 'lives': 3, 'asteroids': 6, 'size_hp': {3: 4, 2: 3, 1: 2}, 'letter_weights': {'A': 1, 'T': 1}}
+
+def test_autopilot_wins_an_easy_game():
+    seed, won, winnable, steps, letters, wasted, lives_lost, shots = play_one(1, PARAMS, 60 * 300)
+    assert winnable and won
+    assert letters >= 2 and wasted == letters - 2
+    assert 0 <= lives_lost < 3 and shots > 0
+
+def test_batch_is_reproducible():
+    a = run_batch(6, PARAMS, seed=3, workers=2, max_steps=600)
+    b = run_batch(6, PARAMS, seed=3, workers=2, max_steps=600)
+    assert a.dtype == COLUMNS
+    a.sort(order='seed')
+    b.sort(order='seed')
+    assert (a == b).all()
+    assert len(set(a['seed'])) == 6
@@ -0,0 +1,29 @@
+# tests/test_canvas.py
+import pygame
+from assets.asteroids import Asteroid
+from assets.canvas import Canvas
+from assets.sprites import SPRITES
+
+def test_full_scale_draws_straight_to_the_window():
+    pygame.display.init()
+    window = pygame.display.set_mode((800, 600))
+    canvas = Canvas(window, 1.0)
+    assert canvas.surface is window and not canvas.scaled
+
+def test_half_scale_draws_small_and_stretches_over_the_window():
+    pygame.display.init()
+    window = pygame.display.set_mode((800, 600))
+    try:
+        canvas = Canvas(window, 0.5)
+        assert canvas.scaled and canvas.surface.get_size() == (400, 300)
+        assert canvas.px(28) == 14
+        canvas.surface.fill((0, 0, 0))
+        rect = Asteroid((200, 100), size=3, letter='A').draw(canvas.surface)[0]
+        assert rect.center == (100, 50) and rect.width == 42  # radius 40 at half scale, plus the edge
+        window.fill((0, 0, 0))
+        canvas.present()
+        # the outline lands where a full-size one would: 40 left of the centre
+        row = [window.get_at((x, 100))[:3] for x in range(155, 166)]
+        assert any(color != (0, 0, 0) for color in row)
+    finally:
+        SPRITES.set_scale(1.0)
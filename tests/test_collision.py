@@ -0,0 +1,37 @@
+# tests/test_collision.py
+import random
+import pygame
+from assets.asteroids import Asteroid
+from assets.collision import bullets_vs_asteroids, ship_vs_asteroids
+from assets.spatial import SpatialHash
+from assets.ship import Ship
+from assets.config import SCREEN_W, SCREEN_H
+
+def test_grid_finds_same_hits_as_brute_force():
+    random.seed(1)
+    asteroids = [Asteroid((random.randrange(SCREEN_W), random.randrange(SCREEN_H)), random.choice([1, 2, 3]))
+                 for _ in range(200)]
+    grid = SpatialHash()
+    grid.rebuild(asteroids)
+    for _ in range(500):
+        p = (random.uniform(0, SCREEN_W), random.uniform(0, SCREEN_H))
+        brute = {id(a) for a in asteroids if a.collide_with_point(p)}
+        found = {id(a) for a in grid.query(p) if a.collide_with_point(p)}
+        assert brute == found
+
+def test_hit_across_screen_edge():
+    ast = Asteroid((5, 300), size=3, letter='A')
+    ship = Ship((SCREEN_W / 2, SCREEN_H / 2))
+    ship.shoot()
+    ship.bullets[0].pos = pygame.Vector2(SCREEN_W - 10, 300)
+    letters, remaining = bullets_vs_asteroids(ship, [ast])
+    assert ship.bullets == []
+    assert ast.hp == 3 and remaining == [ast]
+
+def test_ship_hit_across_screen_edge():
+    ship = Ship((SCREEN_W / 2, 2))
+    ast = Asteroid((SCREEN_W / 2, SCREEN_H - 5), size=1, letter='B')
+    grid = SpatialHash()
+    grid.rebuild([ast])
+    assert ship_vs_asteroids(ship, [ast], grid) == -1
+    assert ship.is_invincible()
@@ -0,0 +1,27 @@
+# tests/test_dirty.py
+import pygame
+from assets.dirty import DirtyRenderer
+from assets.hud import HudLayer
+from assets.text_cache import load_font
+from game import draw_frame
+from simulation import GameState, make_inputs
+
+def test_dirty_rects_draw_the_same_pixels_as_full_redraws():
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+    font, bigfont = load_font(28), load_font(48)
+    full, dirty = pygame.Surface((800, 600)), pygame.Surface((800, 600))
+    full_state, dirty_state = GameState(7), GameState(7)
+    full_hud, dirty_hud = HudLayer(font, bigfont), HudLayer(font, bigfont)
+    renderer = DirtyRenderer(dirty)
+    inputs = make_inputs(left=True, up=True, fire=True)
+    for frame in range(60):
+        full_state.step(inputs)
+        dirty_state.step(inputs)
+        alpha = frame % 4 / 4
+        draw_frame(full, full_state, full_hud, font, bigfont, alpha=alpha)
+        renderer.erase()
+        renderer.present(draw_frame(dirty, dirty_state, dirty_hud, font, bigfont, clear=False, alpha=alpha))
+        if frame % 10 == 9:
+            assert pygame.image.tobytes(dirty, 'RGB') == pygame.image.tobytes(full, 'RGB'), frame
+    assert full_state.ship.bullets  # bullets in flight, not just drifting asteroids
@@ -0,0 +1,38 @@
+# tests/test_frame_profiler.py
+import json
+from assets.frame_profiler import FrameProfiler
+from simulation import GameState, make_inputs
+
+def _run(profiler, frames=50):
+    state = GameState(seed=3)
+    state.profiler = profiler
+    fire = make_inputs(fire=True)
+    for _ in range(frames):
+        profiler.start_frame()
+        state.step(fire)
+        profiler.end_frame(asteroids=len(state.asteroids), bullets=len(state.ship.bullets))
+    return state
+
+def test_phases_and_percentiles():
+    profiler = FrameProfiler()
+    _run(profiler)
+    names = [row[0] for row in profiler.report()]
+    assert names[:3] == ['handle_input', 'Ship.update', 'grid rebuild']
+    assert 'bullets_vs_asteroids' in names and names[-1] == 'frame'
+    for _, p50, p95, p99 in profiler.report():
+        assert 0 <= p50 <= p95 <= p99
+    assert profiler.counts['asteroids'] > 0
+
+def test_stream_formats(tmp_path):
+    for name in ('frames.jsonl', 'trace.json'):
+        out = tmp_path / name
+        profiler = FrameProfiler(out)
+        _run(profiler, 10)
+        profiler.close()
+        if name.endswith('.jsonl'):
+            lines = [json.loads(line) for line in out.read_text().splitlines()]
+            assert [line['frame'] for line in lines] == list(range(10))
+            assert 'Ship.update' in lines[0]['phases']
+        else:
+            events = json.loads(out.read_text())
+            assert sum(e['name'] == 'frame' for e in events) == 10
@@ -0,0 +1,29 @@
+# tests/test_governor.py
+from assets.governor import QualityGovernor, LEVELS, WINDOW, DOWN_HOLD, UP_HOLD
+from assets.particles import ParticleSystem
+from assets.sprites import SPRITES
+
+def test_steps_down_under_load_and_back_up_with_headroom():
+    particles = ParticleSystem(capacity=100)
+    log = []
+    gov = QualityGovernor(0.016, particles, log.append)
+    try:
+        for _ in range(WINDOW + DOWN_HOLD * len(LEVELS)):
+            gov.frame(0.020)
+        assert gov.level == len(LEVELS) - 1
+        assert not gov.small_glyphs and SPRITES.outline == 1 and particles.stride == 4
+        assert len(log) == len(LEVELS) - 1 and 'down' in log[0]
+
+        for _ in range(UP_HOLD * 3):
+            gov.frame(0.012)  # between the thresholds: stay put
+        assert gov.level == len(LEVELS) - 1
+
+        gov.set_level(len(LEVELS) - 1)  # restart the hold
+        for _ in range(UP_HOLD - 1):
+            gov.frame(0.005)
+        assert gov.level == len(LEVELS) - 1  # not before the hold is up
+        gov.frame(0.005)
+        assert gov.level == len(LEVELS) - 2 and 'up' in log[-1]
+    finally:
+        gov.set_level(0)
+    assert SPRITES.outline == 2 and particles.stride == 1
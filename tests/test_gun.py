@@ -0,0 +1,40 @@
+# tests/test_gun.py
+import pygame
+from assets.asteroids import Asteroid
+from assets.bullet import BULLET_LIFETIME
+from assets.config import WORLD_W, SIM_RATE
+from assets.gun import BulletBuffer, WEAPONS
+from simulation import GameState, make_inputs
+
+def test_fire_age_and_expire():
+    gun = BulletBuffer('spread', capacity=8)
+    gun.fire((100, 100), 0)
+    assert len(gun) == len(WEAPONS['spread'][1])
+    gun.fire((100, 100), 90)
+    assert len(gun) == 8  # the ring overwrote the oldest two
+    for _ in range(BULLET_LIFETIME):
+        gun.update()
+    assert len(gun) == 0 and gun.active == 0
+
+def test_each_asteroid_takes_its_oldest_bullet_once():
+    gun = BulletBuffer('rapid')
+    gun.fire((WORLD_W - 5, 300), 0)  # inside across the world edge
+    gun.update()
+    gun.fire((10, 300), 0)
+    ast = Asteroid((15, 300), size=3, letter='A')
+    assert gun.hits([ast]) == [ast]
+    assert gun.age[gun.live()].tolist() == [0]  # the older bullet was spent
+    assert gun.hits([ast, Asteroid((10, 300), size=1, letter='B')]) == [ast]
+    assert len(gun) == 0
+
+def test_rapid_fire_game_draws_in_one_go():
+    state = GameState(4, weapon='rapid', use_store=False)
+    inputs = make_inputs(left=True, fire=True)
+    while not state.collected:
+        state.step(inputs)
+    assert state.frame < 5 * SIM_RATE and len(state.gun) > 0
+    surf = pygame.Surface((800, 600), 0, 32)
+    rects = state.ship.draw(surf)
+    x, y = state.gun.pos[state.gun.live()[0]]
+    assert surf.get_at((int(x), int(y)))[:3] == (255, 255, 255)
+    assert any(r.collidepoint(int(x), int(y)) for r in rects)
@@ -0,0 +1,25 @@
+# tests/test_hud.py
+import pygame
+from assets.hud import HudLayer
+from assets.text_cache import load_font
+
+def test_rebuilt_only_when_shown_values_change():
+    hud = HudLayer(load_font(28), load_font(48))
+    surf = pygame.Surface((800, 600))
+    built = []
+    def label(text):
+        return lambda: built.append(text) or text
+    for _ in range(10):
+        hud.draw(surf, 5, ('PYGAME', ''), label('Target: PYGAME'))
+    hud.draw(surf, 4, ('PYGAME', ''), label('Target: PYGAME'))
+    hud.draw(surf, 4, ('PYGAME', 'P'), label('Target: PYGAME  Collected: P'))
+    assert built == ['Target: PYGAME', 'Target: PYGAME', 'Target: PYGAME  Collected: P']
+
+def test_end_panel_covers_only_the_popup():
+    hud = HudLayer(load_font(28), load_font(48))
+    surf = pygame.Surface((800, 600))
+    rects = hud.draw(surf, 0, ('PYGAME', ''), lambda: 'Target: PYGAME', False)
+    panel = rects[-1]
+    assert panel.width < 800 and panel.height < 600 and panel.center == (400, 300)
+    assert hud.draw(surf, 0, ('PYGAME', ''), lambda: 'x', False)[-1] == panel
+    assert len(hud.panels) == 1  # built once
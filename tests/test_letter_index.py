@@ -0,0 +1,55 @@
+# tests/test_letter_index.py
+import math
+import random
+import pygame
+from assets.asteroids import Asteroid
+from assets.spatial import LetterIndex
+from autopilot import AimAssist
+from simulation import GameState, make_inputs
+
+def _brute(asteroids, pos, letters, k, radius, w, h):
+    found = []
+    for a in asteroids:
+        if a.letter in letters:
+            d = math.hypot((a.pos.x - pos[0] + w/2) % w - w/2, (a.pos.y - pos[1] + h/2) % h - h/2)
+            if d <= radius:
+                found.append(d)
+    return sorted(found)[:k]
+
+def _same(a, b):
+    return len(a) == len(b) and all(abs(x - y) < 1e-9 for x, y in zip(a, b))
+
+def test_queries_match_a_full_scan_across_the_wrap():
+    rng = random.Random(7)
+    for w, h, n in ((800, 600, 10), (800, 600, 3000), (6400, 4800, 3000)):
+        asteroids = [Asteroid((rng.uniform(0, w), rng.uniform(0, h)), 1, rng.choice('ABCDEF'), rng) for _ in range(n)]
+        index = LetterIndex(w, h)
+        index.track(asteroids)
+        for _ in range(100):
+            pos = (rng.uniform(0, w), rng.uniform(0, h))
+            letters = ''.join(rng.sample('ABCDEFG', 2))
+            k = rng.choice((1, 4))
+            got = [d for d, _ in index.nearest(pos, letters, k)]
+            assert _same(got, _brute(asteroids, pos, letters, k, math.inf, w, h))
+            radius = rng.uniform(5, 400)
+            got = [d for d, _ in index.within(pos, radius, letters)]
+            assert _same(got, _brute(asteroids, pos, letters, n, radius, w, h))
+        # ring offsets are cached per grid shape and radius, not per query position
+        assert len(index.rings) <= sum(max(g[0], g[1]) // 2 + 1 for g in index.grids.values())
+
+def test_nearest_goes_the_short_way_round():
+    index = LetterIndex(800, 600)
+    far, near = Asteroid((400, 300), 1, 'Q'), Asteroid((790, 590), 1, 'Q')
+    index.track([far, near] + [Asteroid((400, 300), 1, 'Z') for _ in range(30)])
+    (d, a), = index.nearest((5, 5), 'Q')
+    assert a is near and abs(d - math.hypot(15, 15)) < 1e-9
+
+def test_aim_assist_turns_toward_a_needed_letter():
+    state = GameState(1, target_word="Q")
+    target = Asteroid(state.ship.pos + pygame.Vector2(100, 0), 1, 'Q')  # due right of the ship
+    state.asteroids = [target]
+    state.by_letter.track(state.asteroids)
+    assist = AimAssist()
+    assert assist.inputs(state, make_inputs(fire=True)) == make_inputs(right=True, fire=True)
+    assert assist.inputs(state, make_inputs(left=True, fire=True)) == make_inputs(left=True, fire=True)
+    assert assist.inputs(state, make_inputs()) == make_inputs()
@@ -0,0 +1,33 @@
+# tests/test_letter_sampler.py
+import random
+from collections import Counter
+from letterfrequency import LetterSampler, letter_weights, build_frequency_list
+
+def test_weights_match_frequency_list():
+    sampler = LetterSampler()
+    assert sampler.total == len(build_frequency_list())
+    assert Counter(build_frequency_list()) == Counter(letter_weights())
+
+def test_draws_follow_weights():
+    sampler = LetterSampler()
+    rng = random.Random(0)
+    counts = Counter(sampler.draws(150000, rng))
+    for letter, w in letter_weights().items():
+        expected = 150000 * w / sampler.total
+        assert abs(counts[letter] - expected) < 5 * expected ** 0.5 + 5
+
+def test_exclude_and_include():
+    sampler = LetterSampler()
+    rng = random.Random(1)
+    for letter in 'AEIOU':
+        sampler.exclude(letter)
+    assert not set(sampler.draws(5000, rng)) & set('AEIOU')
+    sampler.include('E')
+    assert 'E' in sampler.draws(5000, rng)
+    sampler.reset()
+    assert sampler.total == sum(letter_weights().values())
+
+def test_single_letter_left():
+    sampler = LetterSampler({'Q': 1, 'Z': 3})
+    sampler.exclude('Z')
+    assert sampler.draws(20, random.Random(2)) == ['Q'] * 20
@@ -0,0 +1,62 @@
+# tests/test_net.py
+import random
+from assets.config import wrap_delta
+from assets.net import Link, Host, Client, ASTEROID, encode_snapshot, decode_snapshot, extrapolate, DRIFT
+from simulation import VersusState, make_inputs
+
+def test_delta_snapshots_round_trip():
+    state = VersusState(1, asteroid_count=200)
+    full, table = encode_snapshot(state, 1, 0)
+    snap = decode_snapshot(full, {})
+    assert snap['table'] == table[0] and snap['text'] == table[1]
+    assert len(full) > 200 * ASTEROID.size
+
+    held = {1: (snap['table'], snap['text'])}
+    for _ in range(10):
+        state.step((make_inputs(fire=True), make_inputs(left=True)))
+    delta, table = encode_snapshot(state, 11, 0, 1, held[1])
+    snap = decode_snapshot(delta, held)
+    assert snap['table'] == table[0]
+    assert len(delta) < len(full) // 10  # only what was hit, split or new
+    for a in state.asteroids:
+        dx, dy = wrap_delta(extrapolate(snap['table'][a.uid], 11), a.pos)
+        assert dx*dx + dy*dy <= DRIFT * DRIFT
+    assert decode_snapshot(delta, {}) is None  # baseline not held
+
+def test_client_tracks_host_over_a_bad_link():
+    now = [0.0]
+    clock = lambda: now[0]
+    host_link = Link(host='127.0.0.1', loss=0.2, latency=0.06, jitter=0.02, seed=1, clock=clock)
+    client_link = Link(host='127.0.0.1', loss=0.2, latency=0.06, jitter=0.02, seed=2, clock=clock)
+    host = Host(VersusState(3, asteroid_count=40, lives=99), host_link)
+    client = Client(client_link, ('127.0.0.1', host_link.port))
+    pad = random.Random(4)
+    mask = 0
+    try:
+        for step in range(1500):
+            now[0] += 1 / 60
+            if step == 900:  # the network heals; then nobody touches the keys
+                for link in (host_link, client_link):
+                    link.loss = link.latency = link.jitter = 0
+            if step < 900 and pad.random() < 0.05:
+                mask = pad.randrange(16)
+            elif step >= 900:
+                mask = 0
+            assert client.poll() and host.poll()
+            if host.connected:
+                host.step(make_inputs(fire=True, left=True))
+            client.step(mask)
+    finally:
+        host_link.close()
+        client_link.close()
+
+    assert client.connected and host_link.dropped and client_link.dropped
+    dx, dy = wrap_delta(host.state.ships[1].pos, client.ship.pos)
+    assert abs(dx) < 0.2 and abs(dy) < 0.2  # prediction lines up once the inputs stop
+    table, _ = client.baselines[client.tick]
+    by_uid = {a.uid: a for a in host.state.asteroids}
+    assert set(table) == set(by_uid)
+    for uid, entry in table.items():
+        dx, dy = wrap_delta(extrapolate(entry, host.tick), by_uid[uid].pos)
+        assert dx*dx + dy*dy <= DRIFT * DRIFT + 0.01
+    assert host.snapshot_bytes / host.snapshots < 40 * ASTEROID.size
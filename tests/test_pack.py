@@ -0,0 +1,30 @@
+# tests/test_pack.py
+import wave
+from array import array
+from assets.pack import AssetPack, write_pack, ALIGN
+
+def _wav(path, samples, rate=44100):
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(array('h', samples).tobytes())
+
+def test_pack_round_trip(tmp_path):
+    _wav(tmp_path / 'beep.wav', [0, 100, -100, 32767])
+    (tmp_path / 'font.ttf').write_bytes(b'not really a font')
+    out = tmp_path / 'test.pack'
+    write_pack(out, sfx=[('beep', tmp_path / 'beep.wav')], music=[('song', tmp_path / 'beep.wav')],
+               blobs=[('fonts/font.ttf', tmp_path / 'font.ttf')])
+
+    pack = AssetPack(out)
+    pcm = pack.sound_buffer('beep', (44100, -16, 2))
+    assert array('h', bytes(pcm)).tolist() == [0, 0, 100, 100, -100, -100, 32767, 32767]
+    assert pack.sound_buffer('beep', (22050, -16, 2)) is None
+    assert all(e['offset'] % ALIGN == 0 for e in pack.entries.values())
+    assert pack.open('blob', 'fonts/font.ttf').read() == b'not really a font'
+    song = pack.open('music', 'song')
+    song.seek(-4, 2)
+    assert song.read() == array('h', [-100, 32767]).tobytes()
+    del pcm, song
+    pack.close()
@@ -0,0 +1,44 @@
+# tests/test_particles.py
+import numpy as np
+import pygame
+from assets.particles import ParticleSystem, EXPLOSION_LIFE, EXPLOSION_PARTICLES, screen_pixels
+from simulation import GameState, make_inputs
+
+def test_budget_and_lifetime():
+    ps = ParticleSystem(capacity=1000, seed=1)
+    for _ in range(20):
+        ps.explode((100, 100), (0, 0), 3)
+    assert len(ps) == 1000  # never more than the budget
+    for _ in range(EXPLOSION_LIFE[1] + 1):
+        ps.update()
+    assert len(ps) == 0 and ps.active == 0
+
+def test_draw_wraps_and_reports_rect():
+    surf = pygame.Surface((200, 100), 0, 32)
+    ps = ParticleSystem(seed=2)
+    ps.emit(199.5, 50, np.zeros(1), np.zeros(1), np.full(1, 10.0), ps.explosion_colors[:1])
+    rects = ps.draw(surf)
+    color = tuple(ps.explosion_colors[0])
+    assert surf.get_at((199, 50))[:3] == color
+    assert surf.get_at((0, 51))[:3] == color  # the dot's right half spills over the edge
+    assert rects[0].collidepoint(199, 50) and rects[0].collidepoint(0, 51)
+
+def test_thinning_emits_fewer_and_draws_them_all():
+    surf = pygame.Surface((800, 600), 0, 32)
+    ps = ParticleSystem(seed=4)
+    ps.stride = 2
+    ps.explode((400, 300), (0, 0), 2)
+    assert len(ps) == EXPLOSION_PARTICLES  # half of 2 * EXPLOSION_PARTICLES
+    ps.draw(surf)
+    xs, ys = screen_pixels(ps.pos[ps.life > 0], surf.get_size())[:2]
+    assert all(surf.get_at((int(x), int(y)))[:3] != (0, 0, 0) for x, y in zip(xs, ys))
+
+def test_thrust_and_kills_emit_without_changing_the_game():
+    plain = GameState(5)
+    fx = GameState(5)
+    fx.particles = fx.ship.particles = ParticleSystem(seed=3)
+    inputs = make_inputs(up=True, fire=True)
+    for _ in range(600):
+        assert plain.step(inputs) == fx.step(inputs)
+    assert fx.particles.head > 0
+    assert [a.pos for a in plain.asteroids] == [a.pos for a in fx.asteroids]
@@ -0,0 +1,43 @@
+# tests/test_recording.py
+import random
+from assets.recording import InputRecorder, Recording, RESTART_BIT, key_mask, mask_inputs
+from simulation import GameState, make_inputs
+
+def test_round_trip(tmp_path):
+    pad = random.Random(5)
+    recorder = InputRecorder(seed=-42)
+    masks = []
+    for _ in range(5000):
+        # held keys: change state now and then, as players do
+        if not masks or pad.random() < 0.05:
+            mask = pad.randrange(16) | (RESTART_BIT if pad.random() < 0.01 else 0)
+        masks.append(mask)
+        recorder.record(mask)
+    recorder.record(3)
+    masks.append(3)
+    for _ in range(300):  # a run longer than one varint byte
+        recorder.record(0)
+        masks.append(0)
+    path = tmp_path / 'session.rec'
+    recorder.save(path)
+
+    recording = Recording.load(path)
+    assert recording.seed == -42
+    assert recording.frames == len(masks)
+    assert list(recording.masks()) == masks
+    assert path.stat().st_size < len(masks) // 4
+
+def test_replay_matches_live_play():
+    pad = random.Random(9)
+    live = GameState(seed=7)
+    recorder = InputRecorder(seed=7)
+    live_events = []
+    for _ in range(1500):
+        inputs = make_inputs(left=pad.random() < 0.3, up=pad.random() < 0.2, fire=pad.random() < 0.5)
+        recorder.record(key_mask(inputs))
+        live_events.append(live.step(inputs))
+
+    replayed = GameState(seed=recorder.seed)
+    replay_events = [replayed.step(mask_inputs(mask)) for mask, count in recorder.runs for _ in range(count)]
+    assert replay_events == live_events
+    assert replayed.ship.pos == live.ship.pos
@@ -0,0 +1,49 @@
+# tests/test_simulation.py
+import random
+from assets.config import render_position, wrap_delta
+from simulation import GameState, make_inputs
+
+def _play(seed, frames=3000, use_store=False):
+    state = GameState(seed, use_store=use_store)
+    pad = random.Random(seed + 1)
+    events = []
+    for _ in range(frames):
+        inputs = make_inputs(left=pad.random() < 0.3, up=pad.random() < 0.2, fire=pad.random() < 0.5)
+        events.extend(state.step(inputs))
+        if state.over:
+            state.reset()
+    snapshot = [(a.pos.x, a.pos.y, a.vel.x, a.vel.y, a.hp, a.letter) for a in state.asteroids]
+    return events, snapshot, state.collected, state.ship.pos.xy
+
+def test_same_seed_same_game():
+    assert _play(7) == _play(7)
+
+def test_different_seed_different_game():
+    assert _play(7)[1] != _play(8)[1]
+
+def test_store_is_deterministic_too():
+    assert _play(11, 1000, use_store=True) == _play(11, 1000, use_store=True)
+
+def test_events_reach_subscribers():
+    state = GameState(1)
+    heard = []
+    state.subscribe(heard.append)
+    state.step(make_inputs(fire=True))
+    assert heard == ['shoot']
+
+def test_interpolated_positions_follow_the_last_step():
+    state = GameState(2)
+    before = [(a.pos.x, a.pos.y) for a in state.asteroids]
+    state.step(make_inputs())
+    for a, (x, y) in zip(state.asteroids, before):
+        # alpha 0 is where it was a step ago, even when it has just wrapped
+        dx, dy = wrap_delta(render_position(a.pos, a.prev, 0.0), (x, y))
+        assert abs(dx) < 1e-6 and abs(dy) < 1e-6
+        assert render_position(a.pos, a.prev, 1.0) == (a.pos.x, a.pos.y)
+
+def test_new_asteroids_are_drawn_where_they_appear():
+    state = GameState(2)
+    state.asteroids.clear()  # the step respawns the whole field after moving
+    state.step(make_inputs())
+    for a in state.asteroids:
+        assert render_position(a.pos, a.prev, 0.0) == (a.pos.x, a.pos.y)
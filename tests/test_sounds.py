@@ -0,0 +1,46 @@
+# tests/test_sounds.py
+import threading
+from pathlib import Path
+from assets.pack import write_pack
+from assets.sounds import sound_manager
+from assets.sounds.sound_manager import SoundManager, SOUND_FILES, MUSIC_FILES
+
+SOUNDS_DIR = Path(sound_manager.__file__).parent
+
+def test_loads_are_installed_on_the_main_thread_and_music_waits(monkeypatch):
+    gate = threading.Event()
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(Path, 'read_bytes', lambda path: gate.wait() and read_bytes(path))
+    manager = SoundManager(enabled=True)
+    try:
+        silence = manager.sounds['shoot']
+        for future in manager.loading:
+            if future not in manager.music_data.values():
+                future.result()
+        assert manager.sounds['shoot'] is silence  # decoded, but only flush() swaps it in
+
+        manager.play_music('background')  # returns with the file still unread
+        assert manager.music_request == ('background', -1) and manager.current_music is None
+        manager.flush()
+        assert manager.current_music is None
+
+        gate.set()
+        manager.wait_until_loaded()
+        assert all(manager.sounds[name] is not silence for name in SOUND_FILES)
+        manager.flush()
+        assert manager.current_music == 'background' and manager.music_request is None
+    finally:
+        gate.set()
+        manager.cleanup()
+
+def test_cleanup_closes_the_asset_pack(tmp_path, monkeypatch):
+    path = tmp_path / 'assets.pack'
+    write_pack(path, [(name, SOUNDS_DIR / 'sfx' / f) for name, f in SOUND_FILES.items()],
+               [(name, SOUNDS_DIR / 'music' / f) for name, f in MUSIC_FILES.items()], [])
+    monkeypatch.setattr(sound_manager, 'PACK_PATH', path)
+    manager = SoundManager(enabled=True)
+    pack = manager.pack
+    assert pack is not None
+    manager.play_music('background')
+    manager.cleanup()
+    assert manager.pack is None and pack._map.closed and pack._file.closed
@@ -0,0 +1,10 @@
+# tests/test_sprites.py
+from assets.sprites import SpriteCache
+
+def test_fractional_turn_step_gives_every_heading_its_own_sprite():
+    cache = SpriteCache(turn_step=240 / 144)  # SHIP_TURN_SPEED at SIM_RATE 144
+    for i in range(217):
+        cache.ship(i * cache.turn_step)
+    assert cache.headings == 216 and len(cache._ship) == 216
+    assert all(type(step) is int for step, _ in cache._ship)
+    assert cache.ship(215 * cache.turn_step) is not cache.ship(0)
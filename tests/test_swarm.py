@@ -0,0 +1,80 @@
+# tests/test_swarm.py
+import random
+import subprocess
+import sys
+from pathlib import Path
+import pygame
+import pytest
+from assets.asteroids import Asteroid
+from assets.config import wrap_delta
+from assets.swarm import FarField, Camera
+from simulation import spawn_asteroids
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# What SWARM_MODE = True in assets/config.py does, applied before anything
+# else imports the world size.
+SWARM_GAME = """
+import assets.config as config
+config.SWARM_MODE = True
+config.WORLD_SCALE = 8
+config.WORLD_W, config.WORLD_H = config.SCREEN_W * 8, config.SCREEN_H * 8
+from simulation import GameState, make_inputs
+from assets.swarm import ACTIVE_RADIUS
+state = GameState(seed=1, asteroid_count=5)
+assert state.swarm and not state.asteroids and len(state.far) == 5
+for a in state.far:
+    dx, dy = config.wrap_delta(state.ship.pos, a.pos)
+    assert dx * dx + dy * dy > ACTIVE_RADIUS ** 2
+for _ in range(60):
+    state.step(make_inputs(up=True))
+print(len(state.asteroids) + len(state.far))
+"""
+
+def _field(n, seed):
+    rng = random.Random(seed)
+    return [Asteroid(pygame.Vector2(rng.uniform(0, 800), rng.uniform(0, 600)), rng.choice((1, 2, 3)), 'A', rng)
+            for _ in range(n)]
+
+def test_far_updates_follow_the_plain_path():
+    plain, far = _field(40, 1), _field(40, 1)
+    field = FarField(radius=0, every=4)  # nothing ever comes close enough to be active
+    for i, a in enumerate(far):
+        field.buckets[i % 4].append(a)
+    active = []
+    for _ in range(4 * 25):
+        for a in plain:
+            a.update()
+        field.step(active, (400, 300))
+    assert not active and len(field) == 40
+    for a, b in zip(plain, far):
+        dx, dy = wrap_delta(a.pos, b.pos)
+        assert abs(dx) < 1e-6 and abs(dy) < 1e-6
+
+def test_asteroids_trade_between_far_and_active():
+    near, away = _field(2, 2)
+    near.pos.xy = (410, 300)
+    away.pos.xy = (10, 10)
+    near.vel.xy = away.vel.xy = (0, 0)
+    field = FarField(radius=100, every=2)
+    field.buckets[0].append(near)
+    active = [away]
+    field.step(active, (400, 300))
+    assert active == [near] and field.buckets[0] == [away]
+
+def test_camera_sees_across_the_wrap():
+    cam = Camera(200, 100)
+    cam.follow((5, 5))  # the view straddles the world's top-left corner
+    x, y = cam.to_screen((795, 595))
+    assert (round(x), round(y)) == (90, 40)
+    assert cam.to_screen((400, 300)) is None
+    assert cam.to_screen((110, 5), margin=10) is not None
+
+def test_swarm_game_builds_and_runs():
+    out = subprocess.run([sys.executable, '-c', SWARM_GAME], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.split()[-1] == '5'
+
+def test_no_room_out_of_reach_is_an_error():
+    with pytest.raises(ValueError):
+        spawn_asteroids(['A'], 1, rng=random.Random(1), avoid=(400, 300))  # the one-screen world
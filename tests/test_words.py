@@ -0,0 +1,41 @@
+# tests/test_words.py
+import os
+import random
+from words import WordIndex, WordProgress, word_difficulty
+
+def test_index_round_trip_and_cache(tmp_path):
+    src = tmp_path / 'list.txt'
+    src.write_text("zebra\nApple\nquiz\nnot-a-word\napple\nstone\n")
+    index = WordIndex.load(src)
+    assert (tmp_path / 'list.txt.idx').exists()
+    assert sorted(index.word(i) for i in range(len(index))) == ['APPLE', 'QUIZ', 'STONE', 'ZEBRA']
+    cached = WordIndex.load(src)
+    assert cached.blob == index.blob and cached.by_length.keys() == index.by_length.keys()
+
+def test_edited_list_rebuilds_the_cache(tmp_path):
+    src = tmp_path / 'list.txt'
+    src.write_text("zebra\nquiz\n")
+    WordIndex.load(src)
+    src.write_text("stone\nquiz\n")  # same size; only the mtime tells them apart
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    index = WordIndex.load(src)
+    assert sorted(index.word(i) for i in range(len(index))) == ['QUIZ', 'STONE']
+
+def test_choose_respects_length_and_difficulty():
+    index = WordIndex.build(['TREE', 'QUIZ', 'STONE', 'ASTEROID', 'JAZZ', 'RATE'])
+    rng = random.Random(4)
+    assert {index.choose(rng, 8, 8) for _ in range(20)} == {'ASTEROID'}
+    easy = {index.choose(rng, 4, 4, (0.0, 0.1)) for _ in range(50)}
+    assert easy == {'TREE', 'RATE'}
+    assert word_difficulty('JAZZ') > word_difficulty('QUIZ') > word_difficulty('TREE')
+
+def test_progress_tracks_needed_letters():
+    p = WordProgress('PYGAME')
+    assert p.missing() == 'AEGMPY'
+    for ch in 'QPYGAM':
+        p.collect(ch)
+    assert not p.solved and p.missing() == 'E'
+    assert p.collect('E') and p.solved
+    assert not p.collect('E')
+    assert p.collected() == 'AEEGMPQY'
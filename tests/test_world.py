@@ -0,0 +1,69 @@
+# tests/test_world.py
+import random
+import pygame
+from assets.world import EntityStore
+from assets.asteroids import Asteroid
+from assets.ship import Ship
+from assets.collision import bullets_vs_asteroids, ship_vs_asteroids
+from assets.bullet import BULLET_LIFETIME
+from assets.config import SCREEN_W, SCREEN_H
+
+def test_update_moves_and_wraps():
+    store = EntityStore(capacity=2)
+    ast = store.add_asteroid((SCREEN_W - 1, 10), size=2, letter='Q')
+    ast.vel = pygame.Vector2(3, -20)
+    store.update()
+    assert ast.pos == pygame.Vector2(2, SCREEN_H - 10)
+    assert ast.letter == 'Q' and ast.hp == 3
+
+def test_bullets_expire_and_slots_are_reused():
+    store = EntityStore(capacity=1)
+    ship = Ship((100, 100), store=store)
+    ship.shoot()
+    first = ship.bullets[0]
+    for _ in range(BULLET_LIFETIME):
+        store.update()
+    assert not first.alive() and len(store) == 0
+    ship.shoot()
+    assert ship.bullets[-1].slot == first.slot
+    assert not first.alive() and ship.bullets[-1].alive()
+
+def _shooting_gallery(store):
+    """300 one-hit asteroids and 200 shots from all over, the same on every call."""
+    rng = random.Random(3)
+    ship = Ship((SCREEN_W / 2, SCREEN_H / 2), store=store)
+    asteroids = []
+    for i in range(300):
+        pos = (rng.randrange(SCREEN_W), rng.randrange(SCREEN_H))
+        ast = store.add_asteroid(pos, 1, chr(65 + i % 26)) if store is not None else Asteroid(pos, 1, chr(65 + i % 26))
+        ast.hp = 1
+        asteroids.append(ast)
+    for _ in range(200):
+        ship.angle = rng.uniform(0, 360)
+        ship.pos = pygame.Vector2(rng.randrange(SCREEN_W), rng.randrange(SCREEN_H))
+        ship.shoot()
+    return ship, asteroids
+
+def test_vectorized_hits_match_object_path():
+    ship, asteroids = _shooting_gallery(None)
+    expected, _ = bullets_vs_asteroids(ship, asteroids)
+    expected_left = [tuple(a.pos) for a in asteroids]
+    expected_bullets = [tuple(b.pos) for b in ship.bullets]
+
+    store = EntityStore()
+    ship, asteroids = _shooting_gallery(store)
+    before = len(asteroids)
+    letters, remaining = bullets_vs_asteroids(ship, asteroids)
+    assert letters == expected and len(letters) > 10
+    assert remaining is asteroids  # compacted in place
+    assert [tuple(a.pos) for a in remaining] == expected_left
+    assert [tuple(b.pos) for b in ship.bullets] == expected_bullets
+    assert len(remaining) == before - len(letters) == len(store) - len(ship.bullets)
+    for b in ship.bullets:
+        assert b.alive()
+
+def test_ship_hit_uses_store():
+    store = EntityStore()
+    ship = Ship((5, 5), store=store)
+    ast = store.add_asteroid((SCREEN_W - 5, SCREEN_H - 5), 1, 'Z')
+    assert ship_vs_asteroids(ship, [ast]) == -1
@@ -0,0 +1,147 @@
+import os
+import pickle
+import random
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from letterfrequency import letter_weights
+
+DEFAULT_WORDS = Path(__file__).parent / 'assets' / 'words.txt'
+CACHE_VERSION = 2
+
+_WEIGHTS = letter_weights()
+_MAX_SCORE = max(_WEIGHTS.values())
+
+def letter_mask(word):
+    """26-bit mask with bit n set when the word contains chr(65 + n)."""
+    mask = 0
+    for ch in word:
+        mask |= 1 << (ord(ch) - 65)
+    return mask
+
+def word_difficulty(word):
+    """0.0 for words made only of the commonest letters, up to 1.0 for all Q/Z."""
+    return sum(_MAX_SCORE - _WEIGHTS[ch] for ch in word) / ((_MAX_SCORE - 1) * len(word))
+
+
+class WordIndex:
+    """A large word list packed into a few flat arrays.
+
+    All words share one ASCII blob with an offset table. Each length keeps
+    its word ids sorted by difficulty, so choosing a target by length and
+    difficulty band is a couple of bisects. The index is pickled next to
+    the list and reused while the list is unchanged.
+    """
+    def __init__(self, blob, offsets, masks, by_length):
+        self.blob = blob
+        self.offsets = offsets
+        self.masks = masks
+        self.by_length = by_length  # length -> (word ids, difficulties), both sorted by difficulty
+
+    @classmethod
+    def build(cls, words):
+        """Index an iterable of words; anything that is not plain A-Z is skipped."""
+        clean = sorted({w.strip().upper() for w in words if w.strip().isalpha() and w.strip().isascii()})
+        offsets = array('I', [0])
+        masks = array('I')
+        groups = {}
+        for i, word in enumerate(clean):
+            offsets.append(offsets[-1] + len(word))
+            masks.append(letter_mask(word))
+            groups.setdefault(len(word), []).append((word_difficulty(word), i))
+        by_length = {}
+        for length, entries in groups.items():
+            entries.sort()
+            by_length[length] = (array('I', [i for _, i in entries]), array('f', [d for d, _ in entries]))
+        return cls(''.join(clean).encode('ascii'), offsets, masks, by_length)
+
+    @classmethod
+    def load(cls, path=DEFAULT_WORDS, cache_path=None):
+        """Load a one-word-per-line file, using or refreshing its .idx cache."""
+        path = Path(path)
+        cache_path = Path(cache_path) if cache_path else path.with_name(path.name + '.idx')
+        stat = path.stat()
+        # any edit to the list changes its size or mtime and so rebuilds the index
+        stamp = (CACHE_VERSION, str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_stamp, fields = pickle.load(f)
+            if cached_stamp == stamp:
+                return cls(*fields)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            pass
+        with open(path, encoding='utf-8') as f:
+            index = cls.build(f)
+        try:
+            tmp = cache_path.with_name(cache_path.name + '.tmp')
+            with open(tmp, 'wb') as f:
+                pickle.dump((stamp, (index.blob, index.offsets, index.masks, index.by_length)), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass  # read-only install; just rebuild next time
+        return index
+
+    def __len__(self):
+        return len(self.masks)
+
+    def word(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].decode('ascii')
+
+    def choose(self, rng=random, min_len=3, max_len=None, difficulty=(0.0, 1.0)):
+        """Random word with min_len <= length <= max_len and difficulty in range."""
+        lo, hi = difficulty
+        ranges = []
+        total = 0
+        for length, (ids, diffs) in self.by_length.items():
+            if length < min_len or (max_len is not None and length > max_len):
+                continue
+            start = bisect_left(diffs, lo)
+            stop = bisect_right(diffs, hi)
+            if stop > start:
+                ranges.append((ids, start, stop))
+                total += stop - start
+        if not total:
+            raise ValueError("no word matches those limits")
+        pick = rng.randrange(total)
+        for ids, start, stop in ranges:
+            if pick < stop - start:
+                return self.word(ids[start + pick])
+            pick -= stop - start
+
+
+class WordProgress:
+    """Which letters of the target are still needed, as a bitmask.
+
+    collect() and solved are O(1) per letter; counts also give the
+    collected letters in alphabetical order without sorting.
+    """
+    __slots__ = ('word', 'needed', 'counts')
+
+    def __init__(self, word):
+        self.word = word
+        self.needed = letter_mask(word)
+        self.counts = [0] * 26
+
+    def collect(self, letter):
+        """Record a collected letter; returns True if the word still needed it."""
+        n = ord(letter) - 65
+        self.counts[n] += 1
+        bit = 1 << n
+        if self.needed & bit:
+            self.needed &= ~bit
+            return True
+        return False
+
+    @property
+    def solved(self):
+        return not self.needed
+
+    def missing(self):
+        """Letters still needed, A to Z."""
+        return ''.join(chr(65 + n) for n in range(26) if self.needed >> n & 1)
+
+    def collected(self):
+        """Every collected letter, A to Z."""
+        return ''.join(chr(65 + n) * c for n, c in enumerate(self.counts) if c)